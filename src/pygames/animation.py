@@ -0,0 +1,269 @@
+import abc
+import os
+import struct
+import typing as t
+
+from pygames import snake
+from pygames.game_of_life import game_of_life as gof
+from pygames.game_of_life.stats import BoundingBox
+
+# a frame is a row of palette indices for every row of cells
+Frame = list[bytes]
+Color = tuple[int, int, int]
+
+LIFE_PALETTE: tuple[Color, ...] = ((0, 0, 0), (255, 255, 255))
+SNAKE_PALETTE: tuple[Color, ...] = ((0, 0, 0), (0, 160, 0), (0, 255, 0), (255, 0, 0))
+SNAKE_BODY, SNAKE_HEAD, SNAKE_FRUIT = 1, 2, 3
+DEFAULT_DELAY = 10  # hundredths of a second
+MAX_DELAY = 0xFFFF
+MAX_CODES = 1 << 12
+SUB_BLOCK_SIZE = 255
+
+File = str | os.PathLike | t.BinaryIO
+
+
+def life_frame(game: gof.GameOfLife, area: BoundingBox | None = None) -> Frame:
+    """Cells of the board, or of `area` on it; the unbounded plane shows the board-sized window at its origin."""
+    if area is None:
+        top, left = getattr(game, 'origin', (0, 0))
+        area = BoundingBox(top, left, top + game.height - 1, left + game.width - 1)
+    rows = game.region(area.top, area.left, area.bottom - area.top + 1, area.right - area.left + 1)
+    return [bytes(row) for row in rows]
+
+
+def snake_frame(game: snake.Snake) -> Frame:
+    rows = [bytearray(game.width) for _ in range(game.height)]
+    for col, row in game.body:
+        rows[row][col] = SNAKE_BODY
+    head_col, head_row = game.body[0]
+    rows[head_row][head_col] = SNAKE_HEAD
+    fruit_col, fruit_row = game.fruit
+    if 0 <= fruit_row < game.height and 0 <= fruit_col < game.width:
+        rows[fruit_row][fruit_col] = SNAKE_FRUIT
+    return [bytes(row) for row in rows]
+
+
+def life_frames(game: gof.GameOfLife, generations: int, area: BoundingBox | None = None) -> t.Iterator[Frame]:
+    """The current board, then the board after each of `generations` updates."""
+    yield life_frame(game, area)
+    for _ in range(generations):
+        game.update()
+        yield life_frame(game, area)
+
+
+def snake_frames(game: snake.Snake, steps: int,
+                 steer: t.Callable[[snake.Snake], snake.Direction] | None = None) -> t.Iterator[Frame]:
+    """The current board, then the board after each step until `steps` or the game is over.
+
+    `steer` picks the direction before every step, by default the snake goes straight on.
+    """
+    yield snake_frame(game)
+    for _ in range(steps):
+        if steer is not None:
+            game.direction = steer(game)
+        try:
+            game.update()
+        except snake.GameOverException:
+            return
+        yield snake_frame(game)
+
+
+def changed_area(previous: Frame, current: Frame) -> BoundingBox | None:
+    rows = [row for row, (old, new) in enumerate(zip(previous, current)) if old != new]
+    if not rows:
+        return None
+    left, right = len(current[0]), -1
+    for row in rows:
+        old, new = previous[row], current[row]
+        first = next(col for col, (a, b) in enumerate(zip(old, new)) if a != b)
+        last = len(new) - 1 - next(col for col, (a, b) in enumerate(zip(reversed(old), reversed(new))) if a != b)
+        left, right = min(left, first), max(right, last)
+    return BoundingBox(rows[0], left, rows[-1], right)
+
+
+def scaled(rows: t.Iterable[bytes], scale: int) -> t.Iterator[bytes]:
+    """Every cell as a `scale` x `scale` square of pixels."""
+    if scale == 1:
+        yield from rows
+        return
+    expand = [bytes([value]) * scale for value in range(256)]
+    for row in rows:
+        pixels = b''.join(map(expand.__getitem__, row))
+        for _ in range(scale):
+            yield pixels
+
+
+def lzw_encode(pixels: bytes, min_code_size: int) -> bytes:
+    """GIF flavour of LZW: variable-width codes up to 12 bits packed from the lowest bit, with clear codes."""
+    clear, end = 1 << min_code_size, (1 << min_code_size) + 1
+    output = bytearray()
+    buffer = bits = 0
+
+    def emit(code: int, size: int):
+        nonlocal buffer, bits
+        buffer |= code << bits
+        bits += size
+        while bits >= 8:
+            output.append(buffer & 0xFF)
+            buffer >>= 8
+            bits -= 8
+
+    size = min_code_size + 1
+    emit(clear, size)
+    # strings are keyed by the code of their prefix and their last pixel
+    table: dict[int, int] = {}
+    next_code = end + 1
+    prefix = pixels[0]
+    for pixel in pixels[1:]:
+        key = prefix << 8 | pixel
+        if (code := table.get(key)) is not None:
+            prefix = code
+            continue
+        emit(prefix, size)
+        if next_code < MAX_CODES:
+            table[key] = next_code
+            next_code += 1
+            # the decoder adds each string one code later, so it widens its codes one code later too
+            if next_code > 1 << size and size < 12:
+                size += 1
+        else:
+            emit(clear, size)
+            table.clear()
+            next_code, size = end + 1, min_code_size + 1
+        prefix = pixel
+    emit(prefix, size)
+    emit(end, size)
+    if bits:
+        output.append(buffer)
+    return bytes(output)
+
+
+class _Writer(abc.ABC):
+    def __init__(self, file: File, width: int, height: int, scale: int = 1):
+        if isinstance(file, (str, os.PathLike)):
+            self._file: t.BinaryIO = open(file, 'wb')  # pylint: disable = consider-using-with
+            self._owned = True
+        else:
+            self._file = file
+            self._owned = False
+        self.width = width
+        self.height = height
+        self.scale = scale
+        self.frames = 0
+
+    @abc.abstractmethod
+    def add(self, frame: Frame):
+        """Append `frame` to the animation."""
+
+    def close(self):
+        if self._owned:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+class GifWriter(_Writer):
+    """Animated GIF written frame by frame, so memory does not grow with the length of the run.
+
+    Only the rectangle that changed since the previous frame is encoded, drawn over the previous frame;
+    a frame without changes just makes the one before it last longer.
+    """
+
+    def __init__(self, file: File, width: int, height: int, scale: int = 1,
+                 palette: t.Sequence[Color] = LIFE_PALETTE, delay: int = DEFAULT_DELAY, loop: int = 0):
+        # pylint: disable = too-many-arguments, too-many-positional-arguments
+        super().__init__(file, width, height, scale)
+        self.delay = delay
+        self._table_bits = max(1, (len(palette) - 1).bit_length())
+        self._previous: Frame | None = None
+        # the last image waits for its delay, which grows with every unchanged frame after it
+        self._pending: bytes | None = None
+        self._pending_delay = 0
+        colors = b''.join(bytes(color) for color in palette).ljust(3 << self._table_bits, b'\0')
+        self._file.write(b'GIF89a' + struct.pack(
+            '<HHBBB', width * scale, height * scale, 0xF0 | (self._table_bits - 1), 0, 0
+        ) + colors)
+        self._file.write(b'!\xff\x0bNETSCAPE2.0' + struct.pack('<BBHB', 3, 1, loop, 0))
+
+    def add(self, frame: Frame):
+        self.frames += 1
+        if self._previous is None:
+            area: BoundingBox | None = BoundingBox(0, 0, self.height - 1, self.width - 1)
+        else:
+            area = changed_area(self._previous, frame)
+        self._previous = frame
+        if area is None:
+            if self._pending_delay > MAX_DELAY - self.delay:
+                # the delay field is full, the time goes on with an image of a single unchanged cell
+                self._flush()
+                self._pending = self._image(frame, BoundingBox(0, 0, 0, 0))
+                self._pending_delay = 0
+            self._pending_delay += self.delay
+            return
+        self._flush()
+        self._pending = self._image(frame, area)
+        self._pending_delay = self.delay
+
+    def _image(self, frame: Frame, area: BoundingBox) -> bytes:
+        rows = (row[area.left:area.right + 1] for row in frame[area.top:area.bottom + 1])
+        pixels = b''.join(scaled(rows, self.scale))
+        min_code_size = max(2, self._table_bits)
+        data = lzw_encode(pixels, min_code_size)
+        blocks = b''.join(
+            bytes([len(block)]) + block
+            for block in (data[start:start + SUB_BLOCK_SIZE] for start in range(0, len(data), SUB_BLOCK_SIZE))
+        )
+        scale = self.scale
+        descriptor = struct.pack(
+            '<BHHHHB', 0x2C, area.left * scale, area.top * scale,
+            (area.right - area.left + 1) * scale, (area.bottom - area.top + 1) * scale, 0,
+        )
+        return descriptor + bytes([min_code_size]) + blocks + b'\0'
+
+    def _flush(self):
+        if self._pending is None:
+            return
+        # the image stays in place under the next one, which only covers what changed
+        control = struct.pack('<BBBBHBB', 0x21, 0xF9, 4, 1 << 2, self._pending_delay, 0, 0)
+        self._file.write(control + self._pending)
+        self._pending = None
+        self._pending_delay = 0
+
+    def close(self):
+        self._flush()
+        self._file.write(b';')
+        super().close()
+
+
+class RawWriter(_Writer):
+    """Headerless stream of RGB frames, e.g. for ``ffmpeg -f rawvideo -pix_fmt rgb24 -s WxH -i -``."""
+
+    def __init__(self, file: File, width: int, height: int, scale: int = 1,
+                 palette: t.Sequence[Color] = LIFE_PALETTE):
+        # pylint: disable = too-many-arguments, too-many-positional-arguments
+        super().__init__(file, width, height, scale)
+        self._colors = [bytes(color) for color in palette]
+
+    def add(self, frame: Frame):
+        self.frames += 1
+        colors = self._colors
+        for row in scaled(frame, self.scale):
+            self._file.write(b''.join(map(colors.__getitem__, row)))
+
+
+WRITERS: dict[str, type[GifWriter] | type[RawWriter]] = {'.gif': GifWriter, '.raw': RawWriter, '.rgb': RawWriter}
+
+
+def writer_for(path: str | os.PathLike, width: int, height: int, scale: int = 1,
+               palette: t.Sequence[Color] = LIFE_PALETTE) -> GifWriter | RawWriter:
+    """A writer picked by the extension of `path`: ``.gif``, or ``.raw`` and ``.rgb`` for raw RGB frames."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in WRITERS:
+        raise ValueError(f'Unknown animation format {extension!r}, expected one of {sorted(WRITERS)}')
+    return WRITERS[extension](path, width, height, scale, palette)
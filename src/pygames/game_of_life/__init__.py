@@ -1,3 +1,4 @@
 from .game_of_life import GameOfLife, DEAD, LIVE, MIN_SIZE
+from .rules import Rule, CONWAY, NAMED_RULES
 
-__all__ = ['GameOfLife', 'DEAD', 'LIVE', 'MIN_SIZE']
+__all__ = ['GameOfLife', 'DEAD', 'LIVE', 'MIN_SIZE', 'Rule', 'CONWAY', 'NAMED_RULES']
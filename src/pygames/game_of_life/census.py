@@ -0,0 +1,265 @@
+import collections
+import concurrent.futures
+import functools
+import itertools
+import os
+import random
+import re
+import typing as t
+
+from pygames.game_of_life import engines
+from pygames.game_of_life.game_of_life import LIVE, Run
+from pygames.game_of_life.rules import COUNTS, CONWAY, Rule
+
+DEFAULT_SOUP_SIZE = 16
+DEFAULT_DENSITY = 0.5
+DEFAULT_MAX_GENERATIONS = 2000
+# the soup density is kept to this many binary digits
+DENSITY_BITS = 16
+# live cells this close share neighbours, so they may belong to a single object
+OBJECT_SPACING = 2
+
+_LIVE_DIGITS = re.compile('1+')
+_OFFSETS = [(drow, dcol) for drow in (-1, 0, 1) for dcol in (-1, 0, 1)]
+_NEIGHBOUR_OFFSETS = [(drow, dcol) for drow, dcol in _OFFSETS if drow or dcol]
+_SPACING_OFFSETS = [
+    (drow, dcol) for drow in range(-OBJECT_SPACING, OBJECT_SPACING + 1)
+    for dcol in range(-OBJECT_SPACING, OBJECT_SPACING + 1) if drow or dcol
+]
+_SYMMETRIES: list[t.Callable[[int, int], tuple[int, int]]] = [
+    lambda row, col: (row, col), lambda row, col: (row, -col), lambda row, col: (-row, col),
+    lambda row, col: (-row, -col), lambda row, col: (col, row), lambda row, col: (col, -row),
+    lambda row, col: (-col, row), lambda row, col: (-col, -row),
+]
+
+Cells = frozenset[tuple[int, int]]
+
+
+def soup(height: int, width: int, density: float, rng: random.Random) -> t.Iterator[Run]:
+    """Runs of a random board with about `density` of its cells alive.
+
+    Every row is built from a few random words of `width` bits: OR-ing one in raises the share of ones
+    halfway towards 1, AND-ing halves it, so the binary digits of the density, read from the last one,
+    tell which to do. This takes `DENSITY_BITS` words per row instead of a random number per cell.
+    """
+    steps = round(density * (1 << DENSITY_BITS))
+    for row in range(height):
+        bits = 0
+        for digit in range(DENSITY_BITS):
+            if steps >> digit & 1:
+                bits |= rng.getrandbits(width)
+            elif bits:
+                bits &= rng.getrandbits(width)
+        if steps >> DENSITY_BITS:
+            bits = (1 << width) - 1
+        for match in _LIVE_DIGITS.finditer(format(bits, f'0{width}b')):
+            yield row, match.start(), match.end() - match.start()
+
+
+def objects(cells: t.Iterable[tuple[int, int]], rule: Rule = CONWAY, period: int = 1) -> list[Cells]:
+    """Split live cells into objects.
+
+    Cells closer than `OBJECT_SPACING` may change each other, so they start out in one group; the group is only
+    split into its connected pieces when every piece runs on its own exactly as they do together for `period`
+    generations, e.g. blinkers that come close without touching.
+    """
+    found = []
+    for group in _groups(cells, _SPACING_OFFSETS):
+        pieces = _groups(group, _NEIGHBOUR_OFFSETS)
+        found.extend(pieces if len(pieces) > 1 and _independent(pieces, rule, period) else [group])
+    return found
+
+
+def _groups(cells: t.Iterable[tuple[int, int]], offsets: list[tuple[int, int]]) -> list[Cells]:
+    remaining = set(cells)
+    found = []
+    while remaining:
+        stack = [remaining.pop()]
+        group = set(stack)
+        while stack:
+            row, col = stack.pop()
+            for drow, dcol in offsets:
+                if (cell := (row + drow, col + dcol)) in remaining:
+                    remaining.remove(cell)
+                    group.add(cell)
+                    stack.append(cell)
+        found.append(frozenset(group))
+    return found
+
+
+def _independent(pieces: list[Cells], rule: Rule, period: int) -> bool:
+    whole = frozenset().union(*pieces)
+    for _ in range(period):
+        pieces = [step(piece, rule) for piece in pieces]
+        whole = step(whole, rule)
+        if frozenset().union(*pieces) != whole:
+            return False
+    return True
+
+
+def step(cells: Cells, rule: Rule) -> Cells:
+    """Next generation of a few cells on the unbounded plane."""
+    counts: collections.Counter[tuple[int, int]] = collections.Counter(
+        (row + drow, col + dcol) for row, col in cells for drow, dcol in _OFFSETS
+    )
+    # the counts include the cell itself
+    return frozenset(
+        cell for cell, count in counts.items()
+        if rule.table[(cell in cells) * COUNTS + count - (cell in cells)] == LIVE
+    )
+
+
+def normalised(cells: t.Iterable[tuple[int, int]]) -> tuple[tuple[int, int], ...]:
+    cells = list(cells)
+    top, left = min(row for row, _ in cells), min(col for _, col in cells)
+    return tuple(sorted((row - top, col - left) for row, col in cells))
+
+
+def canonical(cells: Cells) -> tuple[tuple[int, int], ...]:
+    """The same shape for every rotation, reflection and position of the cells."""
+    return min(normalised(symmetry(row, col) for row, col in cells) for symmetry in _SYMMETRIES)
+
+
+def classify(cells: Cells, rule: Rule = CONWAY, max_period: int = DEFAULT_MAX_GENERATIONS) -> str:
+    """Code of an object, run on its own until it repeats.
+
+    Codes read ``xs<population>_<cells>`` for still lifes, ``xp<period>_<cells>`` for oscillators,
+    ``xq<period>_<cells>`` for spaceships and ``zz_<cells>`` for objects that do not repeat on their own
+    within `max_period` generations, typically held in shape by the edges of the board;
+    the cells are the smallest canonical phase in RLE.
+    """
+    start = normalised(cells)
+    phases, current = [cells], cells
+    for period in range(1, max_period + 1):
+        current = step(current, rule)
+        if not current:
+            break
+        if normalised(current) == start:
+            shape = _encode(min(canonical(phase) for phase in phases))
+            if period == 1:
+                return f'xs{len(cells)}_{shape}'
+            moved = min(current) != min(cells)
+            return f'{"xq" if moved else "xp"}{period}_{shape}'
+        phases.append(current)
+    return f'zz_{_encode(canonical(cells))}'
+
+
+def _encode(cells: tuple[tuple[int, int], ...]) -> str:
+    live = set(cells)
+    height, width = max(row for row, _ in cells) + 1, max(col for _, col in cells) + 1
+    lines = []
+    for row in range(height):
+        line = ''.join('o' if (row, col) in live else 'b' for col in range(width)).rstrip('b')
+        lines.append(''.join(
+            f'{count if (count := len(list(group))) > 1 else ""}{tag}' for tag, group in itertools.groupby(line)
+        ))
+    return '$'.join(lines)
+
+
+KNOWN_OBJECTS = {
+    classify(frozenset((row, col) for row, line in enumerate(picture) for col, cell in enumerate(line) if cell == 'O')):
+        name
+    for name, picture in {
+        'block': ['OO', 'OO'],
+        'beehive': ['.OO', 'O..O', '.OO'],
+        'loaf': ['.OO', 'O..O', '.O.O', '..O'],
+        'boat': ['OO', 'O.O', '.O'],
+        'ship': ['OO', 'O.O', '.OO'],
+        'tub': ['.O', 'O.O', '.O'],
+        'pond': ['.OO', 'O..O', 'O..O', '.OO'],
+        'blinker': ['OOO'],
+        'toad': ['.OOO', 'OOO'],
+        'beacon': ['OO', 'OO', '..OO', '..OO'],
+        'glider': ['.O', '..O', 'OOO'],
+    }.items()
+}
+
+
+class SoupResult(t.NamedTuple):
+    seed: int
+    # generation the board entered its final cycle, ``None`` when it did not settle in time
+    lifespan: int | None
+    period: int | None
+    population: int
+    objects: tuple[tuple[str, int], ...]
+
+
+def census_soup(seed: int, height: int = DEFAULT_SOUP_SIZE, width: int = DEFAULT_SOUP_SIZE,
+                density: float = DEFAULT_DENSITY, rule: str | Rule = CONWAY, engine: str = 'bitset',
+                max_generations: int = DEFAULT_MAX_GENERATIONS) -> SoupResult:
+    """Run the soup of `seed` until it settles and classify what is left; cells beyond the edges are dead."""
+    # pylint: disable = too-many-arguments, too-many-positional-arguments
+    game = engines.create_game(engine, height=height, width=width, boundaries=True, rule=rule)
+    game.load_runs(soup(height, width, density, random.Random(seed)))
+    period = game.run_until_stable(max_generations)
+    found: collections.Counter[str] = collections.Counter()
+    if period is not None and (box := game.stats.bounding_box) is not None:
+        rows = game.region(box.top, box.left, box.bottom - box.top + 1, box.right - box.left + 1)
+        cells = [(row, col) for row, line in enumerate(rows) for col, cell in enumerate(line) if cell == LIVE]
+        found.update(classify(group, game.rule, period) for group in objects(cells, game.rule, period))
+    lifespan = game.generation - period if period is not None else None
+    return SoupResult(seed, lifespan, period, game.population, tuple(sorted(found.items())))
+
+
+class Census:
+    """Aggregate of soup results; it only depends on which results were added, not on their order."""
+
+    def __init__(self, rule: str | Rule = CONWAY):
+        self.rule = Rule.parse(rule)
+        self.soups = 0
+        self.unsettled = 0
+        self.lifespans = 0
+        # seed and lifespan of the soup that took longest to settle
+        self.longest: tuple[int, int] | None = None
+        self.population = 0
+        self.objects: collections.Counter[str] = collections.Counter()
+
+    def add(self, result: SoupResult):
+        self.soups += 1
+        self.population += result.population
+        self.objects.update(dict(result.objects))
+        if result.lifespan is None:
+            self.unsettled += 1
+            return
+        self.lifespans += result.lifespan
+        if self.longest is None or (-result.lifespan, result.seed) < (-self.longest[1], self.longest[0]):
+            self.longest = (result.seed, result.lifespan)
+
+    def name(self, code: str) -> str:
+        return KNOWN_OBJECTS.get(code, code) if self.rule == CONWAY else code
+
+    def report(self, top: int = 20) -> str:
+        settled = self.soups - self.unsettled
+        lines = [
+            f'soups: {self.soups}',
+            f'settled: {settled}',
+            f'mean lifespan: {self.lifespans / settled if settled else 0:.1f}',
+            f'longest lifespan: {self.longest[1]} (seed {self.longest[0]})' if self.longest else 'longest lifespan: -',
+            f'mean final population: {self.population / self.soups if self.soups else 0:.1f}',
+        ]
+        lines.extend(
+            f'{count:>10} {self.name(code)}'
+            for code, count in sorted(self.objects.items(), key=lambda item: (-item[1], item[0]))[:top]
+        )
+        return '\n'.join(lines)
+
+
+def run_census(seeds: t.Iterable[int], workers: int | None = None, rule: str | Rule = CONWAY,
+               **options) -> Census:
+    """Run the soups of `seeds` on a pool of `workers` processes, all CPUs by default, and merge their results.
+
+    `options` go to `census_soup`. Soups are handed out in chunks, so that workers spend their time
+    on soups rather than on messages; one worker runs the soups in this process.
+    """
+    seeds = list(seeds)
+    run_soup = functools.partial(census_soup, rule=rule, **options)
+    census = Census(rule)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for result in map(run_soup, seeds):
+            census.add(result)
+        return census
+    with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+        for result in pool.map(run_soup, seeds, chunksize=max(1, len(seeds) // (workers * 4))):
+            census.add(result)
+    return census
@@ -0,0 +1,176 @@
+import mmap
+import os
+import re
+import struct
+import typing as t
+import zlib
+
+from pygames.game_of_life.game_of_life import GameOfLife, LIVE, Run
+from pygames.game_of_life.stats import BoundingBox
+
+MAGIC = b'PGLC'
+VERSION = 1
+BAND_HEIGHT = 256
+
+# magic, version, flags, top, left, height, width, generation, band height, length of the rule
+_HEADER = struct.Struct('<4sHHqqIIQIH')
+_CHECKSUM = struct.Struct('<I')
+_UNBOUNDED = 1
+_BOUNDARIES = 2
+_DIGITS = bytes.maketrans(bytes([0, LIVE]), b'01')
+_LIVE_DIGITS = re.compile('1+')
+
+Path = str | os.PathLike
+
+
+class CheckpointHeader(t.NamedTuple):
+    rule: str
+    generation: int
+    boundaries: bool
+    unbounded: bool
+    # the stored area: the whole board, or the bounding box of the live cells on the unbounded plane
+    top: int
+    left: int
+    height: int
+    width: int
+    band_height: int = BAND_HEIGHT
+
+    @property
+    def row_bytes(self) -> int:
+        return (self.width + 7) // 8
+
+    @property
+    def payload_offset(self) -> int:
+        return _HEADER.size + len(self.rule) + _CHECKSUM.size
+
+    @property
+    def size(self) -> int:
+        """Size of the whole file, the header included."""
+        bands = -(-self.height // self.band_height)
+        return self.payload_offset + self.height * self.row_bytes + bands * _CHECKSUM.size
+
+
+def save(game: GameOfLife, path: Path, band_height: int = BAND_HEIGHT):
+    """Write a checkpoint of `game` to `path`.
+
+    The header holds the rule, generation and edges, the cells follow bit-packed row by row
+    in bands of `band_height` rows, each with its own CRC32. Bands are read from the engine through `region`
+    and written as they are packed, so memory does not grow with the board. The file is only put in place
+    once it is complete, an interrupted save leaves the previous checkpoint untouched.
+    """
+    if game.UNBOUNDED:
+        box = game.stats.bounding_box or BoundingBox(0, 0, -1, -1)
+        area = (box.top, box.left, box.bottom - box.top + 1, box.right - box.left + 1)
+    else:
+        area = (0, 0, game.height, game.width)
+    header = CheckpointHeader(str(game.rule), game.generation, game.boundaries, game.UNBOUNDED, *area, band_height)
+    partial = f'{os.fspath(path)}.partial'
+    with open(partial, 'wb') as file:
+        file.write(_pack_header(header))
+        for band in range(0, header.height, header.band_height):
+            rows = game.region(header.top + band, header.left, min(header.band_height, header.height - band),
+                               header.width)
+            payload = b''.join(_pack_row(cells, header.row_bytes) for cells in rows)
+            file.write(payload)
+            file.write(_CHECKSUM.pack(zlib.crc32(payload)))
+    os.replace(partial, path)
+
+
+def read_header(path: Path) -> CheckpointHeader:
+    with open(path, 'rb') as file:
+        return _unpack_header(file.read(_HEADER.size + 0xFFFF + _CHECKSUM.size))
+
+
+def load(game: GameOfLife, path: Path) -> CheckpointHeader:
+    """Replace the board of `game` with the checkpoint at `path` and carry on from its generation.
+
+    The file is memory-mapped and fed band by band into `GameOfLife.load_runs`, the cells are never copied
+    into an intermediate board. The CRC of every band is checked as the band is read, a corrupted band leaves
+    an empty board behind and the rule and edges as they were. A bounded game takes checkpoints of its own size,
+    an unbounded one takes any.
+    """
+    with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        header = _unpack_header(mapped)
+        if len(mapped) < header.size:
+            raise ValueError(f'Checkpoint is truncated: {len(mapped)} bytes instead of {header.size}')
+        if not game.UNBOUNDED and (header.unbounded or (header.height, header.width) != (game.height, game.width)):
+            raise ValueError(f'Checkpoint of size {header.height}x{header.width} does not fit the board')
+        runs = _runs(game, header, mapped)
+        try:
+            game.load_runs(runs)
+        except ValueError:
+            # the bands before the corrupted one are already on the board, leave it empty rather than half loaded
+            game.load_runs(())
+            raise
+        finally:
+            # views of the mapping have to be released before it is closed
+            runs.close()
+    game.rule = header.rule
+    game.boundaries = header.boundaries
+    game.resume_at(header.generation)
+    return header
+
+
+def _bands(header: CheckpointHeader) -> t.Iterator[tuple[int, int, int]]:
+    """The first row of every band with where its cells start and stop in the file; its CRC follows them."""
+    band_size = header.band_height * header.row_bytes
+    start = header.payload_offset
+    for band in range(0, header.height, header.band_height):
+        stop = start + min(band_size, (header.height - band) * header.row_bytes)
+        yield band, start, stop
+        start = stop + _CHECKSUM.size
+
+
+def _runs(game: GameOfLife, header: CheckpointHeader, mapped: mmap.mmap) -> t.Generator[Run, None, None]:
+    # `load_runs` of unbounded engines takes cells relative to their origin
+    top, left = getattr(game, 'origin', (0, 0)) if game.UNBOUNDED else (0, 0)
+    top, left = header.top - top, header.left - left
+    row_bytes = header.row_bytes
+    for band, start, stop in _bands(header):
+        with memoryview(mapped)[start:stop] as data:
+            (checksum,) = _CHECKSUM.unpack_from(mapped, stop)
+            if zlib.crc32(data) != checksum:
+                raise ValueError(f'Checkpoint is corrupted in rows {band}..{band + len(data) // row_bytes - 1}')
+            for offset in range(0, len(data), row_bytes):
+                if bits := int.from_bytes(data[offset:offset + row_bytes], 'little'):
+                    yield from _row_runs(top + band + offset // row_bytes, left, bits)
+
+
+def _row_runs(row: int, left: int, bits: int) -> t.Iterator[Run]:
+    for match in _LIVE_DIGITS.finditer(format(bits, 'b')[::-1]):
+        yield row, left + match.start(), match.end() - match.start()
+
+
+def _pack_row(cells: t.Sequence[int], row_bytes: int) -> bytes:
+    # the cell in column `col` is bit ``col % 8`` of byte ``col // 8``
+    digits = bytes(cells)[::-1].translate(_DIGITS)
+    return int(digits or b'0', 2).to_bytes(row_bytes, 'little')
+
+
+def _pack_header(header: CheckpointHeader) -> bytes:
+    flags = (_UNBOUNDED if header.unbounded else 0) | (_BOUNDARIES if header.boundaries else 0)
+    rule = header.rule.encode('ascii')
+    data = _HEADER.pack(
+        MAGIC, VERSION, flags, header.top, header.left, header.height, header.width, header.generation,
+        header.band_height, len(rule),
+    ) + rule
+    return data + _CHECKSUM.pack(zlib.crc32(data))
+
+
+def _unpack_header(data: bytes | mmap.mmap) -> CheckpointHeader:
+    if len(data) < _HEADER.size or data[:len(MAGIC)] != MAGIC:
+        raise ValueError('Not a Game of Life checkpoint')
+    _, version, flags, top, left, height, width, generation, band_height, rule_length = _HEADER.unpack_from(data)
+    if version != VERSION:
+        raise ValueError(f'Unsupported checkpoint version {version}')
+    end = _HEADER.size + rule_length
+    if len(data) < end + _CHECKSUM.size:
+        raise ValueError('Checkpoint is truncated within its header')
+    (checksum,) = _CHECKSUM.unpack_from(data, end)
+    header = data[:end]
+    if zlib.crc32(header) != checksum:
+        raise ValueError('Checkpoint header is corrupted')
+    return CheckpointHeader(
+        header[_HEADER.size:].decode('ascii'), generation, bool(flags & _BOUNDARIES), bool(flags & _UNBOUNDED),
+        top, left, height, width, band_height,
+    )
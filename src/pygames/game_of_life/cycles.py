@@ -0,0 +1,146 @@
+import collections
+import typing as t
+
+DEFAULT_WINDOW = 64
+
+_MASK = (1 << 64) - 1
+# keys are elements of GF(2 ** 64) modulo x^64 + x^4 + x^3 + x + 1, whose non-zero elements form a cyclic group
+_ORDER = (1 << 64) - 1
+# generators of that group, one for each axis
+ROW_BASE = 0x9E3779B97F4A7C15
+COL_BASE = 0xBF58476D1CE4E5B9
+
+
+def multiply(a: int, b: int) -> int:
+    """Product of two keys in GF(2 ** 64); it distributes over XOR."""
+    # carry-less multiplication four bits of `b` at a time, then the overflow is folded back twice
+    multiples = [0, a]
+    for index in range(2, 16, 2):
+        multiples.append(multiples[index >> 1] << 1)
+        multiples.append(multiples[index] ^ a)
+    product, shift = 0, 0
+    while b:
+        product ^= multiples[b & 0xF] << shift
+        b >>= 4
+        shift += 4
+    for _ in range(2):
+        high = product >> 64
+        product = (product & _MASK) ^ high ^ high << 1 ^ high << 3 ^ high << 4
+    return product
+
+
+def _squares(base: int) -> tuple[int, ...]:
+    # ``base ** 2 ** k`` for every bit of an exponent
+    squares = [base]
+    while len(squares) < 64:
+        squares.append(multiply(squares[-1], squares[-1]))
+    return tuple(squares)
+
+
+def _power(squares: tuple[int, ...], exponent: int) -> int:
+    result = 1
+    for square in squares:
+        if not exponent:
+            break
+        if exponent & 1:
+            result = multiply(result, square)
+        exponent >>= 1
+    return result
+
+
+def _powers(base: int) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    # squares of the base and of its inverse, so that negative coordinates cost no more than positive ones
+    squares = _squares(base)
+    return squares, _squares(_power(squares, _ORDER - 1))
+
+
+_ROW_POWERS = _powers(ROW_BASE)
+_COL_POWERS = _powers(COL_BASE)
+
+
+def row_key(row: int) -> int:
+    return _power(_ROW_POWERS[row < 0], abs(row) % _ORDER)
+
+
+def col_key(col: int) -> int:
+    return _power(_COL_POWERS[col < 0], abs(col) % _ORDER)
+
+
+def cell_key(row: int, col: int) -> int:
+    """Zobrist key of a live cell, the same for every engine: ``ROW_BASE ** row * COL_BASE ** col``.
+
+    A board hashes to the XOR of the keys of its live cells. As the product distributes over XOR,
+    the hash of a pattern moved by ``(rows, cols)`` is its hash multiplied by ``cell_key(rows, cols)``,
+    and the cells of one row hash to the XOR of their column keys multiplied by the key of the row.
+    """
+    return multiply(row_key(row), col_key(col))
+
+
+def row_keys(count: int, first: int = 0) -> list[int]:
+    """Keys of `count` consecutive rows starting at `first`."""
+    keys = [row_key(first)]
+    while len(keys) < count:
+        keys.append(multiply(keys[-1], ROW_BASE))
+    return keys[:count]
+
+
+def col_keys(count: int, first: int = 0) -> list[int]:
+    """Keys of `count` consecutive columns starting at `first`."""
+    keys = [col_key(first)]
+    while len(keys) < count:
+        keys.append(multiply(keys[-1], COL_BASE))
+    return keys[:count]
+
+
+def byte_positions(bits: int, length: int) -> t.Iterator[int]:
+    # indices of the non-zero bytes of a buffer of zeros and ones read with `int.from_bytes`;
+    # clearing bits one by one would copy the whole integer for each of them, `find` only walks it once
+    cells = bits.to_bytes(length)
+    index = cells.find(1)
+    while index >= 0:
+        yield index
+        index = cells.find(1, index + 1)
+
+
+def bit_positions(bits: int) -> t.Iterator[int]:
+    digits = format(bits, 'b')[::-1]
+    index = digits.find('1')
+    while index >= 0:
+        yield index
+        index = digits.find('1', index + 1)
+
+
+class CycleDetector:
+    """Spots a board coming back to one of its recent states by their hashes.
+
+    Only the hashes of the last `window` pushes are kept, so cycles longer than that go unnoticed.
+    `period` is the distance in generations to the latest push of the same hash; it is the exact period
+    as long as generations are pushed one by one, a still life has period 1.
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        self.window = window
+        self.period: int | None = None
+        self._recent: collections.deque[tuple[int, int]] = collections.deque()
+        self._generations: dict[int, int] = {}
+        self._context: t.Hashable = None
+
+    def reset(self):
+        self.period = None
+        self._recent.clear()
+        self._generations.clear()
+
+    def push(self, generation: int, board_hash: int, context: t.Hashable = None) -> int | None:
+        # the same board under different rules or edges has a different future, so it does not close a cycle
+        if context != self._context:
+            self.reset()
+            self._context = context
+        seen = self._generations.get(board_hash)
+        self.period = generation - seen if seen is not None else None
+        if len(self._recent) >= self.window:
+            old_generation, old_hash = self._recent.popleft()
+            if self._generations.get(old_hash) == old_generation:
+                del self._generations[old_hash]
+        self._recent.append((generation, board_hash))
+        self._generations[board_hash] = generation
+        return self.period
@@ -0,0 +1,48 @@
+from pygames.game_of_life.game_of_life import GameOfLife
+
+from .active import ActiveGameOfLife
+from .bitset import BitsetGameOfLife
+from .flat import FlatGameOfLife
+from .hashlife import HashlifeGameOfLife
+from .sparse import SparseGameOfLife
+
+ENGINES: dict[str, type[GameOfLife]] = {
+    'python': GameOfLife,
+    'bitset': BitsetGameOfLife,
+    'flat': FlatGameOfLife,
+    'active': ActiveGameOfLife,
+    'hashlife': HashlifeGameOfLife,
+    'sparse': SparseGameOfLife,
+}
+# engines built on optional dependencies quietly degrade to the pure-Python one
+FALLBACKS = {
+    'numpy': 'bitset',
+    'tiled': 'numpy',
+}
+
+try:
+    from .tiled import TiledGameOfLife
+    from .vectorized import VectorizedGameOfLife
+except ImportError:  # pragma: nocover
+    pass
+else:
+    ENGINES['numpy'] = VectorizedGameOfLife
+    ENGINES['tiled'] = TiledGameOfLife
+
+
+def get_engine(name: str) -> type[GameOfLife]:
+    if name in ENGINES:
+        return ENGINES[name]
+    if name in FALLBACKS:
+        return get_engine(FALLBACKS[name])
+    raise ValueError(f'Unknown engine {name!r}. Available engines: {", ".join(sorted({*ENGINES, *FALLBACKS}))}')
+
+
+def create_game(engine: str = 'numpy', **kwargs) -> GameOfLife:
+    return get_engine(engine)(**kwargs)
+
+
+__all__ = [
+    'ActiveGameOfLife', 'BitsetGameOfLife', 'FlatGameOfLife', 'HashlifeGameOfLife', 'SparseGameOfLife',
+    'ENGINES', 'FALLBACKS', 'get_engine', 'create_game',
+]
@@ -0,0 +1,154 @@
+import typing as t
+
+from pygames.game_of_life.game_of_life import GameOfLife, LIVE, DEAD, Run
+from pygames.game_of_life.rules import COUNTS, CONWAY, Rule
+from pygames.game_of_life.stats import BoundingBox
+
+
+class ActiveGameOfLife(GameOfLife):  # pylint: disable = too-many-instance-attributes
+    """Game of Life re-evaluating only the cells around the last generation's changes.
+
+    A cell can only change if something in its 3x3 neighbourhood changed in the previous generation,
+    so the cost of a generation is proportional to the activity on the board rather than to its area.
+    """
+
+    def __init__(self, height: int = 10, width: int = 10, boundaries: bool = False, rule: str | Rule = CONWAY):
+        self._cells = bytearray(height * width)
+        self._changed: set[int] = set()
+        self._full_scan = True
+        # live cells per row and per column, kept up to date with the flips for the bounding box
+        self._row_population = [0] * height
+        self._col_population = [0] * width
+        self._rows_around: list[tuple[int, ...]] = []
+        self._cols_around: list[tuple[int, ...]] = []
+        self._wraps: bool | None = None
+        # the rule the last changes were found under; cells settled under another rule can all change
+        self._table: bytes | None = None
+        super().__init__(height=height, width=width, boundaries=boundaries, rule=rule)
+
+    @property
+    def state(self) -> list[list[int]]:
+        return [list(self._cells[row:row + self._width]) for row in range(0, len(self._cells), self._width)]
+
+    @state.setter
+    def state(self, value: list[list[int]]):
+        if value == [[]]:
+            self._cells = bytearray(self._height * self._width)
+        else:
+            if len(value) != self._height or any(len(row) != self._width for row in value):
+                raise ValueError(f'State must be of size {self._height}x{self._width}')
+            self._cells = bytearray(LIVE if cell == LIVE else DEAD for row in value for cell in row)
+        self._reload()
+
+    def load_runs(self, runs: t.Iterable[Run]):
+        self._cells = bytearray(self._height * self._width)
+        for row, col, length in runs:
+            start = row * self._width + col
+            self._cells[start:start + length] = bytes([LIVE]) * length
+        self._reload()
+
+    def _reload(self):
+        self._changed = set()
+        self._full_scan = True
+        width = self._width
+        self._row_population = [
+            self._cells.count(LIVE, start, start + width) for start in range(0, len(self._cells), width)
+        ]
+        self._col_population = [self._cells[col::width].count(LIVE) for col in range(width)]
+        board_hash = self._hash_cells(index for index, cell in enumerate(self._cells) if cell == LIVE)
+        self._loaded(self._cells.count(LIVE), self._bounding_box(), board_hash)
+
+    def _flip_cells(self, indices: t.Iterable[int]):
+        cells, width = self._cells, self._width
+        for index in indices:
+            cells[index] ^= LIVE
+            row, col = divmod(index, width)
+            delta = 1 if cells[index] == LIVE else -1
+            self._row_population[row] += delta
+            self._col_population[col] += delta
+        # which cells changed on the way to this generation is not known here
+        self._changed = set()
+        self._full_scan = True
+
+    def _row_cells(self, row: int, start: int, stop: int) -> t.Iterable[int]:
+        first = row * self._width
+        return self._cells[first + start:first + stop]
+
+    def _bounding_box(self) -> BoundingBox | None:
+        rows = [row for row, population in enumerate(self._row_population) if population]
+        if not rows:
+            return None
+        cols = [col for col, population in enumerate(self._col_population) if population]
+        return BoundingBox(rows[0], cols[0], rows[-1], cols[-1])
+
+    @property
+    def changed(self) -> set[tuple[int, int]]:
+        """Cells (row, col) that flipped in the last generation."""
+        return {divmod(index, self._width) for index in self._changed}
+
+    def _build_neighbourhoods(self):
+        wraps = not self.boundaries
+
+        def around(index: int, size: int, stride: int) -> tuple[int, ...]:
+            if wraps:
+                return tuple(((index + delta) % size) * stride for delta in (-1, 0, 1))
+            return tuple((index + delta) * stride for delta in (-1, 0, 1) if 0 <= index + delta < size)
+
+        self._rows_around = [around(row, self._height, self._width) for row in range(self._height)]
+        self._cols_around = [around(col, self._width, 1) for col in range(self._width)]
+        if self._wraps is not None and self._wraps != wraps:
+            # edge cells gain or lose neighbours, so they all have to be looked at again
+            self._changed.update(self._border())
+        self._wraps = wraps
+
+    def _border(self) -> set[int]:
+        last_row = (self._height - 1) * self._width
+        border = set(range(self._width)) | set(range(last_row, last_row + self._width))
+        border.update(range(0, len(self._cells), self._width))
+        border.update(range(self._width - 1, len(self._cells), self._width))
+        return border
+
+    def _candidates(self) -> set[int] | range:
+        if self._full_scan:
+            return range(len(self._cells))
+        candidates: set[int] = set()
+        rows_around, cols_around, width = self._rows_around, self._cols_around, self._width
+        for index in self._changed:
+            row, col = divmod(index, width)
+            cols = cols_around[col]
+            for row_start in rows_around[row]:
+                candidates.update(row_start + col_start for col_start in cols)
+        return candidates
+
+    def update(self):
+        # pylint: disable = too-many-locals
+        if self._wraps != (not self.boundaries):
+            self._build_neighbourhoods()
+        cells, rows_around, cols_around, width = self._cells, self._rows_around, self._cols_around, self._width
+        table = self.rule.table
+        if table != self._table:
+            self._full_scan = True
+            self._table = table
+        flipped = []
+        for index in self._candidates():
+            row, col = divmod(index, width)
+            cols = cols_around[col]
+            total = sum(cells[row_start + col_start] for row_start in rows_around[row] for col_start in cols)
+            alive = cells[index]
+            # the cell itself was counted in its own neighbourhood
+            if table[alive * (COUNTS - 1) + total] != alive:
+                flipped.append(index)
+        births = 0
+        row_population, col_population = self._row_population, self._col_population
+        for index in flipped:
+            cells[index] ^= LIVE
+            row, col = divmod(index, width)
+            delta = 1 if cells[index] == LIVE else -1
+            births += delta > 0
+            row_population[row] += delta
+            col_population[col] += delta
+        self._changed = set(flipped)
+        self._full_scan = False
+        self._record(
+            births, len(flipped) - births, self._bounding_box(), hash_delta=self._hash_cells(flipped), flipped=flipped
+        )
@@ -0,0 +1,163 @@
+import typing as t
+
+from pygames.game_of_life.cycles import bit_positions
+from pygames.game_of_life.game_of_life import GameOfLife, LIVE, DEAD, Run
+from pygames.game_of_life.rules import COUNTS, CONWAY, Rule
+from pygames.game_of_life.stats import BoundingBox
+
+
+def half_adder(a: int, b: int) -> tuple[int, int]:
+    return a ^ b, a & b
+
+
+def full_adder(a: int, b: int, c: int) -> tuple[int, int]:
+    partial = a ^ b
+    return partial ^ c, (a & b) | (partial & c)
+
+
+def count_bits(planes: tuple[int, ...]) -> tuple[int, int, int, int]:
+    # sums eight one-bit planes into the four bit planes of the neighbour count (0..8)
+    sum_a, carry_a = full_adder(planes[0], planes[1], planes[2])
+    sum_b, carry_b = full_adder(planes[3], planes[4], planes[5])
+    sum_c, carry_c = half_adder(planes[6], planes[7])
+    bit0, carry_d = full_adder(sum_a, sum_b, sum_c)
+    sum_e, carry_e = full_adder(carry_a, carry_b, carry_c)
+    bit1, carry_f = half_adder(sum_e, carry_d)
+    bit2, bit3 = half_adder(carry_e, carry_f)
+    return bit0, bit1, bit2, bit3
+
+
+def count_equals(bits: tuple[int, int, int, int], count: int, full: int) -> int:
+    # plane of the cells whose neighbour count is exactly `count`
+    plane = full
+    for position, bit in enumerate(bits):
+        plane &= bit if count >> position & 1 else ~bit
+    return plane
+
+
+class BitsetGameOfLife(GameOfLife):
+    """Game of Life keeping the whole board in a single Python ``int``.
+
+    Cell ``(row, col)`` lives in bit ``row * width + col``, so a neighbour plane is a shifted copy of the board
+    and one big-integer operation updates every cell at once.
+    """
+
+    def __init__(self, height: int = 10, width: int = 10, boundaries: bool = False, rule: str | Rule = CONWAY):
+        size = height * width
+        self.bits = 0
+        self._full = (1 << size) - 1
+        self._first_col = sum(1 << (row * width) for row in range(height))
+        self._last_col = self._first_col << (width - 1)
+        self._first_row = (1 << width) - 1
+        super().__init__(height=height, width=width, boundaries=boundaries, rule=rule)
+
+    @property
+    def state(self) -> list[list[int]]:
+        cells = format(self.bits, f'0{self._height * self._width}b')[::-1]
+        return [
+            [LIVE if cell == '1' else DEAD for cell in cells[row:row + self._width]]
+            for row in range(0, len(cells), self._width)
+        ]
+
+    @state.setter
+    def state(self, value: list[list[int]]):
+        if value == [[]]:
+            self.bits = 0
+        else:
+            if len(value) != self._height or any(len(row) != self._width for row in value):
+                raise ValueError(f'State must be of size {self._height}x{self._width}')
+            cells = ''.join('1' if cell == LIVE else '0' for row in reversed(value) for cell in reversed(row))
+            self.bits = int(cells, 2)
+        self._reload()
+
+    def load_runs(self, runs: t.Iterable[Run]):
+        # OR-ing every run into the integer would copy it each time, the digits are gathered first instead
+        digits = bytearray(b'0') * (self._height * self._width)
+        for row, col, length in runs:
+            start = row * self._width + col
+            digits[start:start + length] = b'1' * length
+        digits.reverse()
+        self.bits = int(digits, 2)
+        self._reload()
+
+    def _reload(self):
+        self._loaded(self.bits.bit_count(), self._bounding_box(self.bits), self._hash_cells(bit_positions(self.bits)))
+
+    def _flip_cells(self, indices: t.Iterable[int]):
+        # the flips are gathered into one mask as in `load_runs`, OR-ing them in one by one would copy the integer
+        digits = bytearray(b'0') * (self._height * self._width)
+        for index in indices:
+            digits[index] = ord('1')
+        digits.reverse()
+        self.bits ^= int(digits, 2)
+
+    def _row_cells(self, row: int, start: int, stop: int) -> t.Iterable[int]:
+        cells = (self.bits >> (row * self._width + start)) & ((1 << (stop - start)) - 1)
+        return [LIVE if digit == '1' else DEAD for digit in reversed(format(cells, f'0{stop - start}b'))]
+
+    def _bounding_box(self, board: int) -> BoundingBox | None:
+        if not board:
+            return None
+        width = self._width
+        # all rows ORed into the lowest one, halving the number of rows on every step
+        folded, rows = board, self._height
+        while rows > 1:
+            half = (rows + 1) // 2
+            folded = (folded & ((1 << (half * width)) - 1)) | (folded >> (half * width))
+            rows = half
+        return BoundingBox(
+            top=((board & -board).bit_length() - 1) // width,
+            left=(folded & -folded).bit_length() - 1,
+            bottom=(board.bit_length() - 1) // width,
+            right=folded.bit_length() - 1,
+        )
+
+    def _west(self, board: int) -> int:
+        # plane holding the left neighbour of every cell
+        shifted = (board << 1) & ~self._first_col & self._full
+        if not self.boundaries:
+            shifted |= (board & self._last_col) >> (self._width - 1)
+        return shifted
+
+    def _east(self, board: int) -> int:
+        shifted = (board >> 1) & ~self._last_col
+        if not self.boundaries:
+            shifted |= (board & self._first_col) << (self._width - 1)
+        return shifted
+
+    def _north(self, board: int) -> int:
+        shifted = (board << self._width) & self._full
+        if not self.boundaries:
+            shifted |= board >> (self._width * (self._height - 1))
+        return shifted
+
+    def _south(self, board: int) -> int:
+        shifted = board >> self._width
+        if not self.boundaries:
+            shifted |= (board & self._first_row) << (self._width * (self._height - 1))
+        return shifted
+
+    def update(self):
+        board = self.bits
+        west, east = self._west(board), self._east(board)
+        bits = count_bits((
+            self._north(west), self._north(board), self._north(east),
+            west, east,
+            self._south(west), self._south(board), self._south(east),
+        ))
+        table, dead = self.rule.table, self._full & ~board
+        following = 0
+        for count in range(COUNTS):
+            born, survives = table[DEAD * COUNTS + count], table[LIVE * COUNTS + count]
+            if born or survives:
+                following |= count_equals(bits, count, (dead if born else 0) | (board if survives else 0))
+        self.bits = following
+        flipped = list(bit_positions(board ^ following))
+        self._record(
+            births=(following & dead).bit_count(),
+            deaths=(board & ~following).bit_count(),
+            bounding_box=self._bounding_box(following),
+            population=following.bit_count(),
+            hash_delta=self._hash_cells(flipped),
+            flipped=flipped,
+        )
@@ -0,0 +1,150 @@
+import array
+import typing as t
+
+from pygames.game_of_life.cycles import byte_positions, multiply
+from pygames.game_of_life.game_of_life import GameOfLife, LIVE, DEAD, Run
+from pygames.game_of_life.rules import COUNTS, CONWAY, Rule
+from pygames.game_of_life.stats import BoundingBox
+
+
+class FlatGameOfLife(GameOfLife):  # pylint: disable = too-many-instance-attributes
+    """Pure-Python Game of Life on two flat, preallocated buffers.
+
+    Each buffer holds the board surrounded by a ghost border, which is refreshed from the opposite edges
+    when the board wraps and kept dead when it does not. That way every cell has its eight neighbours
+    at fixed index offsets, and a generation is written into the spare buffer and swapped in instead of copied.
+    """
+
+    def __init__(self, height: int = 10, width: int = 10, boundaries: bool = False, rule: str | Rule = CONWAY):
+        stride = width + 2
+        self._stride = stride
+        self._cells = bytearray((height + 2) * stride)
+        self._spare = bytearray(len(self._cells))
+        self._offsets = (-stride - 1, -stride, -stride + 1, -1, 1, stride - 1, stride, stride + 1)
+        self._rows = [range(row * stride + 1, row * stride + 1 + width) for row in range(1, height + 1)]
+        self._dead_row = bytes(width)
+        self._dead_col = bytes(height + 2)
+        # one bit per board cell once a buffer is read as a big integer, ghost cells excluded
+        interior = bytearray(len(self._cells))
+        for cells in self._rows:
+            interior[cells.start:cells.stop] = bytes([LIVE]) * width
+        self._interior = int.from_bytes(interior)
+        super().__init__(height=height, width=width, boundaries=boundaries, rule=rule)
+
+    @property
+    def state(self) -> list[list[int]]:
+        return [list(self._cells[cells.start:cells.stop]) for cells in self._rows]
+
+    @state.setter
+    def state(self, value: list[list[int]]):
+        if value == [[]]:
+            self._cells[:] = bytes(len(self._cells))
+        else:
+            if len(value) != self._height or any(len(row) != self._width for row in value):
+                raise ValueError(f'State must be of size {self._height}x{self._width}')
+            for cells, row in zip(self._rows, value):
+                self._cells[cells.start:cells.stop] = bytes(LIVE if cell == LIVE else DEAD for cell in row)
+        self._reload()
+
+    def load_runs(self, runs: t.Iterable[Run]):
+        cells = self._cells
+        cells[:] = bytes(len(cells))
+        for row, col, length in runs:
+            start = self._rows[row].start + col
+            cells[start:start + length] = bytes([LIVE]) * length
+        self._reload()
+
+    def _reload(self):
+        live = int.from_bytes(self._cells) & self._interior
+        self._loaded(live.bit_count(), self._bounding_box(self._cells), self._hash_cells(self._board_indices(live)))
+
+    def _flip_cells(self, indices: t.Iterable[int]):
+        cells, rows, width = self._cells, self._rows, self._width
+        for index in indices:
+            row, col = divmod(index, width)
+            cells[rows[row].start + col] ^= LIVE
+
+    def _row_cells(self, row: int, start: int, stop: int) -> t.Iterable[int]:
+        first = self._rows[row].start
+        return self._cells[first + start:first + stop]
+
+    def _board_indices(self, cells: int) -> list[int]:
+        # ``row * width + col`` of the live cells of a buffer read as an integer
+        stride, width = self._stride, self._width
+        return [
+            (index // stride - 1) * width + index % stride - 1 for index in byte_positions(cells, len(self._cells))
+        ]
+
+    def _bounding_box(self, cells: bytearray) -> BoundingBox | None:
+        live_rows = [row for row, span in enumerate(self._rows) if cells.find(LIVE, span.start, span.stop) >= 0]
+        if not live_rows:
+            return None
+        lefts, rights = [], []
+        for row in live_rows:
+            span = self._rows[row]
+            lefts.append(cells.find(LIVE, span.start, span.stop) - span.start)
+            rights.append(cells.rfind(LIVE, span.start, span.stop) - span.start)
+        return BoundingBox(live_rows[0], min(lefts), live_rows[-1], max(rights))
+
+    def _refresh_ghost_border(self, cells: bytearray):
+        stride, width = self._stride, self._width
+        top_ghost, first, last = 1, self._rows[0].start, self._rows[-1].start
+        bottom_ghost = last + stride
+        if self.boundaries:
+            cells[top_ghost:top_ghost + width] = self._dead_row
+            cells[bottom_ghost:bottom_ghost + width] = self._dead_row
+            cells[0::stride] = self._dead_col
+            cells[width + 1::stride] = self._dead_col
+            return
+        cells[top_ghost:top_ghost + width] = cells[last:last + width]
+        cells[bottom_ghost:bottom_ghost + width] = cells[first:first + width]
+        # columns go last, so that the corners pick up the already wrapped rows
+        cells[0::stride] = cells[width::stride]
+        cells[width + 1::stride] = cells[1::stride]
+
+    def update(self):
+        # pylint: disable = too-many-locals
+        cells, spare, width = self._cells, self._spare, self._width
+        self._refresh_ghost_border(cells)
+        north_west, north, north_east, west, east, south_west, south, south_east = self._offsets
+        table, row_keys, col_keys = self.rule.table, self._row_keys, self._col_keys
+        # the statistics are gathered while the generation is computed, the buffers are not scanned again
+        births = deaths = hash_delta = 0
+        top = bottom = right = -1
+        left = width
+        # the flipped cells are only gathered when they are wanted, packed as the history keeps them
+        flipped = array.array('I') if self._wants_flips else None
+        for board_row, row in enumerate(self._rows):
+            # from a buffer index to ``row * width + col``
+            to_board = board_row * width - row.start
+            row_hash = 0
+            for index in row:
+                total = cells[index + north_west] + cells[index + north] + cells[index + north_east] \
+                    + cells[index + west] + cells[index + east] \
+                    + cells[index + south_west] + cells[index + south] + cells[index + south_east]
+                alive = cells[index]
+                following = spare[index] = table[alive * COUNTS + total]
+                if following != alive:
+                    if following:
+                        births += 1
+                    else:
+                        deaths += 1
+                    row_hash ^= col_keys[index - row.start]
+                    if flipped is not None:
+                        flipped.append(index + to_board)
+            if row_hash:
+                hash_delta ^= multiply(row_keys[board_row], row_hash)
+            if (first := spare.find(LIVE, row.start, row.stop)) >= 0:
+                if top < 0:
+                    top = board_row
+                bottom = board_row
+                left = min(left, first - row.start)
+                right = max(right, spare.rfind(LIVE, row.start, row.stop) - row.start)
+        self._cells, self._spare = spare, cells
+        self._record(
+            births=births,
+            deaths=deaths,
+            bounding_box=BoundingBox(top, left, bottom, right) if top >= 0 else None,
+            hash_delta=hash_delta,
+            flipped=flipped,
+        )
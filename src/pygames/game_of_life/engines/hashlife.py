@@ -0,0 +1,392 @@
+import typing as t
+
+from pygames.game_of_life.cycles import cell_key, col_key, multiply, row_key
+from pygames.game_of_life.game_of_life import GameOfLife, LIVE, DEAD, Run
+from pygames.game_of_life.rules import CONWAY, Rule
+from pygames.game_of_life.stats import BoundingBox
+
+DEFAULT_MAX_NODES = 1_000_000
+# side of the square blocks live cells are gathered in while loading runs, a block fits in one 64-bit mask
+BLOCK_LEVEL = 3
+
+
+class Node:  # pylint: disable = too-few-public-methods
+    """Quadtree node of side ``2 ** level``; nodes are hash-consed, so equal subtrees are the same object."""
+    __slots__ = ('level', 'nw', 'ne', 'sw', 'se', 'population', 'key')
+    level: int
+    nw: 'Node'
+    ne: 'Node'
+    sw: 'Node'
+    se: 'Node'
+    population: int
+    # XOR of the keys of the live cells with the top left corner of the node at the origin, computed on first use
+    key: int | None
+
+    def __init__(self, nw: 'Node', ne: 'Node', sw: 'Node', se: 'Node'):
+        self.level = nw.level + 1
+        self.nw, self.ne, self.sw, self.se = nw, ne, sw, se
+        self.population = nw.population + ne.population + sw.population + se.population
+        self.key = None if self.population else 0
+
+    @classmethod
+    def cell(cls, population: int) -> 'Node':
+        # single cells have no quadrants, nothing ever descends below them
+        node = cls.__new__(cls)
+        node.level = 0
+        node.population = population
+        node.key = cell_key(0, 0) if population else 0
+        return node
+
+
+DEAD_CELL = Node.cell(DEAD)
+LIVE_CELL = Node.cell(LIVE)
+
+
+def gather_blocks(runs: t.Iterable[Run]) -> dict[tuple[int, int], int]:
+    # row-major bit masks of the blocks of side ``2 ** BLOCK_LEVEL`` holding live cells
+    size = 1 << BLOCK_LEVEL
+    blocks: dict[tuple[int, int], int] = {}
+    for row, col, length in runs:
+        block_row, cell_row = divmod(row, size)
+        while length > 0:
+            block_col, cell_col = divmod(col, size)
+            span = min(length, size - cell_col)
+            key = (block_row, block_col)
+            blocks[key] = blocks.get(key, 0) | ((1 << span) - 1) << (cell_row * size + cell_col)
+            col += span
+            length -= span
+    return blocks
+
+
+class CacheInfo(t.NamedTuple):
+    hits: int
+    misses: int
+    nodes: int
+    results: int
+    collections: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class HashlifeGameOfLife(GameOfLife):  # pylint: disable = too-many-instance-attributes
+    """Game of Life on the unbounded plane using Gosper's Hashlife algorithm.
+
+    The universe is a quadtree of canonical nodes, and the future of every node is memoised,
+    so repetitive patterns can be advanced by astronomically many generations with `advance`.
+    `state` is the ``height x width`` window at `origin` the board was loaded into; cells leaving it keep
+    evolving outside of it, which is why `boundaries` has no effect on this engine. Use `region` to look elsewhere.
+    """
+    UNBOUNDED = True
+
+    def __init__(self, height: int = 10, width: int = 10, boundaries: bool = False, rule: str | Rule = CONWAY,
+                 max_nodes: int = DEFAULT_MAX_NODES):
+        # pylint: disable = too-many-arguments, too-many-positional-arguments
+        self.max_nodes = max_nodes
+        # plane coordinates of the top left corner of `state`
+        self.origin = (0, 0)
+        self._nodes: dict[tuple[Node, Node, Node, Node], Node] = {}
+        self._results: dict[tuple[Node, int], Node] = {}
+        # memoised futures only hold under the rule they were computed with
+        self._results_rule: Rule | None = None
+        self._empty: list[Node] = [DEAD_CELL]
+        # keys of a shift by the side of a node one level below, down, right and both, by level
+        self._shifts: list[tuple[int, int, int]] = []
+        self._hits = self._misses = self._collections = 0
+        # root node and the board coordinates of its top left corner
+        self._root = DEAD_CELL
+        self._top = self._left = 0
+        super().__init__(height=height, width=width, boundaries=boundaries, rule=rule)
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(
+            hits=self._hits,
+            misses=self._misses,
+            nodes=len(self._nodes),
+            results=len(self._results),
+            collections=self._collections,
+        )
+
+    @property
+    def state(self) -> list[list[int]]:
+        return self.region(*self.origin, self._height, self._width)
+
+    @state.setter
+    def state(self, value: list[list[int]]):
+        if value == [[]]:
+            value = [[DEAD] * self._width for _ in range(self._height)]
+        if len(value) != self._height or any(len(row) != self._width for row in value):
+            raise ValueError(f'State must be of size {self._height}x{self._width}')
+        level = max(2, (max(self._height, self._width) - 1).bit_length())
+        self._root = self._build(value, 0, 0, level)
+        self._top, self._left = self.origin
+        self._loaded(self._root.population, self._bounding_box(), self._hash())
+
+    def load_runs(self, runs: t.Iterable[Run]):
+        # cells are gathered in bit masks of small blocks, which are then joined pairwise up to a single root,
+        # so memory follows the number of occupied blocks rather than the area of the pattern
+        size = 1 << BLOCK_LEVEL
+        blocks = gather_blocks(runs)
+        top, left = self.origin
+        if not blocks:
+            self._root, self._top, self._left = self._empty_node(BLOCK_LEVEL), top, left
+        else:
+            first_row = min(block_row for block_row, _ in blocks)
+            first_col = min(block_col for _, block_col in blocks)
+            nodes = {
+                (block_row - first_row, block_col - first_col): self._block_node(block, 0, 0, size)
+                for (block_row, block_col), block in blocks.items()
+            }
+            while len(nodes) > 1:
+                empty = self._empty_node(next(iter(nodes.values())).level)
+                parents: dict[tuple[int, int], list[Node]] = {}
+                for (node_row, node_col), node in nodes.items():
+                    parents.setdefault((node_row >> 1, node_col >> 1), [empty] * 4)[
+                        (node_row & 1) * 2 + (node_col & 1)
+                    ] = node
+                nodes = {key: self._join(*quadrants) for key, quadrants in parents.items()}
+            (node_row, node_col), self._root = next(iter(nodes.items()))
+            self._top = top + (first_row + (node_row << (self._root.level - BLOCK_LEVEL))) * size
+            self._left = left + (first_col + (node_col << (self._root.level - BLOCK_LEVEL))) * size
+        self._loaded(self._root.population, self._bounding_box(), self._hash())
+
+    def _block_node(self, block: int, top: int, left: int, size: int) -> Node:
+        # pylint: disable = too-many-arguments, too-many-positional-arguments
+        if size == 1:
+            return LIVE_CELL if block >> (top << BLOCK_LEVEL | left) & 1 else DEAD_CELL
+        half = size >> 1
+        return self._join(
+            self._block_node(block, top, left, half),
+            self._block_node(block, top, left + half, half),
+            self._block_node(block, top + half, left, half),
+            self._block_node(block, top + half, left + half, half),
+        )
+
+    def region(self, top: int, left: int, height: int, width: int) -> list[list[int]]:
+        grid = [[DEAD] * width for _ in range(height)]
+        stack = [(self._root, self._top - top, self._left - left)]
+        while stack:
+            node, node_top, node_left = stack.pop()
+            size = 1 << node.level
+            if not node.population or node_top >= height or node_left >= width or node_top + size <= 0 \
+                    or node_left + size <= 0:
+                continue
+            if node.level == 0:
+                grid[node_top][node_left] = LIVE
+                continue
+            half = size >> 1
+            stack.append((node.nw, node_top, node_left))
+            stack.append((node.ne, node_top, node_left + half))
+            stack.append((node.sw, node_top + half, node_left))
+            stack.append((node.se, node_top + half, node_left + half))
+        return grid
+
+    def _hash(self) -> int:
+        # the Zobrist hash of the other engines: nodes are canonical, so the hash of a node is kept on it
+        # and only has to be moved to where the root is
+        return multiply(self._node_key(self._root), cell_key(self._top, self._left))
+
+    def _node_key(self, node: Node) -> int:
+        if node.key is None:
+            while len(self._shifts) < node.level:
+                side = 1 << len(self._shifts)
+                self._shifts.append((row_key(side), col_key(side), cell_key(side, side)))
+            down, right, diagonal = self._shifts[node.level - 1]
+            node.key = self._node_key(node.nw) ^ multiply(self._node_key(node.ne), right) \
+                ^ multiply(self._node_key(node.sw), down) ^ multiply(self._node_key(node.se), diagonal)
+        return node.key
+
+    def _bounding_box(self) -> BoundingBox | None:
+        # plane coordinates of the outermost live cells, found by descending along the edges of the live subtrees
+        if not self._root.population:
+            return None
+
+        def edge(pick: t.Callable[[Node], tuple[tuple[Node, int], ...]], last: bool) -> int:
+            offset, nodes = 0, [(self._root, 0)]
+            while nodes[0][0].level:
+                half = 1 << (nodes[0][0].level - 1)
+                children = [(child, position + shift * half) for node, position in nodes for child, shift in pick(node)]
+                children = [child for child in children if child[0].population]
+                extreme = (max if last else min)(position for _, position in children)
+                nodes = [child for child in children if child[1] == extreme]
+                offset = extreme
+            return offset
+
+        return BoundingBox(
+            top=self._top + edge(lambda node: ((node.nw, 0), (node.ne, 0), (node.sw, 1), (node.se, 1)), False),
+            left=self._left + edge(lambda node: ((node.nw, 0), (node.sw, 0), (node.ne, 1), (node.se, 1)), False),
+            bottom=self._top + edge(lambda node: ((node.nw, 0), (node.ne, 0), (node.sw, 1), (node.se, 1)), True),
+            right=self._left + edge(lambda node: ((node.nw, 0), (node.sw, 0), (node.ne, 1), (node.se, 1)), True),
+        )
+
+    def update(self):
+        self.advance(1)
+
+    def advance(self, generations: int):
+        if generations < 0:
+            raise ValueError('Hashlife can not go back in time')
+        if not generations:
+            return
+        if self._results_rule != self.rule:
+            self._results, self._results_rule = {}, self.rule
+        remaining, step = generations, 0
+        while remaining:
+            if remaining & 1:
+                self._step(step)
+                if len(self._nodes) > self.max_nodes:
+                    self.collect_garbage()
+            remaining >>= 1
+            step += 1
+        # jumps of many generations at once never see the generations in between, so births and deaths are unknown
+        self._record(
+            None, None, self._bounding_box(),
+            population=self._root.population, generations=generations, hash_delta=self._hash() ^ self.board_hash,
+        )
+
+    def collect_garbage(self):
+        """Drop nodes and memoised results unreachable from the current universe."""
+        reachable = {id(node) for node in self._empty}
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if id(node) in reachable:
+                continue
+            reachable.add(id(node))
+            if node.level:
+                stack.extend((node.nw, node.ne, node.sw, node.se))
+        self._nodes = {key: node for key, node in self._nodes.items() if id(node) in reachable}
+        self._results = {
+            key: result for key, result in self._results.items()
+            if id(key[0]) in reachable and id(result) in reachable
+        }
+        self._collections += 1
+
+    def _join(self, nw: Node, ne: Node, sw: Node, se: Node) -> Node:
+        key = (nw, ne, sw, se)
+        node = self._nodes.get(key)
+        if node is None:
+            node = self._nodes[key] = Node(nw, ne, sw, se)
+        return node
+
+    def _empty_node(self, level: int) -> Node:
+        while len(self._empty) <= level:
+            smaller = self._empty[-1]
+            self._empty.append(self._join(smaller, smaller, smaller, smaller))
+        return self._empty[level]
+
+    def _build(self, grid: list[list[int]], top: int, left: int, level: int) -> Node:
+        # pylint: disable = too-many-arguments, too-many-positional-arguments
+        if top >= self._height or left >= self._width:
+            return self._empty_node(level)
+        if level == 0:
+            return LIVE_CELL if grid[top][left] == LIVE else DEAD_CELL
+        half = 1 << (level - 1)
+        return self._join(
+            self._build(grid, top, left, level - 1),
+            self._build(grid, top, left + half, level - 1),
+            self._build(grid, top + half, left, level - 1),
+            self._build(grid, top + half, left + half, level - 1),
+        )
+
+    def _centre(self, node: Node) -> Node:
+        # the same node one level up, surrounded by dead cells
+        empty = self._empty_node(node.level - 1)
+        return self._join(
+            self._join(empty, empty, empty, node.nw),
+            self._join(empty, empty, node.ne, empty),
+            self._join(empty, node.sw, empty, empty),
+            self._join(node.se, empty, empty, empty),
+        )
+
+    @staticmethod
+    def _is_padded(node: Node) -> bool:
+        # every live cell is within the central half of the node
+        return node.nw.population == node.nw.se.population \
+            and node.ne.population == node.ne.sw.population \
+            and node.sw.population == node.sw.ne.population \
+            and node.se.population == node.se.nw.population
+
+    def _expand(self):
+        half = 1 << (self._root.level - 1)
+        self._root = self._centre(self._root)
+        self._top -= half
+        self._left -= half
+
+    def _step(self, step: int):
+        # advance the universe by 2 ** step generations
+        while self._root.level < step + 2 or not self._is_padded(self._root):
+            self._expand()
+        # one more ring, so that the pattern can not outgrow the successor
+        self._expand()
+        quarter = 1 << (self._root.level - 2)
+        self._root = self._successor(self._root, step)
+        self._top += quarter
+        self._left += quarter
+
+    def _successor(self, node: Node, step: int) -> Node:
+        """Centre of the node (one level down) advanced by ``2 ** step`` generations."""
+        if not node.population:
+            return self._empty_node(node.level - 1)
+        step = min(step, node.level - 2)
+        key = (node, step)
+        result = self._results.get(key)
+        if result is not None:
+            self._hits += 1
+            return result
+        self._misses += 1
+        if node.level == 2:
+            result = self._life_4x4(node)
+        else:
+            result = self._successor_of_quadrants(node, step)
+        self._results[key] = result
+        return result
+
+    def _successor_of_quadrants(self, node: Node, step: int) -> Node:
+        # pylint: disable = too-many-locals
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+        # nine overlapping sub-squares of half the size, each advanced by up to half of the requested time
+        c1 = self._successor(nw, step)
+        c2 = self._successor(self._join(nw.ne, ne.nw, nw.se, ne.sw), step)
+        c3 = self._successor(ne, step)
+        c4 = self._successor(self._join(nw.sw, nw.se, sw.nw, sw.ne), step)
+        c5 = self._successor(self._join(nw.se, ne.sw, sw.ne, se.nw), step)
+        c6 = self._successor(self._join(ne.sw, ne.se, se.nw, se.ne), step)
+        c7 = self._successor(sw, step)
+        c8 = self._successor(self._join(sw.ne, se.nw, sw.se, se.sw), step)
+        c9 = self._successor(se, step)
+        if step < node.level - 2:
+            # the requested time is already spent, only the centre needs to be stitched together
+            return self._join(
+                self._join(c1.se, c2.sw, c4.ne, c5.nw),
+                self._join(c2.se, c3.sw, c5.ne, c6.nw),
+                self._join(c4.se, c5.sw, c7.ne, c8.nw),
+                self._join(c5.se, c6.sw, c8.ne, c9.nw),
+            )
+        return self._join(
+            self._successor(self._join(c1, c2, c4, c5), step),
+            self._successor(self._join(c2, c3, c5, c6), step),
+            self._successor(self._join(c4, c5, c7, c8), step),
+            self._successor(self._join(c5, c6, c8, c9), step),
+        )
+
+    def _life_4x4(self, node: Node) -> Node:
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+        # 4x4 block as a bit mask, read row by row from the least significant bit
+        cells = (
+            nw.nw, nw.ne, ne.nw, ne.ne,
+            nw.sw, nw.se, ne.sw, ne.se,
+            sw.nw, sw.ne, se.nw, se.ne,
+            sw.sw, sw.se, se.sw, se.se,
+        )
+        block = sum(cell.population << position for position, cell in enumerate(cells))
+        mask_table = self.rule.mask_table
+
+        def next_cell(row: int, col: int) -> Node:
+            # 3x3 neighbourhood around (row, col) picked out of the block row by row
+            top = (row - 1) * 4 + col - 1
+            mask = (block >> top & 0b111) | (block >> (top + 4) & 0b111) << 3 | (block >> (top + 8) & 0b111) << 6
+            return LIVE_CELL if mask_table[mask] else DEAD_CELL
+
+        return self._join(next_cell(1, 1), next_cell(1, 2), next_cell(2, 1), next_cell(2, 2))
@@ -0,0 +1,230 @@
+import typing as t
+
+from pygames.game_of_life.cycles import byte_positions, cell_key, col_key, col_keys, multiply, row_key, row_keys
+from pygames.game_of_life.game_of_life import GameOfLife, LIVE, DEAD, Run
+from pygames.game_of_life.rules import COUNTS, CONWAY, Rule
+from pygames.game_of_life.stats import BoundingBox
+
+CHUNK_SIZE = 16
+
+Chunk = tuple[int, int]
+
+# keys of the cells of the chunk at the origin, those of any other chunk are the same shifted by its corner
+CHUNK_KEYS = tuple(multiply(row, col) for row in row_keys(CHUNK_SIZE) for col in col_keys(CHUNK_SIZE))
+
+
+class SparseGameOfLife(GameOfLife):  # pylint: disable = too-many-instance-attributes
+    """Game of Life on the unbounded plane stored as a dictionary of fixed-size chunks.
+
+    Only chunks holding live cells are kept: a chunk is allocated as soon as activity spills into it
+    and dropped once all of its cells are dead, so memory follows the live region.
+    `state` is the ``height x width`` window at `origin`, use `region` to look elsewhere;
+    `boundaries` has no effect on this engine.
+    """
+    UNBOUNDED = True
+
+    def __init__(self, height: int = 10, width: int = 10, boundaries: bool = False, rule: str | Rule = CONWAY):
+        self.chunks: dict[Chunk, bytearray] = {}
+        # plane coordinates of the top left corner of `state`
+        self.origin = (0, 0)
+        stride = CHUNK_SIZE + 2
+        # one chunk with a one-cell border borrowed from its neighbours
+        self._padded = bytearray(stride * stride)
+        self._offsets = (-stride - 1, -stride, -stride + 1, -1, 1, stride - 1, stride, stride + 1)
+        self._rows = [range(row * stride + 1, row * stride + 1 + CHUNK_SIZE) for row in range(1, CHUNK_SIZE + 1)]
+        self._dead_chunk = bytes(CHUNK_SIZE * CHUNK_SIZE)
+        # keys of the top rows and left columns of chunks, by chunk row and chunk column
+        self._chunk_row_keys: dict[int, int] = {}
+        self._chunk_col_keys: dict[int, int] = {}
+        super().__init__(height=height, width=width, boundaries=boundaries, rule=rule)
+
+    @property
+    def state(self) -> list[list[int]]:
+        return self.region(*self.origin, self._height, self._width)
+
+    @state.setter
+    def state(self, value: list[list[int]]):
+        if value != [[]] and (len(value) != self._height or any(len(row) != self._width for row in value)):
+            raise ValueError(f'State must be of size {self._height}x{self._width}')
+        # every live cell is a run of its own
+        self.load_runs(
+            (row, col, 1) for row, cells in enumerate(value) for col, cell in enumerate(cells) if cell == LIVE
+        )
+
+    def load_runs(self, runs: t.Iterable[Run]):
+        self.chunks = {}
+        top, left = self.origin
+        for row, col, length in runs:
+            chunk_row, cell_row = divmod(top + row, CHUNK_SIZE)
+            col += left
+            # a run may cross several chunks
+            while length > 0:
+                chunk_col, cell_col = divmod(col, CHUNK_SIZE)
+                span = min(length, CHUNK_SIZE - cell_col)
+                chunk = self.chunks.get((chunk_row, chunk_col))
+                if chunk is None:
+                    chunk = self.chunks[chunk_row, chunk_col] = bytearray(CHUNK_SIZE * CHUNK_SIZE)
+                start = cell_row * CHUNK_SIZE + cell_col
+                chunk[start:start + span] = bytes([LIVE]) * span
+                col += span
+                length -= span
+        self._reload()
+
+    def _reload(self):
+        board_hash = 0
+        for key, chunk in self.chunks.items():
+            board_hash ^= self._chunk_hash(key, int.from_bytes(chunk))
+        self._loaded(sum(chunk.count(LIVE) for chunk in self.chunks.values()), self._bounding_box(), board_hash)
+
+    def _chunk_hash(self, key: Chunk, bits: int) -> int:
+        # XOR of the keys of the cells set in a chunk read as an integer
+        chunk_hash = 0
+        for index in byte_positions(bits, CHUNK_SIZE * CHUNK_SIZE):
+            chunk_hash ^= CHUNK_KEYS[index]
+        if not chunk_hash:
+            return 0
+        chunk_row, chunk_col = key
+        if (row := self._chunk_row_keys.get(chunk_row)) is None:
+            row = self._chunk_row_keys[chunk_row] = row_key(chunk_row * CHUNK_SIZE)
+        if (col := self._chunk_col_keys.get(chunk_col)) is None:
+            col = self._chunk_col_keys[chunk_col] = col_key(chunk_col * CHUNK_SIZE)
+        return multiply(multiply(chunk_hash, row), col)
+
+    def _bounding_box(self) -> BoundingBox | None:
+        # only the chunks on the outer rows and columns of chunks can hold the outermost cells
+        if not self.chunks:
+            return None
+        size, chunks = CHUNK_SIZE, self.chunks
+        top = min(chunk_row for chunk_row, _ in chunks)
+        bottom = max(chunk_row for chunk_row, _ in chunks)
+        left = min(chunk_col for _, chunk_col in chunks)
+        right = max(chunk_col for _, chunk_col in chunks)
+        return BoundingBox(
+            top=top * size + min(
+                chunk.find(LIVE) // size for (chunk_row, _), chunk in chunks.items() if chunk_row == top
+            ),
+            left=left * size + min(
+                next(col for col in range(size) if LIVE in chunk[col::size])
+                for (_, chunk_col), chunk in chunks.items() if chunk_col == left
+            ),
+            bottom=bottom * size + max(
+                chunk.rfind(LIVE) // size for (chunk_row, _), chunk in chunks.items() if chunk_row == bottom
+            ),
+            right=right * size + max(
+                next(col for col in reversed(range(size)) if LIVE in chunk[col::size])
+                for (_, chunk_col), chunk in chunks.items() if chunk_col == right
+            ),
+        )
+
+    def set_cell(self, row: int, col: int, value: int):
+        chunk_row, cell_row = divmod(row, CHUNK_SIZE)
+        chunk_col, cell_col = divmod(col, CHUNK_SIZE)
+        key = (chunk_row, chunk_col)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            if value == DEAD:
+                return
+            chunk = self.chunks[key] = bytearray(CHUNK_SIZE * CHUNK_SIZE)
+        index = cell_row * CHUNK_SIZE + cell_col
+        if (value == LIVE) != (chunk[index] == LIVE):
+            self._population += 1 if value == LIVE else -1
+            self.board_hash ^= cell_key(row, col)
+            # the bounding box only grows here, a killed cell leaves it loose until the next generation
+            box = self.stats.bounding_box
+            if value == LIVE:
+                box = BoundingBox(
+                    min(box.top, row), min(box.left, col), max(box.bottom, row), max(box.right, col)
+                ) if box else BoundingBox(row, col, row, col)
+            self.stats = self.stats._replace(
+                population=self._population, bounding_box=box, density=self._density(self._population, box)
+            )
+        chunk[index] = value
+        if value == DEAD and chunk.count(LIVE) == 0:
+            del self.chunks[key]
+
+    def region(self, top: int, left: int, height: int, width: int) -> list[list[int]]:
+        grid = [[DEAD] * width for _ in range(height)]
+        for chunk_row in range(top // CHUNK_SIZE, (top + height - 1) // CHUNK_SIZE + 1):
+            for chunk_col in range(left // CHUNK_SIZE, (left + width - 1) // CHUNK_SIZE + 1):
+                chunk = self.chunks.get((chunk_row, chunk_col))
+                if chunk is None:
+                    continue
+                for cell_row in range(CHUNK_SIZE):
+                    row = chunk_row * CHUNK_SIZE + cell_row - top
+                    if not 0 <= row < height:
+                        continue
+                    first_col = chunk_col * CHUNK_SIZE - left
+                    start, stop = max(0, -first_col), min(CHUNK_SIZE, width - first_col)
+                    offset = cell_row * CHUNK_SIZE
+                    grid[row][first_col + start:first_col + stop] = chunk[offset + start:offset + stop]
+        return grid
+
+    def _candidates(self) -> set[Chunk]:
+        # live chunks, plus the neighbours that live cells on their edges can spill into
+        last = CHUNK_SIZE - 1
+        candidates = set(self.chunks)
+        for (chunk_row, chunk_col), chunk in self.chunks.items():
+            top = LIVE in chunk[:CHUNK_SIZE]
+            bottom = LIVE in chunk[last * CHUNK_SIZE:]
+            left = LIVE in chunk[::CHUNK_SIZE]
+            right = LIVE in chunk[last::CHUNK_SIZE]
+            for delta_row, vertical in ((-1, top), (0, True), (1, bottom)):
+                for delta_col, horizontal in ((-1, left), (0, True), (1, right)):
+                    if vertical and horizontal:
+                        candidates.add((chunk_row + delta_row, chunk_col + delta_col))
+        return candidates
+
+    def _fill_padded(self, key: Chunk):
+        # pylint: disable = too-many-locals
+        size, stride, padded = CHUNK_SIZE, CHUNK_SIZE + 2, self._padded
+        last = size - 1
+        chunk_row, chunk_col = key
+
+        def neighbour(delta_row: int, delta_col: int) -> bytes | bytearray:
+            return self.chunks.get((chunk_row + delta_row, chunk_col + delta_col), self._dead_chunk)
+
+        centre = neighbour(0, 0)
+        for cells in self._rows:
+            offset = (cells.start // stride - 1) * size
+            padded[cells.start:cells.stop] = centre[offset:offset + size]
+        bottom = (size + 1) * stride
+        padded[1:size + 1] = neighbour(-1, 0)[last * size:]
+        padded[bottom + 1:bottom + size + 1] = neighbour(1, 0)[:size]
+        padded[stride:bottom:stride] = neighbour(0, -1)[last::size]
+        padded[stride + size + 1:bottom + size + 1:stride] = neighbour(0, 1)[::size]
+        padded[0] = neighbour(-1, -1)[-1]
+        padded[size + 1] = neighbour(-1, 1)[last * size]
+        padded[bottom] = neighbour(1, -1)[last]
+        padded[bottom + size + 1] = neighbour(1, 1)[0]
+
+    def _step_chunk(self, table: bytes) -> bytearray:
+        # pylint: disable = too-many-locals
+        padded = self._padded
+        north_west, north, north_east, west, east, south_west, south, south_east = self._offsets
+        following = bytearray(CHUNK_SIZE * CHUNK_SIZE)
+        position = 0
+        for row in self._rows:
+            for index in row:
+                total = padded[index + north_west] + padded[index + north] + padded[index + north_east] \
+                    + padded[index + west] + padded[index + east] \
+                    + padded[index + south_west] + padded[index + south] + padded[index + south_east]
+                following[position] = table[padded[index] * COUNTS + total]
+                position += 1
+        return following
+
+    def update(self):
+        table = self.rule.table
+        chunks: dict[Chunk, bytearray] = {}
+        births = deaths = hash_delta = 0
+        for key in self._candidates():
+            self._fill_padded(key)
+            following = self._step_chunk(table)
+            # cells are single bytes holding 0 or 1, so a chunk read as an integer has one bit per cell
+            old, new = int.from_bytes(self.chunks.get(key, self._dead_chunk)), int.from_bytes(following)
+            births += (new & ~old).bit_count()
+            deaths += (old & ~new).bit_count()
+            hash_delta ^= self._chunk_hash(key, old ^ new)
+            if new:
+                chunks[key] = following
+        self.chunks = chunks
+        self._record(births, deaths, self._bounding_box(), hash_delta=hash_delta)
@@ -0,0 +1,252 @@
+import multiprocessing as mp
+import os
+import typing as t
+import weakref
+from multiprocessing import shared_memory
+from multiprocessing.connection import Connection
+
+import numpy as np
+
+from pygames.game_of_life.cycles import col_keys, row_keys
+from pygames.game_of_life.engines.vectorized import apply_rule, bounding_box, hash_cells, neighbour_counts
+from pygames.game_of_life.game_of_life import GameOfLife, LIVE, Run
+from pygames.game_of_life.rules import CONWAY, Rule
+from pygames.game_of_life.stats import BoundingBox
+
+# every tile holds two generations, each with a halo row above and below its own rows
+PARITIES = 2
+
+
+def tile_bounds(height: int, tiles: int) -> list[tuple[int, int]]:
+    base, extra = divmod(height, tiles)
+    bounds, start = [], 0
+    for tile in range(tiles):
+        stop = start + base + (tile < extra)
+        bounds.append((start, stop))
+        start = stop
+    return bounds
+
+
+def tile_views(memory: shared_memory.SharedMemory, rows: int, width: int) -> np.ndarray:
+    return np.ndarray((PARITIES, rows + 2, width), dtype=np.uint8, buffer=memory.buf)
+
+
+def step_tile(current: np.ndarray, following: np.ndarray, padded: np.ndarray, boundaries: bool, table: bytes):
+    # pylint: disable = too-many-arguments, too-many-positional-arguments
+    # halo rows are already in place, only the columns need a ghost border
+    padded[:, 1:-1] = current
+    if boundaries:
+        padded[:, 0] = padded[:, -1] = 0
+    else:
+        padded[:, 0] = padded[:, -2]
+        padded[:, -1] = padded[:, 1]
+    following[1:-1] = apply_rule(table, current[1:-1], neighbour_counts(padded))
+
+
+def tile_stats(previous: np.ndarray, current: np.ndarray) -> tuple[int, int, int, BoundingBox | None]:
+    # births, deaths, population and bounding box of a tile's rows, halos excluded
+    previous, current = previous[1:-1], current[1:-1]
+    changed = previous != current
+    births = int(np.count_nonzero(changed & (current != 0)))
+    return births, int(np.count_nonzero(changed)) - births, int(np.count_nonzero(current)), bounding_box(current)
+
+
+def _work(index: int, names: list[str], bounds: list[tuple[int, int]], width: int,
+          barrier: t.Any, connection: Connection):  # pragma: nocover
+    # pylint: disable = too-many-arguments, too-many-positional-arguments, too-many-locals
+    # runs in a worker process, coverage can not see it
+    memories = [shared_memory.SharedMemory(name=name) for name in names]
+    tiles = [tile_views(memory, stop - start, width) for memory, (start, stop) in zip(memories, bounds)]
+    tile = tiles[index]
+    above = tiles[(index - 1) % len(tiles)]
+    below = tiles[(index + 1) % len(tiles)]
+    first, last = index == 0, index == len(tiles) - 1
+    start, stop = bounds[index]
+    # keys of the tile's own rows, every worker derives them once
+    keys = (np.array(row_keys(stop - start, start), dtype=np.uint64), np.array(col_keys(width), dtype=np.uint64))
+    padded = np.zeros((tile.shape[1], width + 2), dtype=np.uint8)
+    while (command := connection.recv()) is not None:
+        generations, boundaries, parity, table, flips = command
+        hash_delta = 0
+        for _ in range(generations):
+            current, following = tile[parity], tile[1 - parity]
+            step_tile(current, following, padded, boundaries, table)
+            hash_delta ^= hash_cells(current[1:-1] != following[1:-1], *keys)
+            # halo exchange: own edge rows go to the neighbours' next generation
+            if boundaries and first:
+                following[0] = 0
+            else:
+                above[1 - parity][-1] = following[1]
+            if boundaries and last:
+                following[-1] = 0
+            else:
+                below[1 - parity][0] = following[-2]
+            barrier.wait()
+            parity = 1 - parity
+        # the statistics of the last generation are gathered while the tile is still hot in this process
+        flipped = np.flatnonzero(tile[1 - parity, 1:-1] != tile[parity, 1:-1]) + start * width if flips else None
+        connection.send((parity, tile_stats(tile[1 - parity], tile[parity]), hash_delta, flipped))
+    del tiles, tile, above, below
+    for memory in memories:
+        memory.close()
+
+
+def _shutdown(processes: t.Sequence[mp.process.BaseProcess], connections: t.Sequence[Connection],
+              memories: t.Sequence[shared_memory.SharedMemory]):
+    for connection in connections:
+        try:
+            connection.send(None)
+        except (BrokenPipeError, OSError):  # pragma: nocover
+            pass
+    for process in processes:
+        process.join(timeout=5)
+        if process.is_alive():  # pragma: nocover
+            process.terminate()
+    for memory in memories:
+        memory.close()
+        memory.unlink()
+
+
+class TiledGameOfLife(GameOfLife):  # pylint: disable = too-many-instance-attributes
+    """Game of Life split into horizontal tiles, each updated by its own worker process.
+
+    Tiles live in shared memory together with a halo row above and below.
+    After computing a generation every worker copies its edge rows into the halos of the neighbouring tiles
+    and waits on a barrier, so the only data exchanged between processes is two rows per tile per generation.
+    """
+
+    def __init__(self, height: int = 10, width: int = 10, boundaries: bool = False, rule: str | Rule = CONWAY,
+                 workers: int | None = None):
+        # pylint: disable = too-many-arguments, too-many-positional-arguments
+        workers = max(1, min(workers or os.cpu_count() or 1, height))
+        self._bounds = tile_bounds(height, workers)
+        self._parity = 0
+        self._halo_boundaries = boundaries
+        self._memories = [
+            shared_memory.SharedMemory(create=True, size=PARITIES * (stop - start + 2) * width)
+            for start, stop in self._bounds
+        ]
+        self._tiles = [
+            tile_views(memory, stop - start, width) for memory, (start, stop) in zip(self._memories, self._bounds)
+        ]
+        context = mp.get_context()
+        barrier = context.Barrier(workers)
+        self._connections = []
+        processes = []
+        for index in range(workers):
+            parent_end, child_end = context.Pipe()
+            names = [memory.name for memory in self._memories]
+            process = context.Process(
+                target=_work, args=(index, names, self._bounds, width, barrier, child_end), daemon=True
+            )
+            process.start()
+            processes.append(process)
+            self._connections.append(parent_end)
+        self._finalizer = weakref.finalize(self, _shutdown, processes, self._connections, self._memories)
+        super().__init__(height=height, width=width, boundaries=boundaries, rule=rule)
+
+    @property
+    def workers(self) -> int:
+        return len(self._tiles)
+
+    def close(self):
+        self._tiles = []
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    @property
+    def board(self) -> np.ndarray:
+        return np.concatenate([tile[self._parity, 1:-1] for tile in self._tiles])
+
+    @property
+    def state(self) -> list[list[int]]:
+        return self.board.tolist()
+
+    @state.setter
+    def state(self, value: list[list[int]]):
+        board = np.zeros((self._height, self._width), dtype=np.uint8)
+        if value != [[]]:
+            board[:] = np.asarray(value, dtype=np.uint8)
+        self._distribute(board)
+
+    def load_runs(self, runs: t.Iterable[Run]):
+        board = np.zeros((self._height, self._width), dtype=np.uint8)
+        for row, col, length in runs:
+            board[row, col:col + length] = LIVE
+        self._distribute(board)
+
+    def _distribute(self, board: np.ndarray):
+        for tile, (start, stop) in zip(self._tiles, self._bounds):
+            tile[self._parity, 1:-1] = board[start:stop]
+        self._fill_halos()
+        keys = np.array(self._row_keys, dtype=np.uint64), np.array(self._col_keys, dtype=np.uint64)
+        self._loaded(int(np.count_nonzero(board)), bounding_box(board), hash_cells(board, *keys))
+
+    def _flip_cells(self, indices: t.Iterable[int]):
+        rows, cols = np.divmod(np.fromiter(indices, dtype=np.int64), self._width)
+        for tile, (start, stop) in zip(self._tiles, self._bounds):
+            inside = (rows >= start) & (rows < stop)
+            tile[self._parity, rows[inside] - start + 1, cols[inside]] ^= LIVE
+        self._fill_halos()
+
+    def _row_cells(self, row: int, start: int, stop: int) -> t.Iterable[int]:
+        for tile, (first, last) in zip(self._tiles, self._bounds):
+            if first <= row < last:
+                return tile[self._parity, row - first + 1, start:stop].tolist()
+        return []
+
+    def _fill_halos(self):
+        # workers keep the halos up to date themselves, unless the board was replaced or its edges changed
+        wraps = not self.boundaries
+        rows = [(tile[self._parity, 1], tile[self._parity, -2]) for tile in self._tiles]
+        for index, tile in enumerate(self._tiles):
+            current = tile[self._parity]
+            current[0] = rows[index - 1][1] if index or wraps else 0
+            current[-1] = rows[(index + 1) % len(rows)][0] if index < len(rows) - 1 or wraps else 0
+        self._halo_boundaries = self.boundaries
+
+    def update(self):
+        self.advance(1)
+
+    def advance(self, generations: int):
+        if generations <= 0:
+            return
+        if not self._tiles:
+            raise RuntimeError('Game is closed')
+        if self._halo_boundaries != self.boundaries:
+            self._fill_halos()
+        # the cells flipped by a single generation are gathered by the workers when they are wanted
+        flips = generations == 1 and self._wants_flips
+        for connection in self._connections:
+            connection.send((generations, self.boundaries, self._parity, self.rule.table, flips))
+        replies = [connection.recv() for connection in self._connections]
+        self._parity = replies[0][0]
+        boxes = [
+            BoundingBox(box.top + start, box.left, box.bottom + start, box.right)
+            for (_, (_, _, _, box), _, _), (start, _) in zip(replies, self._bounds) if box is not None
+        ]
+        hash_delta, flipped = 0, []
+        for _, _, tile_delta, tile_flipped in replies:
+            hash_delta ^= tile_delta
+            if tile_flipped is not None:
+                # tiles are in row order, so the flipped cells come sorted
+                flipped.extend(tile_flipped.tolist())
+        self._record(
+            births=sum(stats[0] for _, stats, _, _ in replies),
+            deaths=sum(stats[1] for _, stats, _, _ in replies),
+            bounding_box=BoundingBox(
+                top=boxes[0].top,
+                left=min(box.left for box in boxes),
+                bottom=boxes[-1].bottom,
+                right=max(box.right for box in boxes),
+            ) if boxes else None,
+            population=sum(stats[2] for _, stats, _, _ in replies),
+            generations=generations,
+            hash_delta=hash_delta,
+            flipped=flipped if flips else None,
+        )
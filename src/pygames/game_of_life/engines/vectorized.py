@@ -0,0 +1,144 @@
+import typing as t
+
+import numpy as np
+
+from pygames.game_of_life.cycles import col_keys, row_keys
+from pygames.game_of_life.game_of_life import GameOfLife, LIVE, DEAD, Run
+from pygames.game_of_life.rules import COUNTS, CONWAY, Rule
+from pygames.game_of_life.stats import BoundingBox
+
+
+def neighbour_counts(padded: np.ndarray) -> np.ndarray:
+    # `padded` carries a one-cell ghost border on every side,
+    # so every neighbour is just a shifted view of the same array
+    return (
+        padded[:-2, :-2] + padded[:-2, 1:-1] + padded[:-2, 2:]
+        + padded[1:-1, :-2] + padded[1:-1, 2:]
+        + padded[2:, :-2] + padded[2:, 1:-1] + padded[2:, 2:]
+    )
+
+
+def apply_rule(table: bytes, board: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    # fancy indexing into the table is several times slower than a handful of comparisons,
+    # so the table is turned into one comparison per neighbour count it mentions
+    alive = board.astype(bool)
+    following = np.zeros(board.shape, dtype=bool)
+    for count in range(COUNTS):
+        born, survives = table[DEAD * COUNTS + count], table[LIVE * COUNTS + count]
+        if born and survives:
+            following |= counts == count
+        elif born:
+            following |= (counts == count) & ~alive
+        elif survives:
+            following |= (counts == count) & alive
+    return following
+
+
+def fill_ghost_border(padded: np.ndarray, boundaries: bool):
+    if boundaries:
+        padded[0, :] = padded[-1, :] = 0
+        padded[:, 0] = padded[:, -1] = 0
+        return
+    padded[0, 1:-1] = padded[-2, 1:-1]
+    padded[-1, 1:-1] = padded[1, 1:-1]
+    padded[:, 0] = padded[:, -2]
+    padded[:, -1] = padded[:, 1]
+
+
+def bounding_box(board: np.ndarray) -> BoundingBox | None:
+    rows = np.flatnonzero(board.any(axis=1))
+    if not rows.size:
+        return None
+    cols = np.flatnonzero(board.any(axis=0))
+    return BoundingBox(int(rows[0]), int(cols[0]), int(rows[-1]), int(cols[-1]))
+
+
+def multiply_keys(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Element-wise `pygames.game_of_life.cycles.multiply` of two ``uint64`` arrays."""
+    # carry-less product split into its low and high 64 bits, one bit of `b` at a time
+    low, high = np.zeros_like(a), np.zeros_like(a)
+    one = np.uint64(1)
+    for bit in range(64):
+        mask = np.uint64(0) - (b >> np.uint64(bit) & one)
+        low ^= (a << np.uint64(bit)) & mask
+        if bit:
+            high ^= (a >> np.uint64(64 - bit)) & mask
+    # x^64 is x^4 + x^3 + x + 1, the bits pushed past 64 by that are folded back once more
+    overflow = high >> np.uint64(60) ^ high >> np.uint64(61) ^ high >> np.uint64(63)
+    for shift in (0, 1, 3, 4):
+        low ^= high << np.uint64(shift) ^ overflow << np.uint64(shift)
+    return low
+
+
+def hash_cells(cells: np.ndarray, rows: np.ndarray, cols: np.ndarray) -> int:
+    """XOR of the keys of the non-zero cells, see `pygames.game_of_life.cycles.cell_key`.
+
+    `rows` and `cols` are the ``uint64`` keys of the rows and columns of `cells`.
+    """
+    # the column keys of each row are reduced first, so that every row is multiplied by its key only once
+    row_hashes = np.bitwise_xor.reduce(np.where(cells, cols, np.uint64(0)), axis=1)
+    return int(np.bitwise_xor.reduce(multiply_keys(rows, row_hashes)))
+
+
+class VectorizedGameOfLife(GameOfLife):
+    """Game of Life stepping the whole board at once with NumPy.
+
+    The board is kept as a ``uint8`` array inside a preallocated buffer with a ghost border,
+    which is refreshed from the opposite edges when the board wraps and zeroed when it does not.
+    """
+
+    def __init__(self, height: int = 10, width: int = 10, boundaries: bool = False, rule: str | Rule = CONWAY):
+        self._padded = np.zeros((height + 2, width + 2), dtype=np.uint8)
+        self._keys = (np.array(row_keys(height), dtype=np.uint64), np.array(col_keys(width), dtype=np.uint64))
+        super().__init__(height=height, width=width, boundaries=boundaries, rule=rule)
+
+    @property
+    def board(self) -> np.ndarray:
+        return self._padded[1:-1, 1:-1]
+
+    @property
+    def state(self) -> list[list[int]]:
+        return self.board.tolist()
+
+    @state.setter
+    def state(self, value: list[list[int]]):
+        board = self.board
+        if value == [[]]:
+            board[:] = 0
+        else:
+            board[:] = np.asarray(value, dtype=np.uint8)
+        self._reload()
+
+    def load_runs(self, runs: t.Iterable[Run]):
+        board = self.board
+        board[:] = 0
+        for row, col, length in runs:
+            board[row, col:col + length] = LIVE
+        self._reload()
+
+    def _reload(self):
+        board = self.board
+        self._loaded(
+            int(np.count_nonzero(board)), bounding_box(board), hash_cells(board, *self._keys)
+        )
+
+    def _flip_cells(self, indices: t.Iterable[int]):
+        rows, cols = np.divmod(np.fromiter(indices, dtype=np.int64), self._width)
+        self.board[rows, cols] ^= LIVE
+
+    def _row_cells(self, row: int, start: int, stop: int) -> t.Iterable[int]:
+        return self.board[row, start:stop].tolist()
+
+    def update(self):
+        fill_ghost_border(self._padded, self.boundaries)
+        board = self.board
+        counts = neighbour_counts(self._padded)
+        following = apply_rule(self.rule.table, board, counts)
+        changed = following != board
+        births = int(np.count_nonzero(changed & following))
+        board[:] = following
+        self._record(
+            births, int(np.count_nonzero(changed)) - births, bounding_box(following),
+            hash_delta=hash_cells(changed, *self._keys),
+            flipped=np.flatnonzero(changed).tolist() if self._wants_flips else None,
+        )
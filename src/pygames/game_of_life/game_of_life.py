@@ -1,27 +1,233 @@
-import copy
 import random
 import sys
 import typing as t
 
+from pygames.game_of_life.cycles import CycleDetector, col_keys, multiply, row_keys
+from pygames.game_of_life.history import History
+from pygames.game_of_life.rules import COUNTS, CONWAY, Rule
+from pygames.game_of_life.stats import BoundingBox, GenerationStats, StatsSink
+
 DEAD = 0
 LIVE = 1
 MIN_SIZE = 3
 
+# ``(row, col, length)`` of a horizontal run of live cells
+Run = tuple[int, int, int]
+# receives the cells ``row * width + col`` flipped by a generation, or None when they are not known one by one
+FlipsSink = t.Callable[[t.Iterable[int] | None], None]
+
 
-class GameOfLife:
+class GameOfLife:  # pylint: disable = too-many-instance-attributes
+    UNBOUNDED = False
 
-    def __init__(self, height: int = 10, width: int = 10, boundaries: bool = False):
+    def __init__(self, height: int = 10, width: int = 10, boundaries: bool = False, rule: str | Rule = CONWAY):
         if height < MIN_SIZE:
             raise ValueError(f'Height of size {height} is too small. Minimal value is {MIN_SIZE}')
         if width < MIN_SIZE:
             raise ValueError(f'Width of size {width} is too small. Minimal value is {MIN_SIZE}')
         self.boundaries = boundaries
+        self.rule = rule
         self._height = height
         self._width = width
-        self.state: list[list[int]] = [[]]
+        # Zobrist keys of the rows and columns, the key of a cell is the product of the two
+        self._row_keys = row_keys(height)
+        self._col_keys = col_keys(width)
+        # receives the statistics of every generation, see `pygames.game_of_life.stats` for ready-made sinks
+        self.stats_sink: StatsSink | None = None
+        # receives the cells flipped by every generation or restored from the history, and None for a new board
+        self.flips_sink: FlipsSink | None = None
+        self.generation = 0
+        self.stats = GenerationStats(0, 0, None, None, None, 0.0)
+        self._population = 0
+        # Zobrist hash of the live cells, updated with the cells flipped by each generation
+        self.board_hash = 0
+        self.cycles = CycleDetector()
+        self._history: History | None = None
+        self.state = [[]]
         while not self.population:
             self.reset_state()
 
+    @property
+    def state(self) -> list[list[int]]:
+        return self._state
+
+    @state.setter
+    def state(self, value: list[list[int]]):
+        self._state = value
+        live = [(row, col) for row, cells in enumerate(value) for col, cell in enumerate(cells) if cell == LIVE]
+        rows, cols = [row for row, _ in live], [col for _, col in live]
+        board_hash = self._hash_cells(row * self._width + col for row, col in live)
+        self._loaded(len(live), BoundingBox(min(rows), min(cols), max(rows), max(cols)) if live else None, board_hash)
+
+    def _hash_cells(self, indices: t.Iterable[int]) -> int:
+        # XOR of the keys of the cells ``row * width + col``: the column keys are gathered row by row,
+        # so every row costs a single multiplication however many of its cells are listed
+        keys, width = self._col_keys, self._width
+        row_hashes: dict[int, int] = {}
+        for index in indices:
+            row, col = divmod(index, width)
+            row_hashes[row] = row_hashes.get(row, 0) ^ keys[col]
+        board_hash = 0
+        for row, row_hash in row_hashes.items():
+            board_hash ^= multiply(self._row_keys[row], row_hash)
+        return board_hash
+
+    def _loaded(self, population: int, bounding_box: BoundingBox | None, board_hash: int):
+        # a new board was put in place, every engine reports it here
+        self.generation = 0
+        self._population = population
+        self.stats = GenerationStats(0, population, None, None, bounding_box, self._density(population, bounding_box))
+        self.board_hash = board_hash
+        self.cycles.reset()
+        self.cycles.push(0, board_hash, (self.boundaries, self.rule))
+        if self._history is not None:
+            self._history.start(0, self._board_bytes())
+        if self.flips_sink is not None:
+            self.flips_sink(None)
+
+    def _record(self, births: int | None, deaths: int | None, bounding_box: BoundingBox | None,
+                population: int | None = None, generations: int = 1, hash_delta: int = 0,
+                flipped: t.Iterable[int] | None = None):
+        # pylint: disable = too-many-arguments, too-many-positional-arguments
+        # every engine reports each computed generation here, keeping the population without recounting it;
+        # `hash_delta` is the XOR of the keys of the cells that flipped, `flipped` their ``row * width + col``
+        self.generation += generations
+        if self._history is not None:
+            self._history.record(self.generation, flipped if generations == 1 else None, self._board_bytes)
+        if self.flips_sink is not None:
+            self.flips_sink(flipped if generations == 1 else None)
+        if population is None:
+            population = self._population + (births or 0) - (deaths or 0)
+        self._population = population
+        self.stats = GenerationStats(
+            self.generation, population, births, deaths, bounding_box, self._density(population, bounding_box)
+        )
+        self.board_hash ^= hash_delta
+        self.cycles.push(self.generation, self.board_hash, (self.boundaries, self.rule))
+        if self.stats_sink is not None:
+            self.stats_sink(self.stats)
+
+    @property
+    def _wants_flips(self) -> bool:
+        # engines that find the flipped cells at a cost only gather them for a history or a sink
+        return self._history is not None or self.flips_sink is not None
+
+    @property
+    def period(self) -> int | None:
+        """Period of the cycle the board has entered, 1 for a still life, ``None`` while it keeps changing."""
+        return self.cycles.period
+
+    @property
+    def history(self) -> History | None:
+        """Recorded past generations to go back to with `step_back` and `seek`; ``None`` keeps no history."""
+        return self._history
+
+    @history.setter
+    def history(self, value: History | None):
+        if value is not None:
+            if self.UNBOUNDED:
+                raise ValueError('History is only kept for bounded boards')
+            value.start(self.generation, self._board_bytes())
+        self._history = value
+
+    def step_back(self):
+        self._restore(self._require_history().step_back())
+
+    def seek(self, generation: int):
+        self._restore(self._require_history().seek(generation))
+
+    def _require_history(self) -> History:
+        if self._history is None:
+            raise ValueError('No history is kept, set `history` first')
+        return self._history
+
+    def _restore(self, cells: bytearray):
+        # only the cells the history flipped change, in the engine and in the population and hash alike;
+        # `cells` is the board of the history, already at the generation restored
+        history = self._require_history()
+        flipped = history.flipped
+        births = sum(cells[index] == LIVE for index in flipped)
+        self.board_hash ^= self._hash_cells(flipped)
+        self._flip_cells(flipped)
+        if self.flips_sink is not None:
+            self.flips_sink(flipped)
+        self._population += 2 * births - len(flipped)
+        bounding_box = self._bounding_box_of(cells)
+        self.stats = GenerationStats(
+            history.generation, self._population, None, None, bounding_box,
+            self._density(self._population, bounding_box),
+        )
+        self._resume_at(history.generation)
+
+    def _flip_cells(self, indices: t.Iterable[int]):
+        # toggle the cells ``row * width + col`` in the engine's storage, engines override it for theirs
+        for index in indices:
+            row, col = divmod(index, self._width)
+            self._state[row][col] ^= LIVE
+
+    def _bounding_box_of(self, cells: bytes | bytearray) -> BoundingBox | None:
+        # bounding box of a board kept row by row, one byte per cell; `find` walks the rows without Python loops
+        first = cells.find(LIVE)
+        if first < 0:
+            return None
+        width = self._width
+        top, bottom = first // width, cells.rfind(LIVE) // width
+        left, right = width, -1
+        for start in range(top * width, (bottom + 1) * width, width):
+            if (col := cells.find(LIVE, start, start + width)) >= 0:
+                left = min(left, col - start)
+                right = max(right, cells.rfind(LIVE, start, start + width) - start)
+        return BoundingBox(top, left, bottom, right)
+
+    def resume_at(self, generation: int):
+        """Carry on from `generation` of an earlier run with the board just loaded; the history restarts there."""
+        self._resume_at(generation)
+        if self._history is not None:
+            self._history.start(generation, self._board_bytes())
+
+    def _resume_at(self, generation: int):
+        # the board just loaded carries on from `generation` of an earlier run
+        self.generation = generation
+        self.stats = self.stats._replace(generation=generation)
+        self.cycles.reset()
+        self.cycles.push(generation, self.board_hash, (self.boundaries, self.rule))
+
+    def _board_bytes(self) -> bytes:
+        # the board row by row, one byte per cell
+        return bytes(cell for row in self.state for cell in row)
+
+    def run_until_stable(self, max_generations: int) -> int | None:
+        """Update until the board cycles or `max_generations` pass, return the period if it cycles."""
+        for _ in range(max_generations):
+            if self.period is not None:
+                break
+            self.update()
+        return self.period
+
+    def _density(self, population: int, bounding_box: BoundingBox | None) -> float:
+        if self.UNBOUNDED:
+            return population / bounding_box.area if bounding_box else 0.0
+        return population / (self._height * self._width)
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def rule(self) -> Rule:
+        return self._rule
+
+    @rule.setter
+    def rule(self, value: str | Rule):
+        value = Rule.parse(value)
+        if self.UNBOUNDED and 0 in value.birth:
+            raise ValueError(f'Rule {value} would fill the whole unbounded plane in one generation')
+        self._rule = value
+
     def reset_state(self):
         self.state = [
             random.choices(
@@ -32,23 +238,35 @@ class GameOfLife:
         ]
 
     def update(self):
-        new_state = copy.deepcopy(self.state)
+        # pylint: disable = too-many-locals
+        state, table = self._state, self.rule.table
+        new_state = []
+        births = deaths = 0
+        flipped = []
+        top, left, bottom, right = self._height, self._width, -1, -1
         for row in range(self._height):
+            new_row = []
             for col in range(self._width):
                 total = sum(
-                    self.state[drow][dcol]
+                    state[drow][dcol]
                     for drow, dcol in self._neighbours(row, col, self.boundaries)
                     if 0 <= drow <= self._height - 1
                     and 0 <= dcol <= self._width - 1
                 )
-
-                if self.state[row][col] == LIVE:
-                    if (total < 2) or (total > 3):
-                        new_state[row][col] = DEAD
-                else:
-                    if total == 3:
-                        new_state[row][col] = LIVE
-        self.state = copy.deepcopy(new_state)
+                cell = state[row][col]
+                new_cell = table[cell * COUNTS + total]
+                new_row.append(new_cell)
+                if new_cell != cell:
+                    births += new_cell
+                    deaths += cell
+                    flipped.append(row * self._width + col)
+                if new_cell == LIVE:
+                    top, bottom = min(top, row), row
+                    left, right = min(left, col), max(right, col)
+            new_state.append(new_row)
+        self._state = new_state
+        bounding_box = BoundingBox(top, left, bottom, right) if bottom >= 0 else None
+        self._record(births, deaths, bounding_box, hash_delta=self._hash_cells(flipped), flipped=flipped)
 
     def _neighbours(self, row: int, col: int, boundaries: bool = True) -> t.Generator[tuple[int, int], None, None]:
         height_boundary = sys.maxsize if boundaries else self._height
@@ -63,6 +281,26 @@ class GameOfLife:
         yield (row + 1) % height_boundary, col % width_boundary
         yield (row + 1) % height_boundary, (col + 1) % width_boundary
 
+    def load_runs(self, runs: t.Iterable[Run]):
+        """Replace the board with the given runs of live cells, written straight into the engine's storage."""
+        state = [[DEAD] * self._width for _ in range(self._height)]
+        for row, col, length in runs:
+            state[row][col:col + length] = [LIVE] * length
+        self.state = state
+
+    def region(self, top: int, left: int, height: int, width: int) -> list[list[int]]:
+        # cells outside of the board are dead
+        grid = [[DEAD] * width for _ in range(height)]
+        start, stop = max(left, 0), min(left + width, self._width)
+        if start < stop:
+            for row in range(max(top, 0), min(top + height, self._height)):
+                grid[row - top][start - left:stop - left] = self._row_cells(row, start, stop)
+        return grid
+
+    def _row_cells(self, row: int, start: int, stop: int) -> t.Iterable[int]:
+        # part of a single row, engines override it to read their storage without building the whole `state`
+        return self._state[row][start:stop]
+
     @property
     def population(self):
-        return sum(sum(cell for cell in row if cell == LIVE) for row in self.state)
+        return self._population
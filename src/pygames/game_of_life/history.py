@@ -0,0 +1,147 @@
+import array
+import itertools
+import sys
+import typing as t
+import zlib
+
+from pygames.game_of_life.cycles import byte_positions
+
+DEFAULT_KEYFRAME_INTERVAL = 64
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+
+class History:  # pylint: disable = too-many-instance-attributes
+    """Past generations of a bounded board, kept as the cells flipped by every generation plus periodic keyframes.
+
+    The board at the cursor `generation` is kept unpacked, so stepping back one generation flips only the cells
+    that changed, and seeking starts from the closest keyframe or the cursor, whichever is nearer.
+    Cells are addressed as ``row * width + col``. Once the history takes more than `max_bytes`,
+    the oldest keyframe is dropped together with the changes leading up to the next one.
+    """
+
+    def __init__(self, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL, max_bytes: int = DEFAULT_MAX_BYTES):
+        if keyframe_interval < 1:
+            raise ValueError('Keyframe interval must be positive')
+        self.keyframe_interval = keyframe_interval
+        self.max_bytes = max_bytes
+        self.generation = 0
+        self._cells = bytearray()
+        # both dictionaries are filled in increasing order of generations, so their first keys are the oldest
+        self._keyframes: dict[int, bytes] = {}
+        # cells flipped on the way from the previous generation to the key
+        self._changes: dict[int, array.array] = {}
+        self._last = 0
+        self._size = 0
+        # cells that differ between the boards before and after the last `step_back` or `seek`
+        self.flipped: t.Collection[int] = ()
+
+    @property
+    def first(self) -> int:
+        return next(iter(self._keyframes))
+
+    @property
+    def last(self) -> int:
+        return self._last
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def start(self, generation: int, cells: bytes):
+        """Forget everything and keep `cells` as the board at `generation`."""
+        self._keyframes, self._changes, self._size = {}, {}, 0
+        self._cells = bytearray(cells)
+        self.generation = self._last = generation
+        self._add_keyframe(generation)
+
+    def record(self, generation: int, flipped: t.Iterable[int] | None, cells: t.Callable[[], bytes]):
+        """Remember a new generation by its `flipped` cells; `cells` is only asked for the whole board when needed.
+
+        Anything recorded after the cursor is dropped first: the board took another way from there.
+        """
+        if self._last >= min(generation, self.generation + 1):
+            self._truncate(min(generation, self.generation + 1))
+        if flipped is not None and generation == self.generation + 1:
+            changes = array.array('I', flipped)
+            board = self._cells
+            for index in changes:
+                board[index] ^= 1
+            self._changes[generation] = changes
+            self._size += sys.getsizeof(changes)
+            keyframe_due = generation - next(reversed(self._keyframes)) >= self.keyframe_interval
+        else:
+            # a jump over several generations, or an engine that can not tell its flips, needs a keyframe
+            self._cells[:] = cells()
+            keyframe_due = True
+        self.generation = self._last = generation
+        if keyframe_due:
+            self._add_keyframe(generation)
+        self._evict()
+
+    def step_back(self) -> bytearray:
+        """Move the cursor one generation back and return the board there."""
+        if self.generation not in self._changes:
+            return self.seek(self.generation - 1)
+        board = self._cells
+        self.flipped = self._changes[self.generation]
+        for index in self.flipped:
+            board[index] ^= 1
+        self.generation -= 1
+        return board
+
+    def seek(self, generation: int) -> bytearray:
+        """Move the cursor to `generation` and return the board there."""
+        if not self.first <= generation <= self.last:
+            raise ValueError(f'Generation {generation} is not in the history')
+        keyframe = max(key for key in self._keyframes if key <= generation)
+        start = self.generation
+        previous = None
+        # walking from the cursor beats unpacking the keyframe whenever the cursor is nearer
+        if abs(generation - start) > generation - keyframe or not self._reachable(start, generation):
+            if not self._reachable(keyframe, generation):
+                raise ValueError(f'Generation {generation} is not in the history')
+            previous = bytes(self._cells)
+            self._cells[:] = zlib.decompress(self._keyframes[keyframe])
+            start = keyframe
+        board = self._cells
+        flipped: set[int] = set()
+        # flips are their own inverse, so the same change sets lead both ways
+        steps = range(start + 1, generation + 1) if generation >= start else range(start, generation, -1)
+        for step in steps:
+            changes = self._changes[step]
+            flipped.symmetric_difference_update(changes)
+            for index in changes:
+                board[index] ^= 1
+        if previous is not None:
+            # the whole board was unpacked, the cells that differ are found at the speed of bytes
+            self.flipped = list(byte_positions(int.from_bytes(previous) ^ int.from_bytes(board), len(board)))
+        else:
+            self.flipped = flipped
+        self.generation = generation
+        return board
+
+    def _reachable(self, start: int, stop: int) -> bool:
+        low, high = sorted((start, stop))
+        return all(step in self._changes for step in range(low + 1, high + 1))
+
+    def _add_keyframe(self, generation: int):
+        keyframe = self._keyframes[generation] = zlib.compress(self._cells, 1)
+        self._size += sys.getsizeof(keyframe)
+
+    def _truncate(self, generation: int):
+        # drop whatever was recorded from `generation` on
+        for key in [key for key in self._keyframes if key >= generation]:
+            self._size -= sys.getsizeof(self._keyframes.pop(key))
+        for key in [key for key in self._changes if key >= generation]:
+            self._size -= sys.getsizeof(self._changes.pop(key))
+        self._last = generation - 1
+
+    def _evict(self):
+        # the segment holding the cursor is never dropped, so the history may stay above its budget
+        while self._size > self.max_bytes and len(self._keyframes) > 1:
+            oldest, following = itertools.islice(self._keyframes, 2)
+            if self.generation < following:
+                break
+            self._size -= sys.getsizeof(self._keyframes.pop(oldest))
+            while self._changes and next(iter(self._changes)) <= following:
+                self._size -= sys.getsizeof(self._changes.pop(next(iter(self._changes))))
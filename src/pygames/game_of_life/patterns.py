@@ -0,0 +1,240 @@
+import contextlib
+import itertools
+import os
+import re
+import typing as t
+
+from pygames.game_of_life.game_of_life import GameOfLife, LIVE, Run
+from pygames.game_of_life.rules import Rule
+from pygames.game_of_life.stats import BoundingBox
+
+READ_SIZE = 64 * 1024
+BAND_HEIGHT = 64
+RLE_LINE_LENGTH = 70
+FORMATS = {'.rle': 'rle', '.cells': 'plaintext', '.txt': 'plaintext'}
+
+_RLE_HEADER = re.compile(
+    r'^x\s*=\s*(?P<width>\d+)\s*,\s*y\s*=\s*(?P<height>\d+)(?:\s*,\s*rule\s*=\s*(?P<rule>[^\s:]+)\S*)?\s*$',
+    re.IGNORECASE,
+)
+_RLE_TOKEN = re.compile(r'(\d*)(\D)')
+_PLAINTEXT_LIVE = re.compile(r'[O*]+')
+_PLAINTEXT_INVALID = re.compile(r'[^.O*\s]')
+
+File = str | os.PathLike | t.IO[str]
+
+
+class PatternInfo(t.NamedTuple):
+    name: str | None = None
+    comments: tuple[str, ...] = ()
+    # size and rule are only known when the file declares them
+    width: int | None = None
+    height: int | None = None
+    rule: Rule | None = None
+
+
+def read_rle(file: t.IO[str]) -> tuple[PatternInfo, t.Iterator[Run]]:
+    """Parse the comment and header lines; the returned runs are parsed lazily from the rest of the file."""
+    name, comments, rule = None, [], None
+    width = height = None
+    line = file.readline()
+    while line:
+        stripped = line.strip()
+        if stripped.startswith('#'):
+            tag, text = stripped[1:2], stripped[2:].strip()
+            if tag == 'N':
+                name = text
+            elif tag in ('C', 'c'):
+                comments.append(text)
+            elif tag == 'r':
+                rule = Rule.parse(text)
+        elif header := _RLE_HEADER.match(stripped):
+            width, height = int(header['width']), int(header['height'])
+            if header['rule']:
+                rule = Rule.parse(header['rule'])
+            line = ''
+            break
+        elif stripped:
+            # no header, the line already holds cells
+            break
+        line = file.readline()
+    return PatternInfo(name, tuple(comments), width, height, rule), _rle_runs(line, file)
+
+
+def _rle_runs(pending: str, file: t.IO[str]) -> t.Iterator[Run]:
+    row = col = 0
+    while True:
+        chunk = file.read(READ_SIZE)
+        # whitespace may split the data anywhere but inside a token, a count cut off by the chunk waits for the rest
+        data = ''.join((pending + chunk).split())
+        body = data.rstrip('0123456789') if chunk else data
+        pending = data[len(body):]
+        for match in _RLE_TOKEN.finditer(body):
+            count, tag = int(match[1] or 1), match[2]
+            if tag in ('b', '.'):
+                col += count
+            elif tag == '$':
+                row, col = row + count, 0
+            elif tag == '!':
+                return
+            elif tag.isalpha():
+                # multi-state patterns name their live states with other letters
+                yield row, col, count
+                col += count
+            else:
+                raise ValueError(f'Unexpected {tag!r} in RLE data')
+        if not chunk:
+            return
+
+
+def read_plaintext(file: t.IO[str]) -> tuple[PatternInfo, t.Iterator[Run]]:
+    name, comments = None, []
+    line = file.readline()
+    while line.startswith('!'):
+        text = line[1:].strip()
+        if text.startswith('Name:'):
+            name = text[len('Name:'):].strip()
+        else:
+            comments.append(text)
+        line = file.readline()
+    return PatternInfo(name, tuple(comments)), _plaintext_runs(line, file)
+
+
+def _plaintext_runs(first: str, file: t.IO[str]) -> t.Iterator[Run]:
+    for row, line in enumerate(itertools.chain([first] if first else [], file)):
+        if invalid := _PLAINTEXT_INVALID.search(line):
+            raise ValueError(f'Unexpected {invalid[0]!r} in plaintext pattern')
+        for match in _PLAINTEXT_LIVE.finditer(line):
+            yield row, match.start(), match.end() - match.start()
+
+
+def load(game: GameOfLife, file: File, top: int = 0, left: int = 0, pattern_format: str | None = None) -> PatternInfo:
+    """Replace the board with a pattern placed with its top left corner at (`top`, `left`).
+
+    The format is taken from the file name unless given as ``'rle'`` or ``'plaintext'``.
+    A rule declared by the pattern becomes the rule of the game once the pattern is loaded.
+    Runs of live cells go from the parser straight into `GameOfLife.load_runs`,
+    so the pattern never exists as a list of lists.
+    """
+    # pylint: disable = too-many-arguments, too-many-positional-arguments
+    reader = _pick(READERS, pattern_format or _format_of(file))
+    with _opened(file, 'r') as stream:
+        info, runs = reader(stream)
+        if not game.UNBOUNDED and info.width is not None and info.height is not None:
+            fits = 0 <= top and top + info.height <= game.height and 0 <= left and left + info.width <= game.width
+            if not fits:
+                raise ValueError(f'Pattern of size {info.height}x{info.width} does not fit the board at {top, left}')
+        try:
+            game.load_runs(_placed(game, runs, top, left))
+        except ValueError:
+            # the runs before the error are already on the board, leave it empty rather than half loaded
+            game.load_runs(())
+            raise
+    if info.rule is not None:
+        game.rule = info.rule
+    return info
+
+
+def _placed(game: GameOfLife, runs: t.Iterable[Run], top: int, left: int) -> t.Iterator[Run]:
+    for row, col, length in runs:
+        row, col = row + top, col + left
+        if not game.UNBOUNDED and not (0 <= row < game.height and 0 <= col and col + length <= game.width):
+            raise ValueError(f'Pattern does not fit the board, cells ({row}, {col}..{col + length - 1}) are outside')
+        yield row, col, length
+
+
+def save(game: GameOfLife, file: File, name: str | None = None, area: BoundingBox | None = None,
+         pattern_format: str | None = None):
+    """Write the live cells within `area`, by default their bounding box.
+
+    The format is taken from the file name unless given as ``'rle'`` or ``'plaintext'``.
+    The board is read in bands of `BAND_HEIGHT` rows, so memory does not grow with its height.
+    """
+    # pylint: disable = too-many-arguments, too-many-positional-arguments
+    writer = _pick(WRITERS, pattern_format or _format_of(file))
+    with _opened(file, 'w') as stream:
+        writer(game, stream, name, area)
+
+
+def rows(game: GameOfLife, area: BoundingBox) -> t.Iterator[list[int]]:
+    width = area.right - area.left + 1
+    for band in range(area.top, area.bottom + 1, BAND_HEIGHT):
+        yield from game.region(band, area.left, min(BAND_HEIGHT, area.bottom + 1 - band), width)
+
+
+def write_rle(game: GameOfLife, file: t.IO[str], name: str | None = None, area: BoundingBox | None = None):
+    area = area or game.stats.bounding_box
+    if name:
+        file.write(f'#N {name}\n')
+    if area is None:
+        file.write(f'x = 0, y = 0, rule = {game.rule}\n!\n')
+        return
+    file.write(f'x = {area.right - area.left + 1}, y = {area.bottom - area.top + 1}, rule = {game.rule}\n')
+    line: list[str] = []
+    line_length = 0
+
+    def emit(count: int, tag: str):
+        nonlocal line_length
+        token = f'{count if count > 1 else ""}{tag}'
+        if line_length + len(token) > RLE_LINE_LENGTH:
+            file.write(''.join(line) + '\n')
+            line.clear()
+            line_length = 0
+        line.append(token)
+        line_length += len(token)
+
+    # row ends are held back, so that empty rows and the end of the pattern collapse into a single token
+    row_ends = 0
+    for cells in rows(game, area):
+        groups = [(cell, len(list(group))) for cell, group in itertools.groupby(cells)]
+        if groups and groups[-1][0] != LIVE:
+            groups.pop()
+        if groups and row_ends:
+            emit(row_ends, '$')
+            row_ends = 0
+        for cell, count in groups:
+            emit(count, 'o' if cell == LIVE else 'b')
+        row_ends += 1
+    emit(1, '!')
+    file.write(''.join(line) + '\n')
+
+
+def write_plaintext(game: GameOfLife, file: t.IO[str], name: str | None = None, area: BoundingBox | None = None):
+    area = area or game.stats.bounding_box
+    if name:
+        file.write(f'!Name: {name}\n')
+    if area is None:
+        return
+    for cells in rows(game, area):
+        file.write(''.join('O' if cell == LIVE else '.' for cell in cells).rstrip('.') + '\n')
+
+
+READERS: dict[str, t.Callable[[t.IO[str]], tuple[PatternInfo, t.Iterator[Run]]]] = {
+    'rle': read_rle,
+    'plaintext': read_plaintext,
+}
+WRITERS: dict[str, t.Callable[[GameOfLife, t.IO[str], str | None, BoundingBox | None], None]] = {
+    'rle': write_rle,
+    'plaintext': write_plaintext,
+}
+
+T = t.TypeVar('T')
+
+
+def _pick(handlers: dict[str, T], pattern_format: str) -> T:
+    if pattern_format not in handlers:
+        raise ValueError(f'Unknown pattern format {pattern_format!r}, expected one of {sorted(handlers)}')
+    return handlers[pattern_format]
+
+
+def _format_of(file: File) -> str:
+    name = file if isinstance(file, (str, os.PathLike)) else getattr(file, 'name', None)
+    if not isinstance(name, (str, os.PathLike)):
+        return 'rle'
+    return FORMATS.get(os.path.splitext(name)[1].lower(), 'rle')
+
+
+def _opened(file: File, mode: str) -> t.ContextManager[t.IO[str]]:
+    if isinstance(file, (str, os.PathLike)):
+        return open(file, mode, encoding='utf-8')  # pylint: disable = consider-using-with
+    return contextlib.nullcontext(file)
@@ -0,0 +1,71 @@
+import dataclasses
+import re
+import typing as t
+
+# a cell has up to 8 neighbours, hence 9 possible neighbour counts
+COUNTS = 9
+# 3x3 neighbourhood masks are read row by row, the centre cell is the fifth bit
+CENTRE_BIT = 1 << 4
+
+NAMED_RULES = {
+    'conway': 'B3/S23',
+    'highlife': 'B36/S23',
+    'seeds': 'B2/S',
+    'day-and-night': 'B3678/S34678',
+    'life-without-death': 'B3/S012345678',
+    'maze': 'B3/S12345',
+    'replicator': 'B1357/S1357',
+    'diamoeba': 'B35678/S5678',
+    '2x2': 'B36/S125',
+    'morley': 'B368/S245',
+}
+
+_BS_NOTATION = re.compile(r'^B(?P<birth>\d*)/S(?P<survival>\d*)$', re.IGNORECASE)
+_SB_NOTATION = re.compile(r'^S(?P<survival>\d*)/B(?P<birth>\d*)$', re.IGNORECASE)
+_NUMERIC_NOTATION = re.compile(r'^(?P<survival>\d*)/(?P<birth>\d*)$')
+
+
+@dataclasses.dataclass(frozen=True)
+class Rule:
+    """Life-like rule, compiled into lookup tables for the engines.
+
+    `table` maps ``state * COUNTS + neighbours`` to the next state of a cell,
+    `mask_table` maps a 3x3 neighbourhood bit mask to the next state of its centre cell.
+    """
+    birth: frozenset[int]
+    survival: frozenset[int]
+    table: bytes = dataclasses.field(init=False, repr=False, compare=False)
+    mask_table: bytes = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if any(count not in range(COUNTS) for count in self.birth | self.survival):
+            raise ValueError(f'Neighbour counts must be within 0..{COUNTS - 1}')
+        table = bytes(
+            [int(count in self.birth) for count in range(COUNTS)]
+            + [int(count in self.survival) for count in range(COUNTS)]
+        )
+        mask_table = bytes(
+            table[bool(mask & CENTRE_BIT) * COUNTS + (mask & ~CENTRE_BIT).bit_count()] for mask in range(1 << 9)
+        )
+        object.__setattr__(self, 'table', table)
+        object.__setattr__(self, 'mask_table', mask_table)
+
+    @classmethod
+    def parse(cls, notation: t.Union[str, 'Rule']) -> 'Rule':
+        """Accept B/S (``B36/S23``), S/B (``S23/B36``) or numeric (``23/36``) notation, or a name from `NAMED_RULES`."""
+        if isinstance(notation, Rule):
+            return notation
+        notation = NAMED_RULES.get(notation.strip().lower(), notation.strip())
+        for pattern in (_BS_NOTATION, _SB_NOTATION, _NUMERIC_NOTATION):
+            if match := pattern.match(notation):
+                return cls(
+                    birth=frozenset(map(int, match['birth'])),
+                    survival=frozenset(map(int, match['survival'])),
+                )
+        raise ValueError(f'Unknown rule {notation!r}, expected B/S notation like "B3/S23"')
+
+    def __str__(self):
+        return f'B{"".join(map(str, sorted(self.birth)))}/S{"".join(map(str, sorted(self.survival)))}'
+
+
+CONWAY = Rule.parse(NAMED_RULES['conway'])
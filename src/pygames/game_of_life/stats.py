@@ -0,0 +1,89 @@
+import csv
+import json
+import os
+import typing as t
+
+
+class BoundingBox(t.NamedTuple):
+    # inclusive coordinates of the outermost live cells
+    top: int
+    left: int
+    bottom: int
+    right: int
+
+    @property
+    def area(self) -> int:
+        return (self.bottom - self.top + 1) * (self.right - self.left + 1)
+
+
+class GenerationStats(t.NamedTuple):
+    """Statistics of a generation, collected while it is computed.
+
+    `births` and `deaths` compare the generation with the one right before it; engines jumping over many
+    generations at once may leave them as ``None``. `density` is the share of live cells on the board,
+    or within the bounding box on the unbounded plane.
+    """
+    generation: int
+    population: int
+    births: int | None
+    deaths: int | None
+    bounding_box: BoundingBox | None
+    density: float
+
+
+StatsSink = t.Callable[[GenerationStats], None]
+
+FIELDS = ('generation', 'population', 'births', 'deaths', 'top', 'left', 'bottom', 'right', 'density')
+
+
+def as_record(stats: GenerationStats) -> dict[str, int | float | None]:
+    box = stats.bounding_box
+    return {
+        'generation': stats.generation,
+        'population': stats.population,
+        'births': stats.births,
+        'deaths': stats.deaths,
+        'top': box.top if box else None,
+        'left': box.left if box else None,
+        'bottom': box.bottom if box else None,
+        'right': box.right if box else None,
+        'density': stats.density,
+    }
+
+
+class _FileSink:
+    def __init__(self, file: str | os.PathLike | t.TextIO):
+        if isinstance(file, (str, os.PathLike)):
+            # pylint: disable = consider-using-with
+            self._file: t.TextIO = open(file, 'w', encoding='utf-8', newline='')
+            self._owned = True
+        else:
+            self._file = file
+            self._owned = False
+
+    def close(self):
+        if self._owned:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+class CsvSink(_FileSink):
+    def __init__(self, file: str | os.PathLike | t.TextIO):
+        super().__init__(file)
+        self._writer = csv.DictWriter(self._file, fieldnames=FIELDS)
+        self._writer.writeheader()
+
+    def __call__(self, stats: GenerationStats):
+        self._writer.writerow(as_record(stats))
+
+
+class JsonLinesSink(_FileSink):
+    def __call__(self, stats: GenerationStats):
+        self._file.write(json.dumps(as_record(stats)) + '\n')
@@ -0,0 +1,210 @@
+import argparse
+import contextlib
+import os
+import random
+import time
+import typing as t
+
+from pygames import animation, stream
+from pygames.game_of_life import checkpoint, engines, patterns
+from pygames.game_of_life import game_of_life as gof
+from pygames.game_of_life.census import soup
+from pygames.game_of_life.rules import CONWAY
+from pygames.game_of_life.stats import CsvSink, JsonLinesSink
+
+DEFAULT_SIZE = 1000
+DEFAULT_GENERATIONS = 1000
+DEFAULT_DENSITY = 0.2
+SNAPSHOT_FORMATS = {'rle': '.rle', 'checkpoint': '.pglc'}
+
+
+class Report(t.NamedTuple):
+    generations: int
+    seconds: float
+    cells: int
+    period: int | None
+    population: int
+
+    @property
+    def generations_per_second(self) -> float:
+        return self.generations / self.seconds if self.seconds else float('inf')
+
+    @property
+    def cells_per_second(self) -> float:
+        return self.cells / self.seconds if self.seconds else float('inf')
+
+
+def run(game: gof.GameOfLife, generations: int, until_stable: bool = False,
+        every: t.Callable[[gof.GameOfLife], None] | None = None) -> Report:
+    """Step `game` as fast as it goes, calling `every` after each generation."""
+    start_generation = game.generation
+    start = time.perf_counter()
+    for _ in range(generations):
+        if until_stable and game.period is not None:
+            break
+        game.update()
+        if every is not None:
+            every(game)
+    seconds = time.perf_counter() - start
+    done = game.generation - start_generation
+    return Report(done, seconds, done * game.height * game.width, game.period, game.population)
+
+
+def scaling(workers: t.Sequence[int], height: int, width: int, generations: int, seed: int | None = None,
+            density: float = DEFAULT_DENSITY) -> list[tuple[int, Report]]:
+    """Step the same soup on the tiled engine once for every number of `workers`, to see how it scales with cores."""
+    # pylint: disable = too-many-arguments, too-many-positional-arguments, import-outside-toplevel
+    # the tiled engine needs NumPy, which is only imported once it is asked for
+    from pygames.game_of_life.engines.tiled import TiledGameOfLife
+    runs = list(soup(height, width, density, random.Random(seed)))
+    reports = []
+    for count in workers:
+        with TiledGameOfLife(height=height, width=width, workers=count) as game:
+            game.load_runs(runs)
+            reports.append((game.workers, run(game, generations)))
+    return reports
+
+
+def parse_args(argv: t.Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog='game-of-life-batch', description='Run the Game of Life without a terminal and report its throughput.'
+    )
+    parser.add_argument('--height', type=_size, default=DEFAULT_SIZE)
+    parser.add_argument('--width', type=_size, default=DEFAULT_SIZE)
+    parser.add_argument('-n', '--generations', type=_count, default=DEFAULT_GENERATIONS,
+                        help='generations to run at most (default: %(default)s)')
+    parser.add_argument('--until-stable', action='store_true', help='stop once the board enters a cycle')
+    parser.add_argument('--engine', default='numpy', choices=sorted({*engines.ENGINES, *engines.FALLBACKS}))
+    parser.add_argument('--rule', default=str(CONWAY))
+    parser.add_argument('--boundaries', action='store_true',
+                        help='cells beyond the edges are dead instead of wrapping around')
+    parser.add_argument('--seed', type=int, help='seed of the random soup, random when left out')
+    parser.add_argument('--density', type=_density, default=DEFAULT_DENSITY,
+                        help='share of live cells in the random soup (default: %(default)s)')
+    parser.add_argument('--pattern', help='start from an RLE or plaintext pattern instead of a random soup')
+    parser.add_argument('--stats', help='write the statistics of every generation, as CSV or, for .jsonl, JSON lines')
+    parser.add_argument('--snapshots', help='directory to write snapshots of the board to')
+    parser.add_argument('--snapshot-every', type=_count, default=100, metavar='N',
+                        help='generations between snapshots (default: %(default)s)')
+    parser.add_argument('--snapshot-format', choices=sorted(SNAPSHOT_FORMATS), default='rle')
+    parser.add_argument('--animation', help='record every generation to a .gif, or raw RGB frames for .raw/.rgb')
+    parser.add_argument('--scale', type=_count, default=1,
+                        help='pixels per cell of the animation (default: %(default)s)')
+    parser.add_argument('--publish', metavar='SOCKET',
+                        help='publish every generation to viewers connecting to this Unix socket')
+    parser.add_argument('--workers', type=_count, help='processes of the tiled engine (default: one per CPU)')
+    parser.add_argument('--scaling', type=_counts, metavar='N,N,...',
+                        help='run the tiled engine with each number of workers and report the speed-up over the first')
+    args = parser.parse_args(argv)
+    if args.workers is not None and args.engine != 'tiled':
+        parser.error('--workers only applies to the tiled engine')
+    if args.scaling and 'tiled' not in engines.ENGINES:
+        parser.error('--scaling needs the tiled engine, install NumPy')
+    return args
+
+
+def snapshot_writer(directory: str, interval: int, snapshot_format: str) -> t.Callable[[gof.GameOfLife], None]:
+    os.makedirs(directory, exist_ok=True)
+    suffix = SNAPSHOT_FORMATS[snapshot_format]
+
+    def write(game: gof.GameOfLife):
+        if game.generation % interval:
+            return
+        path = os.path.join(directory, f'generation-{game.generation:08d}{suffix}')
+        if snapshot_format == 'checkpoint':
+            checkpoint.save(game, path)
+        else:
+            patterns.save(game, path, pattern_format='rle')
+
+    return write
+
+
+def main(argv: t.Sequence[str] | None = None):
+    args = parse_args(argv)
+    if args.scaling:
+        _report_scaling(args)
+        return
+    options = {'workers': args.workers} if args.workers is not None else {}
+    game = engines.create_game(args.engine, height=args.height, width=args.width, boundaries=args.boundaries,
+                               rule=args.rule, **options)
+    if args.pattern:
+        patterns.load(game, args.pattern)
+    else:
+        game.load_runs(soup(args.height, args.width, args.density, random.Random(args.seed)))
+    callbacks: list[t.Callable[[gof.GameOfLife], None]] = []
+    with contextlib.ExitStack() as stack:
+        if args.snapshots:
+            callbacks.append(snapshot_writer(args.snapshots, args.snapshot_every, args.snapshot_format))
+        if args.animation:
+            writer = stack.enter_context(animation.writer_for(args.animation, args.width, args.height, args.scale))
+            callbacks.append(lambda game: writer.add(animation.life_frame(game)))
+        if args.publish:
+            publisher = stack.enter_context(stream.Publisher(game))
+            publisher.listen(args.publish)
+            callbacks.append(lambda _: publisher.publish())
+        if args.stats:
+            game.stats_sink = stack.enter_context(
+                JsonLinesSink(args.stats) if args.stats.endswith('.jsonl') else CsvSink(args.stats)
+            )
+        for callback in callbacks:
+            callback(game)
+        report = run(game, args.generations, args.until_stable, _every(callbacks))
+    print(f'engine: {type(game).__name__}')
+    print(f'generations: {report.generations}')
+    print(f'seconds: {report.seconds:.3f}')
+    print(f'generations/sec: {report.generations_per_second:.1f}')
+    print(f'cells/sec: {report.cells_per_second:.0f}')
+    print(f'population: {report.population}')
+    print(f'period: {report.period if report.period is not None else "-"}')
+
+
+def _report_scaling(args: argparse.Namespace):
+    reports = scaling(args.scaling, args.height, args.width, args.generations, args.seed, args.density)
+    print(f'cpus: {os.cpu_count()}')
+    baseline = reports[0][1].generations_per_second
+    for workers, report in reports:
+        print(f'workers: {workers}, generations/sec: {report.generations_per_second:.2f}, '
+              f'speed-up: {report.generations_per_second / baseline:.2f}')
+
+
+def _every(callbacks: list[t.Callable[[gof.GameOfLife], None]]) -> t.Callable[[gof.GameOfLife], None] | None:
+    if len(callbacks) < 2:
+        return callbacks[0] if callbacks else None
+
+    def every(game: gof.GameOfLife):
+        for callback in callbacks:
+            callback(game)
+
+    return every
+
+
+def _size(value: str) -> int:
+    size = int(value)
+    if size < gof.MIN_SIZE:
+        raise argparse.ArgumentTypeError(f'must be at least {gof.MIN_SIZE}')
+    return size
+
+
+def _count(value: str) -> int:
+    count = int(value)
+    if count < 1:
+        raise argparse.ArgumentTypeError('must be positive')
+    return count
+
+
+def _counts(value: str) -> list[int]:
+    try:
+        return [_count(count) for count in value.split(',')]
+    except ValueError as error:
+        raise argparse.ArgumentTypeError('must be positive numbers separated by commas') from error
+
+
+def _density(value: str) -> float:
+    density = float(value)
+    if not 0 <= density <= 1:
+        raise argparse.ArgumentTypeError('must be between 0 and 1')
+    return density
+
+
+if __name__ == '__main__':  # pragma: nocover
+    main()
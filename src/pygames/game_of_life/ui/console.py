@@ -1,8 +1,16 @@
+import argparse
+import sys
+import typing as t
 from functools import partial
 
 import blessed
 
+from pygames.game_of_life import engines
 from pygames.game_of_life import game_of_life as gof
+from pygames.game_of_life.history import History
+from pygames.game_of_life.ui.frame import FrameBuffer
+from pygames.game_of_life.ui.glyphs import MODES
+from pygames.game_of_life.ui.viewport import Viewport
 
 display = partial(print, end='', flush=True)
 
@@ -10,14 +18,23 @@ BOUNDARIES_WIDTH = 1
 EXIT_KEYS = ('q', 'Q')
 BOUNDARIES_KEYS = ('b', 'B')
 RESTART_KEYS = ('r', 'R')
-
-
-class TerminalController:  # pylint: disable = too-few-public-methods
+PAUSE_KEYS = ('p', 'P')
+BACK_KEYS = (',', '<')
+FORWARD_KEYS = ('.', '>')
+# a generation number typed in digits, then one of these keys, jumps to that generation
+SEEK_KEYS = ('g', 'G')
+# arrow keys move the view over boards larger than the screen by a quarter of the screen
+PAN_KEYS = {'KEY_UP': (-1, 0), 'KEY_DOWN': (1, 0), 'KEY_LEFT': (0, -1), 'KEY_RIGHT': (0, 1)}
+PAN_SHARE = 4
+STABILITY_WIDTH = 24
+
+
+class TerminalController:  # pylint: disable = too-few-public-methods, too-many-instance-attributes
     DEFAULT_TIMEOUT = 0.02  # seconds
     LIVE_SYMBOL = '*'
     DEAD_SYMBOL = ' '
 
-    def __init__(self, terminal: blessed.Terminal, game: gof.GameOfLife):
+    def __init__(self, terminal: blessed.Terminal, game: gof.GameOfLife, mode: str = 'text'):
         self.term = terminal
         self.width = terminal.width
         self.height = terminal.height - BOUNDARIES_WIDTH * 2
@@ -26,24 +43,83 @@ class TerminalController:  # pylint: disable = too-few-public-methods
         with self.term.cbreak(), self.term.hidden_cursor():
             display(self.term.home + self.term.clear)
         self._old_population = 0
+        self._old_stability = ''
+        self.paused = False
+        self._seek_digits = ''
+        self._frame = FrameBuffer(terminal, top=BOUNDARIES_WIDTH)
+        # several cells may share a character, see `pygames.game_of_life.ui.glyphs`
+        self.mode = MODES[mode]
+        if self.mode.name == 'text':
+            self.mode = self.mode._replace(glyphs=(self.DEAD_SYMBOL, self.LIVE_SYMBOL))
+        top, left = getattr(game, 'origin', (0, 0))
+        view_height, view_width = self.height * self.mode.cell_height, self.width * self.mode.cell_width
+        if not game.UNBOUNDED:
+            # a smaller board is shown whole
+            view_height, view_width = min(view_height, game.height), min(view_width, game.width)
+        self.viewport = Viewport(view_height, view_width, top, left)
+        # bytes sent to the terminal by the last frame
+        self.frame_bytes = 0
+        self._written = 0
 
     def run(self):  # pragma: nocover
         with self.term.cbreak(), self.term.hidden_cursor():
             while (key := self.term.inkey(timeout=self.DEFAULT_TIMEOUT)) not in EXIT_KEYS:
                 self._process_key(key)
                 self._render_screen()
-                self.game.update()
+                if not self.paused:
+                    self.game.update()
 
     def _render_screen(self):
+        # the parts of a frame are buffered and sent to the terminal at once
+        self._written = 0
         self._show_population(self.game.population)
+        self._show_stability(self.game.period)
         self._show_cells()
         self._show_instructions()
+        sys.stdout.flush()
+        self.frame_bytes = self._written
+
+    def _write(self, text: str):
+        print(text, end='')
+        self._written += len(text.encode())
 
     def _process_key(self, key):
         if key in BOUNDARIES_KEYS:
             self.game.boundaries = not self.game.boundaries
         if key in RESTART_KEYS:
             self.game.reset_state()
+        if key in PAUSE_KEYS:
+            self.paused = not self.paused
+        if key in BACK_KEYS:
+            self.paused = True
+            self._go_to(self.game.generation - 1)
+        if key in FORWARD_KEYS:
+            self.paused = True
+            self._go_to(self.game.generation + 1)
+        if (direction := PAN_KEYS.get(getattr(key, 'name', None) or '')) is not None:
+            rows, cols = direction
+            step_rows, step_cols = max(1, self.viewport.height // PAN_SHARE), max(1, self.viewport.width // PAN_SHARE)
+            self.viewport.pan(self.game, rows * step_rows, cols * step_cols)
+        if key.isdigit():
+            self._seek_digits += key
+        elif key in SEEK_KEYS and self._seek_digits:
+            self.paused = True
+            self._go_to(int(self._seek_digits))
+            self._seek_digits = ''
+
+    def _go_to(self, generation: int):
+        # recorded generations come from the history, later ones are computed
+        history = self.game.history
+        if history is None or generation < history.first:
+            return
+        if generation <= history.last:
+            # the history hands over the cells that differ from the shown generation, only those are flipped
+            self.game.seek(generation)
+            return
+        if self.game.generation < history.last:
+            self.game.seek(history.last)
+        while self.game.generation < generation:
+            self.game.update()
 
     def _show_population(self, population):
         old_population_len = len(str(self._old_population))
@@ -52,28 +128,57 @@ class TerminalController:  # pylint: disable = too-few-public-methods
             population = str(population).rjust(old_population_len)
         self._old_population = population
         txt_erase = self.term.move_xy(0, 0)
-        display(txt_erase + f'Population: {population}')
+        self._write(txt_erase + f'Population: {population}')
+
+    def _show_stability(self, period: int | None):
+        # the period comes from the board hashes the game keeps anyway, no board comparison is needed here
+        stability = f'stable (period {period})' if period is not None else ''
+        if stability == self._old_stability:
+            return
+        self._old_stability = stability
+        txt_erase = self.term.move_xy(max(0, self.width - STABILITY_WIDTH), 0)
+        self._write(txt_erase + stability.rjust(STABILITY_WIDTH))
 
     def _show_cells(self):
-        for row_num, row in enumerate(self.game.state):
-            for col_num, cell in enumerate(row):
-                txt_erase = self.term.move_xy(col_num, row_num + BOUNDARIES_WIDTH)
-                symbol = self.LIVE_SYMBOL if cell == gof.LIVE else self.DEAD_SYMBOL
-                display(txt_erase + symbol)
+        # only the characters that changed since the last frame are drawn
+        self._write(self._frame.render(self.mode.render(self.viewport.cells(self.game))))
 
     def _show_instructions(self):
-        txt_erase = self.term.move_xy(0, self.term.height - 1)
+        txt_erase = self.term.move_xy(0, self.term.height - 1) + self.term.clear_eol
         exit_text = 'Exit: "Q"'
+        if self.paused:
+            paused = f'Generation {self.game.generation}{f" -> {self._seek_digits}" if self._seek_digits else ""}'
+            history_keys = ('Resume: "P"', 'Back: "<"', 'Forward: ">"', 'Seek: N "G"')
+            self._write(txt_erase + ', '.join((exit_text, paused) + history_keys))
+            return
         boundaries = f'Toggle boundaries: "B" ({"on" if self.game.boundaries else "off"})'
         restart = 'Restart: "R"'
-        display(txt_erase + ', '.join((exit_text, restart, boundaries)))
+        keys = (exit_text, restart, boundaries, 'Pause: "P"')
+        if self.viewport.larger(self.game):
+            keys += (f'Pan: arrows ({self.viewport.top}, {self.viewport.left})',)
+        self._write(txt_erase + ', '.join(keys))
+
+
+def parse_args(argv: t.Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='game-of-life', description="Conway's Game of Life in the terminal.")
+    parser.add_argument('--mode', choices=list(MODES), default='text',
+                        help='cells per character: text shows one, half two stacked, braille 2x4')
+    parser.add_argument('--height', type=int, help='rows of the board, the screen holds them by default')
+    parser.add_argument('--width', type=int, help='columns of the board, arrow keys pan over larger boards')
+    parser.add_argument('--engine', default='numpy', choices=sorted({*engines.ENGINES, *engines.FALLBACKS}))
+    return parser.parse_args(argv)
 
 
-def main():  # pragma: nocover
+def main(argv: t.Sequence[str] | None = None):  # pragma: nocover
+    args = parse_args(argv)
     term = blessed.Terminal()
-    width, height = term.width, term.height - BOUNDARIES_WIDTH * 2
-    game = gof.GameOfLife(width=width, height=height, boundaries=True)
-    controller = TerminalController(terminal=term, game=game)
+    mode = MODES[args.mode]
+    width = args.width or term.width * mode.cell_width
+    height = args.height or (term.height - BOUNDARIES_WIDTH * 2) * mode.cell_height
+    game = engines.create_game(args.engine, width=width, height=height, boundaries=True)
+    if not game.UNBOUNDED:
+        game.history = History()
+    controller = TerminalController(terminal=term, game=game, mode=args.mode)
     controller.run()
 
 
@@ -0,0 +1,52 @@
+import typing as t
+
+import blessed
+
+Span = tuple[int, int]
+
+
+def changed_spans(old: str, new: str, merge_gap: int = 0) -> list[Span]:
+    """``(start, stop)`` of the runs of characters that differ, runs at most `merge_gap` apart are joined."""
+    spans: list[Span] = []
+    for col, (old_char, new_char) in enumerate(zip(old, new)):
+        if old_char == new_char:
+            continue
+        if spans and col - spans[-1][1] <= merge_gap:
+            spans[-1] = (spans[-1][0], col + 1)
+        else:
+            spans.append((col, col + 1))
+    return spans
+
+
+class FrameBuffer:
+    """The text last drawn to a block of the terminal, turning each new frame into the writes for what changed.
+
+    Every run of changed characters costs a cursor move plus the characters themselves; unchanged characters
+    between two runs are written over again whenever that is shorter than moving the cursor past them.
+    """
+
+    def __init__(self, terminal: blessed.Terminal, top: int = 0, left: int = 0):
+        self.term = terminal
+        self.top = top
+        self.left = left
+        self._rows: list[str] = []
+        # rewriting this many characters costs no more than a cursor move, which grows with the coordinates
+        self.merge_gap = len(terminal.move_xy(terminal.width - 1, terminal.height - 1))
+
+    def render(self, rows: t.Sequence[str]) -> str:
+        """Escape sequences and text turning the last frame into `rows`."""
+        output = []
+        for index, row in enumerate(rows):
+            old = self._rows[index] if index < len(self._rows) else None
+            if old == row:
+                continue
+            spans = changed_spans(old, row, self.merge_gap) if old is not None and len(old) == len(row) \
+                else [(0, len(row))]
+            for start, stop in spans:
+                output.append(self.term.move_xy(self.left + start, self.top + index) + row[start:stop])
+        self._rows = list(rows)
+        return ''.join(output)
+
+    def invalidate(self):
+        """Forget the last frame, e.g. after the screen was cleared, so the next one is drawn in full."""
+        self._rows = []
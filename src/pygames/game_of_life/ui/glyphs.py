@@ -0,0 +1,53 @@
+import typing as t
+
+# bit of every dot of a Braille character, by row and column of the dot
+BRAILLE_DOTS = ((0x01, 0x08), (0x02, 0x10), (0x04, 0x20), (0x40, 0x80))
+BRAILLE_BASE = 0x2800
+HALF_BLOCKS = (' ', '\N{UPPER HALF BLOCK}', '\N{LOWER HALF BLOCK}', '\N{FULL BLOCK}')
+
+
+class RenderMode(t.NamedTuple):
+    """How many cells share a character and which glyph shows each combination of them.
+
+    `glyphs` is indexed by a mask of the live cells of a character, the cell in row ``r`` and column ``c``
+    of the character being bit ``r * cell_width + c``.
+    """
+    name: str
+    cell_height: int
+    cell_width: int
+    glyphs: tuple[str, ...]
+
+    def render(self, rows: t.Sequence[t.Sequence[int]]) -> list[str]:
+        """Lines of glyphs showing `rows` of cells."""
+        height, width = self.cell_height, self.cell_width
+        length = -(-max(map(len, rows), default=0) // width)
+        lines = []
+        for top in range(0, len(rows), height):
+            # every cell is 0 or 1, so shifting the cells of one position in a character by their bit
+            # into a single byte per character never carries into the next character
+            masks = 0
+            for row_offset, row in enumerate(rows[top:top + height]):
+                cells = bytes(row)
+                for col_offset in range(width):
+                    column = cells[col_offset::width]
+                    masks |= int.from_bytes(column.ljust(length, b'\0')) << (row_offset * width + col_offset)
+            lines.append(masks.to_bytes(length).decode('latin-1').translate(self.glyphs))
+        return lines
+
+
+def braille_glyphs() -> tuple[str, ...]:
+    glyphs = []
+    for mask in range(1 << 8):
+        dots = sum(
+            dot for bit, dot in enumerate(dot for row in BRAILLE_DOTS for dot in row) if mask >> bit & 1
+        )
+        # a blank Braille character takes three bytes, a space one
+        glyphs.append(chr(BRAILLE_BASE + dots) if dots else ' ')
+    return tuple(glyphs)
+
+
+MODES = {
+    'text': RenderMode('text', 1, 1, (' ', '*')),
+    'half': RenderMode('half', 2, 1, HALF_BLOCKS),
+    'braille': RenderMode('braille', 4, 2, braille_glyphs()),
+}
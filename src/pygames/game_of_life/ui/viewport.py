@@ -0,0 +1,29 @@
+from pygames.game_of_life import game_of_life as gof
+
+
+class Viewport:
+    """Window of `height` x `width` cells at (`top`, `left`) of the board, the only part read from the engine.
+
+    On a bounded board the window is kept within the board, on the unbounded plane it goes anywhere.
+    """
+
+    def __init__(self, height: int, width: int, top: int = 0, left: int = 0):
+        self.height = height
+        self.width = width
+        self.top = top
+        self.left = left
+
+    def larger(self, game: gof.GameOfLife) -> bool:
+        """Whether the board has cells outside of the window."""
+        return game.UNBOUNDED or game.height > self.height or game.width > self.width
+
+    def pan(self, game: gof.GameOfLife, rows: int, cols: int):
+        self.top += rows
+        self.left += cols
+        if not game.UNBOUNDED:
+            self.top = max(0, min(self.top, game.height - self.height))
+            self.left = max(0, min(self.left, game.width - self.width))
+
+    def cells(self, game: gof.GameOfLife) -> list[list[int]]:
+        # engines read just the window from their storage, so this costs the same on any board size
+        return game.region(self.top, self.left, self.height, self.width)
@@ -0,0 +1,127 @@
+import numpy as np
+
+from pygames.snake.snake import Direction
+
+# actions are indices into this, so the opposite of every action is the action XOR 1
+ACTIONS = (Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT)
+UP, DOWN, LEFT, RIGHT = range(4)
+MOVES = np.array([(0, -1), (0, 1), (-1, 0), (1, 0)], dtype=np.int64)
+BODY, HEAD, FRUIT = range(3)
+FRUIT_REWARD = 1.0
+DEATH_REWARD = -1.0
+
+
+class SnakeBatch:  # pylint: disable = too-many-instance-attributes
+    """`games` games of Snake stepped together, for training agents without any per-game Python code.
+
+    Every game keeps its body as a ring buffer of flat cell indices, ``y * width + x``, with the head at `head`
+    and the tail `length - 1` places before it, plus a plane of the cells its body covers. The rules are those
+    of `pygames.snake.Snake`: reversing is ignored, the tail still holds its cell when the head moves, and a game
+    ends on a wall with `boundaries`, on the body, or once the board is full. Ended games start over by themselves.
+    """
+
+    def __init__(self, games: int, height: int = 10, width: int = 10, boundaries: bool = False,
+                 seed: int | None = None):
+        # pylint: disable = too-many-arguments, too-many-positional-arguments
+        self.games = games
+        self.height = height
+        self.width = width
+        self.boundaries = boundaries
+        self.rng = np.random.default_rng(seed)
+        cells = height * width
+        self._index = np.arange(games)
+        self.body = np.zeros((games, cells), dtype=np.int64)
+        self.head = np.zeros(games, dtype=np.int64)
+        self.length = np.ones(games, dtype=np.int64)
+        self.occupied = np.zeros((games, cells), dtype=bool)
+        self.direction = np.full(games, RIGHT, dtype=np.int64)
+        self.fruit = np.zeros(games, dtype=np.int64)
+        self.score = np.zeros(games, dtype=np.int64)
+        self.done = np.zeros(games, dtype=bool)
+        # scores the games had when they last ended, before they started over
+        self.final_score = np.zeros(games, dtype=np.int64)
+        self.reset()
+
+    def reset(self, games: np.ndarray | None = None):
+        """Start the games selected by the boolean mask `games` over, all of them by default."""
+        selected = self._index if games is None else np.flatnonzero(games)
+        if not selected.size:
+            return
+        center = self.height // 2 * self.width + self.width // 2
+        self.body[selected, 0] = center
+        self.head[selected] = 0
+        self.length[selected] = 1
+        self.occupied[selected] = False
+        self.occupied[selected, center] = True
+        self.direction[selected] = RIGHT
+        self.score[selected] = 0
+        self._place_fruit(selected)
+
+    def step(self, actions: np.ndarray | list[int]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Turn every game to its action and move it one cell.
+
+        Returns the observations after the step, the rewards and which games ended; those are already started
+        over in the observations.
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+        index = self._index
+        self.direction = np.where(actions == self.direction ^ 1, self.direction, actions)
+        cell, wall = self._next_cells()
+        # the tail has not moved on yet, so running into it ends the game too
+        done = wall | self.occupied[index, cell]
+        alive = ~done
+        eaten = alive & (cell == self.fruit)
+
+        moving = np.flatnonzero(alive)
+        self.head[moving] = (self.head[moving] + 1) % self.body.shape[1]
+        self.body[moving, self.head[moving]] = cell[moving]
+        self.occupied[moving, cell[moving]] = True
+        still = np.flatnonzero(alive & ~eaten)
+        tail = self.body[still, (self.head[still] - self.length[still]) % self.body.shape[1]]
+        self.occupied[still, tail] = False
+        self.length[eaten] += 1
+        self.score[eaten] += 1
+        # a full board leaves nowhere for the fruit, which ends the game like `Snake` does
+        done |= eaten & (self.length == self.body.shape[1])
+        self._place_fruit(np.flatnonzero(eaten & ~done))
+
+        rewards = np.where(eaten, FRUIT_REWARD, 0.0)
+        rewards[done] = DEATH_REWARD
+        self.done = done
+        self.final_score[done] = self.score[done]
+        self.reset(done)
+        return self.observe(), rewards, done
+
+    def _next_cells(self) -> tuple[np.ndarray, np.ndarray]:
+        """Cells the heads move to, wrapped around the edges, and which of the moves run into a wall."""
+        width = self.width
+        head_cell = self.body[self._index, self.head]
+        move = MOVES[self.direction]
+        x = head_cell % width + move[:, 0]
+        y = head_cell // width + move[:, 1]
+        if self.boundaries:
+            wall = (x < 0) | (x >= width) | (y < 0) | (y >= self.height)
+        else:
+            wall = np.zeros(self.games, dtype=bool)
+        return y % self.height * width + x % width, wall
+
+    def observe(self) -> np.ndarray:
+        """Planes of the body, the head and the fruit of every game, shaped ``(games, 3, height, width)``."""
+        planes = np.zeros((self.games, 3, self.body.shape[1]), dtype=np.uint8)
+        planes[:, BODY] = self.occupied
+        planes[self._index, HEAD, self.body[self._index, self.head]] = 1
+        planes[self._index, FRUIT, self.fruit] = 1
+        return planes.reshape((self.games, 3, self.height, self.width))
+
+    def cells(self, game: int) -> list[tuple[int, int]]:
+        """The ``(x, y)`` cells of the body of `game`, head first, like `pygames.snake.Snake.body`."""
+        positions = (self.head[game] - np.arange(self.length[game])) % self.body.shape[1]
+        return [(int(cell % self.width), int(cell // self.width)) for cell in self.body[game, positions]]
+
+    def _place_fruit(self, games: np.ndarray):
+        if not games.size:
+            return
+        free = ~self.occupied[games]
+        # the fruit goes on the k-th free cell of each board, for a k drawn per game
+        picks = self.rng.integers(free.sum(axis=1))
+        self.fruit[games] = np.argmax(np.cumsum(free, axis=1) > picks[:, None], axis=1)
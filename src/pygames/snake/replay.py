@@ -0,0 +1,194 @@
+import os
+import random
+import struct
+import typing as t
+import zlib
+
+from pygames.snake.snake import Direction, GameOverException, Snake
+from pygames.stream import read_varints, write_varint
+
+MAGIC = b'PGSR'
+VERSION = 1
+
+# magic, version, flags, height, width, seed, ticks, score, length of the log
+_HEADER = struct.Struct('<4sHHIIQQII')
+_CHECKSUM = struct.Struct('<I')
+_BOUNDARIES = 1
+# codes of the log: the direction of every tick, and what the player did between ticks
+DIRECTIONS = (Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT)
+RESTART = len(DIRECTIONS)
+TOGGLE_BOUNDARIES = RESTART + 1
+_CODE_BITS = 3
+
+Path = str | os.PathLike
+Run = tuple[int, int]
+
+
+class Recording(t.NamedTuple):
+    """A session of Snake: the seed of its generator and the runs of ``(code, count)`` of what happened each tick."""
+    height: int
+    width: int
+    boundaries: bool
+    seed: int
+    runs: list[Run]
+    # the outcome, checked on replay
+    ticks: int
+    score: int
+
+
+class Recorder:
+    """Records a session played on a `Snake` created with ``random.Random(seed)``.
+
+    `tick` is called right before every `Snake.update`, `restart` after every `Snake.reset_state`
+    and `toggle_boundaries` after every change of `Snake.boundaries`.
+    """
+
+    def __init__(self, game: Snake, seed: int):
+        self.game = game
+        self.seed = seed
+        self.boundaries = game.boundaries
+        self.ticks = 0
+        self._runs: list[Run] = []
+
+    @classmethod
+    def new_game(cls, height: int, width: int, boundaries: bool = False, seed: int | None = None) -> 'Recorder':
+        seed = random.getrandbits(64) if seed is None else seed
+        return cls(Snake(height=height, width=width, boundaries=boundaries, rng=random.Random(seed)), seed)
+
+    def tick(self):
+        self.ticks += 1
+        self._add(DIRECTIONS.index(self.game.direction))
+
+    def restart(self):
+        self._add(RESTART)
+
+    def toggle_boundaries(self):
+        self._add(TOGGLE_BOUNDARIES)
+
+    def _add(self, code: int):
+        if self._runs and self._runs[-1][0] == code:
+            self._runs[-1] = (code, self._runs[-1][1] + 1)
+        else:
+            self._runs.append((code, 1))
+
+    def recording(self) -> Recording:
+        return Recording(self.game.height, self.game.width, self.boundaries, self.seed,
+                         list(self._runs), self.ticks, self.game.score)
+
+
+def new_game(recording: Recording) -> Snake:
+    """The game as `recording` started, to play it again on."""
+    return Snake(height=recording.height, width=recording.width, boundaries=recording.boundaries,
+                 rng=random.Random(recording.seed))
+
+
+def replay(recording: Recording, every: t.Callable[[Snake], None] | None = None) -> Snake:
+    """Play `recording` again on a new game, calling `every` after each tick; returns the game as it ended.
+
+    Raises ValueError when the game does not follow the recording, e.g. ends before its last tick.
+    """
+    game = new_game(recording)
+    over = False
+    for code, count in recording.runs:
+        if code in (RESTART, TOGGLE_BOUNDARIES):
+            if _apply_event(game, code, count):
+                over = False
+            continue
+        if over:
+            raise ValueError('The recording goes on after the game is over')
+        game.direction = DIRECTIONS[code]
+        update = game.update
+        remaining = count
+        try:
+            while remaining:
+                remaining -= 1
+                update()
+                if every is not None:
+                    every(game)
+        except GameOverException:
+            if remaining:
+                raise ValueError('The game is over before the recording') from None
+            over = True
+            if every is not None:
+                every(game)
+    return game
+
+
+def verify(recording: Recording) -> bool:
+    """Whether replaying `recording` plays its number of ticks and ends with its score."""
+    # every tick of the log is played, `replay` raises when the game ends before them
+    ticks = sum(count for code, count in recording.runs if code < len(DIRECTIONS))
+    if ticks != recording.ticks:
+        return False
+    try:
+        return replay(recording).score == recording.score
+    except ValueError:
+        return False
+
+
+def _apply_event(game: Snake, code: int, count: int) -> bool:
+    """Apply `count` restarts or toggles of the edges, returning whether the game was restarted."""
+    if code == TOGGLE_BOUNDARIES:
+        game.boundaries = game.boundaries != bool(count % 2)
+        return False
+    for _ in range(count):
+        game.reset_state()
+    return True
+
+
+class Player:
+    """A recording played back one tick at a time, e.g. at the speed of the console."""
+
+    def __init__(self, recording: Recording, game: Snake):
+        self.game = game
+        self._runs = iter(recording.runs)
+        self._run: Run | None = next(self._runs, None)
+
+    def events(self) -> bool:
+        """Apply what the player did before the next tick, returning whether the game was restarted."""
+        restarted = False
+        while self._run is not None and self._run[0] in (RESTART, TOGGLE_BOUNDARIES):
+            restarted = _apply_event(self.game, *self._run) or restarted
+            self._run = next(self._runs, None)
+        return restarted
+
+    def steer(self) -> Direction | None:
+        """The direction of the next tick, None once the recording is over."""
+        self.events()
+        if self._run is None:
+            return None
+        code, count = self._run
+        self._run = (code, count - 1) if count > 1 else next(self._runs, None)
+        return DIRECTIONS[code]
+
+
+def save(recording: Recording, path: Path):
+    """Write `recording` to `path`: a header and the runs as varints of ``count << 3 | code``, with a CRC32."""
+    log = bytearray()
+    for code, count in recording.runs:
+        write_varint(log, count << _CODE_BITS | code)
+    flags = _BOUNDARIES if recording.boundaries else 0
+    header = _HEADER.pack(MAGIC, VERSION, flags, recording.height, recording.width, recording.seed,
+                          recording.ticks, recording.score, len(log))
+    with open(path, 'wb') as file:
+        file.write(header + log + _CHECKSUM.pack(zlib.crc32(header + log)))
+
+
+def load(path: Path) -> Recording:
+    with open(path, 'rb') as file:
+        data = file.read()
+    if len(data) < _HEADER.size + _CHECKSUM.size:
+        raise ValueError(f'{os.fspath(path)!r} is too short for a Snake recording')
+    magic, version, flags, height, width, seed, ticks, score, length = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f'{os.fspath(path)!r} is not a Snake recording')
+    if version != VERSION:
+        raise ValueError(f'Unsupported recording version {version}')
+    end = _HEADER.size + length
+    if len(data) != end + _CHECKSUM.size or _CHECKSUM.unpack_from(data, end)[0] != zlib.crc32(data[:end]):
+        raise ValueError(f'{os.fspath(path)!r} is truncated or corrupted')
+    return Recording(height, width, bool(flags & _BOUNDARIES), seed, _read_runs(data[_HEADER.size:end]), ticks, score)
+
+
+def _read_runs(log: bytes) -> list[Run]:
+    return [(value & (1 << _CODE_BITS) - 1, value >> _CODE_BITS) for value in read_varints(log)]
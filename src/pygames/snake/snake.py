@@ -1,4 +1,6 @@
+import collections
 import enum
+import typing as t
 
 import random
 
@@ -14,19 +16,80 @@ class Direction(enum.Enum):
     RIGHT = enum.auto()
 
 
+MOVES = {Direction.UP: (0, -1), Direction.DOWN: (0, 1), Direction.LEFT: (-1, 0), Direction.RIGHT: (1, 0)}
+
+
 class Snake:  # pylint: disable = too-few-public-methods, too-many-instance-attributes
     SCORE_INC = 1
 
-    def __init__(self, height: int = 10, width: int = 10, boundaries: bool = False):
+    def __init__(self, height: int = 10, width: int = 10, boundaries: bool = False,
+                 rng: random.Random | None = None):
         self.height = height
         self.width = width
         self.boundaries = boundaries
-        self.snake: list[list[int]] = [[self.width // 2, self.height // 2]]
+        # every draw of the game comes from here, so a seeded generator replays it exactly
+        self.random = rng if rng is not None else random.Random()
+        # the body, head first, and how many of its segments are on every cell, for checks that cost the same
+        # at any length
+        self._body: collections.deque[tuple[int, int]] = collections.deque()
+        self._occupied = bytearray(height * width)
+        # cells without the snake in any order, and where each of them is in that list or -1 for the snake's cells,
+        # so a fruit is placed with a single draw however full the board is
+        self._free: list[int] = []
+        self._free_position: list[int] = []
+        self.snake = [[self.width // 2, self.height // 2]]
         self._direction: Direction = Direction.RIGHT
         self.score = 0
         self.fruit: list[int] = [-1, -1]
         self._set_fruit()
 
+    @property
+    def snake(self) -> list[list[int]]:
+        """Copy of the body as ``[x, y]`` cells, head first; see `body` for the cells without a copy."""
+        return [[x, y] for x, y in self._body]
+
+    @snake.setter
+    def snake(self, cells: t.Iterable[t.Sequence[int]]):
+        self._body = collections.deque((x, y) for x, y in cells)
+        self._occupied = bytearray(self.height * self.width)
+        self._free = list(range(self.height * self.width))
+        self._free_position = list(range(self.height * self.width))
+        for x, y in self._body:
+            self._occupy(x, y)
+
+    @property
+    def body(self) -> collections.deque[tuple[int, int]]:
+        """The ``(x, y)`` cells of the snake, head first; not to be changed."""
+        return self._body
+
+    def occupied(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height and self._occupied[y * self.width + x] > 0
+
+    @property
+    def free_cells(self) -> int:
+        return len(self._free)
+
+    def _occupy(self, x: int, y: int):
+        cell = y * self.width + x
+        self._occupied[cell] += 1
+        if self._occupied[cell] > 1:
+            return
+        # swap the last free cell into the place of this one
+        position = self._free_position[cell]
+        last = self._free.pop()
+        if last != cell:
+            self._free[position] = last
+            self._free_position[last] = position
+        self._free_position[cell] = -1
+
+    def _vacate(self, x: int, y: int):
+        cell = y * self.width + x
+        self._occupied[cell] -= 1
+        if self._occupied[cell]:
+            return
+        self._free_position[cell] = len(self._free)
+        self._free.append(cell)
+
     @property
     def direction(self):
         return self._direction
@@ -43,15 +106,16 @@ class Snake:  # pylint: disable = too-few-public-methods, too-many-instance-attr
         self._direction = new_direction
 
     def _set_fruit(self):
-        if len(self.snake) == self.height * self.width:
+        if not self._free:
             raise GameOverException('Nowhere to place fruit')
-        while not self.__fruit_valid:
-            self.fruit = [random.randint(0, self.width), random.randint(0, self.height)]
+        if not self.__fruit_valid:
+            y, x = divmod(self._free[self.random.randrange(len(self._free))], self.width)
+            self.fruit = [x, y]
 
     @property
     def __fruit_valid(self):
         fruit_in_bound = 0 <= self.fruit[0] < self.width and 0 <= self.fruit[1] < self.height
-        return self.fruit not in self.snake and fruit_in_bound
+        return fruit_in_bound and not self.occupied(*self.fruit)
 
     def reset_state(self):
         self.score = 0
@@ -65,26 +129,17 @@ class Snake:  # pylint: disable = too-few-public-methods, too-many-instance-attr
         self._check_fruit_eaten()
 
     def _check_fruit_eaten(self):
-        head = self.snake[0]
-        if self.fruit == head:
+        head_x, head_y = self._body[0]
+        if self.fruit[0] == head_x and self.fruit[1] == head_y:
             self.score += self.SCORE_INC
             self._set_fruit()
         else:
-            self.snake.pop(-1)
+            self._vacate(*self._body.pop())
 
     def _move(self):
-        head_x, head_y = self.snake[0]
-        new_head_x = new_head_y = 0
-
-        match self.direction:
-            case Direction.UP:
-                new_head_x, new_head_y = head_x, head_y - 1
-            case Direction.DOWN:
-                new_head_x, new_head_y = head_x, head_y + 1
-            case Direction.RIGHT:
-                new_head_x, new_head_y = head_x + 1, head_y
-            case Direction.LEFT:
-                new_head_x, new_head_y = head_x - 1, head_y
+        head_x, head_y = self._body[0]
+        move_x, move_y = MOVES[self._direction]
+        new_head_x, new_head_y = head_x + move_x, head_y + move_y
 
         if self.boundaries:
             if new_head_x < 0 or new_head_x >= self.width or new_head_y < 0 or new_head_y >= self.height:
@@ -99,8 +154,11 @@ class Snake:  # pylint: disable = too-few-public-methods, too-many-instance-attr
         if new_head_y >= self.height:
             new_head_y = 0
 
-        self.snake.insert(0, [new_head_x, new_head_y])
+        self._body.appendleft((new_head_x, new_head_y))
+        self._occupy(new_head_x, new_head_y)
 
     def _check_body_collision(self):
-        if self.snake[0] in self.snake[1:]:
+        head_x, head_y = self._body[0]
+        # the tail still holds its cell here, as it only moves on once no fruit was eaten
+        if self._occupied[head_y * self.width + head_x] > 1:
             raise GameOverException('Body hit')
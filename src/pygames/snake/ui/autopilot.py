@@ -0,0 +1,302 @@
+import argparse
+import collections
+import random
+import time
+import typing as t
+
+from pygames import snake
+
+BUDGET = 0.1  # seconds, the tick of the console
+DEFAULT_GAMES = 20
+DEFAULT_SIZE = 20
+# a game that has not eaten for this many times the cells of the board is going in circles
+STALL_FACTOR = 2
+
+
+class Autopilot:  # pylint: disable = too-many-instance-attributes
+    """Steers a `snake.Snake` by itself, usable as the `steer` of `pygames.animation.snake_frames`.
+
+    The fruit is approached over the shortest path that still leaves the tail reachable once the fruit is eaten,
+    so the snake can always follow its tail out again. The path is kept and followed until the fruit moves;
+    when the snake is off it or the way is blocked, it is joined again by the shortest detour. Without such
+    a path the snake follows a Hamiltonian cycle of the board, if there is one, or chases its tail, or makes
+    for the free neighbour with the most room. Searches stop at `budget` seconds and take the next fallback.
+    """
+
+    def __init__(self, game: snake.Snake, budget: float = BUDGET):
+        self.game = game
+        self.budget = budget
+        self._board: tuple[int, int, bool] | None = None
+        self._neighbours: list[tuple[int, ...]] = []
+        # the cell after every cell on a cycle through the whole board
+        self._cycle: list[int] | None = None
+        self._path: collections.deque[int] = collections.deque()
+        self._target = -1
+        self.ticks = 0
+        self.plans = 0
+        self.repairs = 0
+        # cells taken off the frontier by every search, a measure of planning work that does not depend on the machine
+        self.expansions = 0
+        self.planning_seconds = 0.0
+
+    def __call__(self, game: snake.Snake) -> snake.Direction:
+        self.game = game
+        return self.steer()
+
+    def steer(self) -> snake.Direction:
+        # the tables of a board are built once, outside the time of the tick
+        self._prepare()
+        start = time.perf_counter()
+        head = self._cell(*self.game.body[0])
+        following = self._next_cell(head, start + self.budget)
+        self.ticks += 1
+        self.planning_seconds += time.perf_counter() - start
+        return self._direction(head, following) if following is not None else self.game.direction
+
+    def _next_cell(self, head: int, deadline: float) -> int | None:
+        game = self.game
+        fruit = self._cell(*game.fruit)
+        if self._target == fruit and self._path and self._path[0] in self._neighbours[head] \
+                and not game.occupied(*self._xy(self._path[0])):
+            return self._path.popleft()
+        body = [self._cell(x, y) for x, y in game.body]
+        path = self._repair(head, body, deadline) if self._target == fruit and self._path else None
+        if path and self._safe(path, body, True, deadline):
+            self.repairs += 1
+        else:
+            path = self._search(head, {fruit}, body, deadline)
+            if path and self._safe(path, body, True, deadline):
+                self.plans += 1
+            else:
+                path = None
+        self._path.clear()
+        self._target = -1
+        if path:
+            self._target = fruit
+            self._path.extend(path[1:])
+            return path[0]
+        # the cycle visits every cell, so the snake is never trapped once it lies along it
+        if self._cycle is not None and self._free_now(self._cycle[head], body) \
+                and self._safe([self._cycle[head]], body, False, deadline):
+            return self._cycle[head]
+        path = self._search(head, {body[-1]}, body, deadline) if len(body) > 1 else None
+        if path:
+            return path[0]
+        candidates = [cell for cell in self._neighbours[head] if self._free_now(cell, body)]
+        return max(candidates, key=lambda cell: self._room(cell, body, deadline), default=None)
+
+    def _repair(self, head: int, body: list[int], deadline: float) -> list[int] | None:
+        """The kept path joined again from `head` by the shortest detour to any of its cells."""
+        remaining = list(self._path)
+        positions = {cell: index for index, cell in enumerate(remaining)}
+        detour = self._search(head, positions, body, deadline)
+        if detour is None:
+            return None
+        return detour + remaining[positions[detour[-1]] + 1:]
+
+    def _search(self, start: int, goals: t.Container[int], body: list[int], deadline: float) -> list[int] | None:
+        """Shortest path from `start` to one of `goals`, without the start, through cells free when they are reached.
+
+        The body cell ``j`` places from the tail is left after ``j + 1`` moves, and the tail only moves after
+        the head, so that cell can be entered from move ``j + 2`` on.
+        """
+        from_tail = {cell: len(body) - 1 - index for index, cell in enumerate(body)}
+        behind = self._behind(body)
+        parents = {start: start}
+        frontier = [start]
+        steps = 0
+        while frontier:
+            steps += 1
+            following = []
+            self.expansions += len(frontier)
+            for cell in frontier:
+                for neighbour in self._neighbours[cell]:
+                    if neighbour in parents or (steps == 1 and neighbour == behind):
+                        continue
+                    if steps <= from_tail.get(neighbour, -2) + 1:
+                        continue
+                    parents[neighbour] = cell
+                    if neighbour in goals:
+                        return self._walk_back(parents, start, neighbour)
+                    following.append(neighbour)
+            if time.perf_counter() > deadline:
+                return None
+            frontier = following
+        return None
+
+    def _safe(self, path: list[int], body: list[int], grows: bool, deadline: float) -> bool:
+        """Whether the tail can still be reached after following `path` from the head."""
+        cells = self.game.height * self.game.width
+        moved = (path[::-1] + body)[:len(body) + grows]
+        if len(moved) >= cells - 1:
+            return True
+        return self._search(moved[0], {moved[-1]}, moved, deadline) is not None
+
+    def _room(self, start: int, body: list[int], deadline: float) -> int:
+        blocked = set(body)
+        seen = {start}
+        frontier = [start]
+        while frontier and time.perf_counter() < deadline:
+            following = []
+            self.expansions += len(frontier)
+            for cell in frontier:
+                for neighbour in self._neighbours[cell]:
+                    if neighbour not in blocked and neighbour not in seen:
+                        seen.add(neighbour)
+                        following.append(neighbour)
+            frontier = following
+        return len(seen)
+
+    def _free_now(self, cell: int, body: list[int]) -> bool:
+        # the tail still holds its cell when the head moves
+        return not self.game.occupied(*self._xy(cell)) and cell != self._behind(body)
+
+    def _behind(self, body: list[int]) -> int | None:
+        # a one-cell snake cannot turn back either, the game ignores it
+        if len(body) > 1:
+            return None
+        reverse = {
+            snake.Direction.UP: snake.Direction.DOWN, snake.Direction.DOWN: snake.Direction.UP,
+            snake.Direction.LEFT: snake.Direction.RIGHT, snake.Direction.RIGHT: snake.Direction.LEFT,
+        }[self.game.direction]
+        head = body[0]
+        return next((cell for cell in self._neighbours[head] if self._direction(head, cell) == reverse), None)
+
+    @staticmethod
+    def _walk_back(parents: dict[int, int], start: int, goal: int) -> list[int]:
+        path = [goal]
+        while parents[path[-1]] != start:
+            path.append(parents[path[-1]])
+        return path[::-1]
+
+    def _prepare(self):
+        game = self.game
+        board = (game.height, game.width, game.boundaries)
+        if board == self._board:
+            return
+        self._board = board
+        self._neighbours = [self._around(*self._xy(cell)) for cell in range(game.height * game.width)]
+        self._cycle = hamiltonian_cycle(game.height, game.width)
+        self._path.clear()
+        self._target = -1
+
+    def _around(self, x: int, y: int) -> tuple[int, ...]:
+        game = self.game
+        cells = []
+        for dx, dy in ((0, -1), (0, 1), (-1, 0), (1, 0)):
+            nx, ny = x + dx, y + dy
+            if game.boundaries and not (0 <= nx < game.width and 0 <= ny < game.height):
+                continue
+            cells.append(self._cell(nx % game.width, ny % game.height))
+        return tuple(dict.fromkeys(cells))
+
+    def _cell(self, x: int, y: int) -> int:
+        return y * self.game.width + x
+
+    def _xy(self, cell: int) -> tuple[int, int]:
+        y, x = divmod(cell, self.game.width)
+        return x, y
+
+    def _direction(self, start: int, end: int) -> snake.Direction:
+        (x, y), (end_x, end_y) = self._xy(start), self._xy(end)
+        if (end_x - x) % self.game.width == 1:
+            return snake.Direction.RIGHT
+        if (x - end_x) % self.game.width == 1:
+            return snake.Direction.LEFT
+        if (end_y - y) % self.game.height == 1:
+            return snake.Direction.DOWN
+        return snake.Direction.UP
+
+
+def hamiltonian_cycle(height: int, width: int) -> list[int] | None:
+    """The cell after every cell, ``y * width + x``, on a cycle through the whole board without wrapping.
+
+    There is one when a side is even: along the first row, in a zigzag over the other columns and back up the
+    first column.
+    """
+    if height < 2 or width < 2 or (height % 2 and width % 2):
+        return None
+    if height % 2:
+        transposed = hamiltonian_cycle(width, height)  # pylint: disable = arguments-out-of-order
+        assert transposed is not None
+        following = [0] * (height * width)
+        for cell, after in enumerate(transposed):
+            x, y = divmod(cell, height)
+            after_x, after_y = divmod(after, height)
+            following[y * width + x] = after_y * width + after_x
+        return following
+    order = [(x, 0) for x in range(width)]
+    for y in range(1, height):
+        columns = range(width - 1, 0, -1) if y % 2 else range(1, width)
+        order.extend((x, y) for x in columns)
+    order.extend((0, y) for y in range(height - 1, 0, -1))
+    following = [0] * (height * width)
+    for (x, y), (after_x, after_y) in zip(order, order[1:] + order[:1]):
+        following[y * width + x] = after_y * width + after_x
+    return following
+
+
+class Report(t.NamedTuple):
+    games: int
+    average_score: float
+    ticks: int
+    seconds_per_tick: float
+
+
+def play(game: snake.Snake, pilot: Autopilot, max_ticks: int | None = None) -> int:
+    """Let `pilot` play `game` until it is over or stalls, returning the ticks played."""
+    stall = STALL_FACTOR * game.height * game.width
+    ticks = since_fruit = 0
+    while max_ticks is None or ticks < max_ticks:
+        game.direction = pilot.steer()
+        score = game.score
+        ticks += 1
+        try:
+            game.update()
+        except snake.GameOverException:
+            break
+        since_fruit = 0 if game.score > score else since_fruit + 1
+        if since_fruit > stall:
+            break
+    return ticks
+
+
+def run(games: int, height: int, width: int, boundaries: bool = False, seed: int = 0,
+        max_ticks: int | None = None) -> Report:
+    # pylint: disable = too-many-arguments, too-many-positional-arguments
+    scores = []
+    ticks = 0
+    seconds = 0.0
+    for index in range(games):
+        game = snake.Snake(height=height, width=width, boundaries=boundaries, rng=random.Random(seed + index))
+        pilot = Autopilot(game)
+        ticks += play(game, pilot, max_ticks)
+        seconds += pilot.planning_seconds
+        scores.append(game.score)
+    return Report(games, sum(scores) / games, ticks, seconds / ticks if ticks else 0.0)
+
+
+def parse_args(argv: t.Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog='snake-autopilot', description='Let the autopilot play Snake without a terminal and report how it did.'
+    )
+    parser.add_argument('-n', '--games', type=int, default=DEFAULT_GAMES)
+    parser.add_argument('--height', type=int, default=DEFAULT_SIZE)
+    parser.add_argument('--width', type=int, default=DEFAULT_SIZE)
+    parser.add_argument('--boundaries', action='store_true', help='walls around the board instead of wrapping')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the first game, the next ones count up')
+    parser.add_argument('--max-ticks', type=int, help='ticks to play each game for at most')
+    return parser.parse_args(argv)
+
+
+def main(argv: t.Sequence[str] | None = None):
+    args = parse_args(argv)
+    report = run(args.games, args.height, args.width, args.boundaries, args.seed, args.max_ticks)
+    print(f'games: {report.games}')
+    print(f'average score: {report.average_score:.1f}')
+    print(f'ticks: {report.ticks}')
+    print(f'planning ms/tick: {report.seconds_per_tick * 1000:.3f}')
+
+
+if __name__ == '__main__':  # pragma: nocover
+    main()
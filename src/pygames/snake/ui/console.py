@@ -1,8 +1,13 @@
+import argparse
+import itertools
+import typing as t
 from functools import partial
 
 import blessed
 
-from pygames import snake
+from pygames import snake, stream
+from pygames.snake import replay
+from pygames.snake.ui.autopilot import Autopilot
 
 display = partial(print, end='', flush=True)
 
@@ -19,36 +24,65 @@ class DirectionKeys:  # pylint: disable = too-few-public-methods
     RIGHT = ('d', 'D')
 
 
-class TerminalController:  # pylint: disable = too-few-public-methods
+class TerminalController:  # pylint: disable = too-few-public-methods, too-many-instance-attributes
     DEFAULT_TIMEOUT = 0.1  # seconds
     FRUIT_SYMBOL = 'X'
     HEAD_SYMBOL = 'O'
     BODY_SYMBOL = 'o'
 
-    def __init__(self, terminal: blessed.Terminal, game: snake.Snake):
+    def __init__(self, terminal: blessed.Terminal, game: snake.Snake, publisher: stream.Publisher | None = None,
+                 pilot: Autopilot | None = None, recorder: replay.Recorder | None = None,
+                 player: replay.Player | None = None):
+        # pylint: disable = too-many-arguments, too-many-positional-arguments
         self.term = terminal
         self.width = terminal.width
         self.height = terminal.height - BOUNDARIES_WIDTH * 2
         self.game = game
         self.game_over = False
+        self.publisher = publisher
+        self.pilot = pilot
+        self.recorder = recorder
+        self.player = player
+        self.timeout = self.DEFAULT_TIMEOUT
 
         with self.term.cbreak(), self.term.hidden_cursor():
             display(self.term.home + self.term.clear, end='')
 
     def run(self):  # pragma: nocover
         with self.term.cbreak(), self.term.hidden_cursor():
-            while (key := self.term.inkey(timeout=self.DEFAULT_TIMEOUT)) not in EXIT_KEYS:
-                self._process_key(key)
+            while (key := self.term.inkey(timeout=self.timeout)) not in EXIT_KEYS:
+                # a replay only listens to the recording
+                if self.player is None:
+                    self._process_key(key)
+                elif self.player.events():
+                    self.game_over = False
                 if self.game_over:
                     continue
                 self._render_screen()
+                if not self._steer():
+                    continue
+                if self.recorder is not None:
+                    self.recorder.tick()
                 try:
                     self.game.update()
                 except snake.GameOverException:
                     self.game_over = True
+                if self.publisher is not None:
+                    self.publisher.publish()
                 if self.game_over:
                     self._show_game_over()
 
+    def _steer(self) -> bool:
+        """Turn the snake for the computer or the recording, False once the recording is over."""
+        if self.pilot is not None:
+            self.game.direction = self.pilot.steer()
+        if self.player is not None:
+            direction = self.player.steer()
+            if direction is None:
+                return False
+            self.game.direction = direction
+        return True
+
     def _render_screen(self):
         self._show_score()
         self._show_snake()
@@ -58,9 +92,13 @@ class TerminalController:  # pylint: disable = too-few-public-methods
     def _process_key(self, key):
         if key in BOUNDARIES_KEYS:
             self.game.boundaries = not self.game.boundaries
+            if self.recorder is not None:
+                self.recorder.toggle_boundaries()
         if key in RESTART_KEYS:
             self.game_over = False
             self.game.reset_state()
+            if self.recorder is not None:
+                self.recorder.restart()
         if key in DirectionKeys.UP:
             self.game.direction = snake.Direction.UP
         if key in DirectionKeys.DOWN:
@@ -76,10 +114,10 @@ class TerminalController:  # pylint: disable = too-few-public-methods
 
     def _show_snake(self):
         self.__clear_snake_field()
-        head_x, head_y = self.game.snake[0]
+        head_x, head_y = self.game.body[0]
         txt_erase = self.term.move_xy(head_x, head_y + BOUNDARIES_WIDTH)
         display(txt_erase + self.HEAD_SYMBOL)
-        for body_x, body_y in self.game.snake[1:]:
+        for body_x, body_y in itertools.islice(self.game.body, 1, None):
             txt_erase = self.term.move_xy(body_x, body_y + BOUNDARIES_WIDTH)
             display(txt_erase + self.BODY_SYMBOL)
 
@@ -111,12 +149,54 @@ class TerminalController:  # pylint: disable = too-few-public-methods
         display(txt_erase + game_over_text)
 
 
-def main():  # pragma: nocover
+def parse_args(argv: t.Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='snake', description='Snake in the terminal.')
+    parser.add_argument('--autopilot', action='store_true', help='let the computer play')
+    recording = parser.add_mutually_exclusive_group()
+    recording.add_argument('--record', metavar='PATH', help='save the session to PATH on exit')
+    recording.add_argument('--replay', metavar='PATH', help='play the session saved in PATH again')
+    parser.add_argument('--speed', type=float, default=1.0, help='how many times faster than usual to play')
+    parser.add_argument('--publish', metavar='SOCKET',
+                        help='publish every tick to viewers connecting to this Unix socket')
+    args = parser.parse_args(argv)
+    if args.speed <= 0:
+        parser.error('--speed must be positive')
+    if args.replay and args.autopilot:
+        parser.error('--autopilot cannot steer a replay')
+    return args
+
+
+def main(argv: t.Sequence[str] | None = None):  # pragma: nocover
+    args = parse_args(argv)
     term = blessed.Terminal()
     width, height = term.width, term.height - BOUNDARIES_WIDTH * 2
-    game = snake.Snake(width=width, height=height, boundaries=True)
-    controller = TerminalController(terminal=term, game=game)
-    controller.run()
+    recorder = player = None
+    if args.replay:
+        recording = replay.load(args.replay)
+        if recording.width > width or recording.height > height:
+            raise SystemExit(f'The recording needs a terminal of {recording.width}x{recording.height + 2}')
+        game = replay.new_game(recording)
+        player = replay.Player(recording, game)
+    elif args.record:
+        recorder = replay.Recorder.new_game(height, width, boundaries=True)
+        game = recorder.game
+    else:
+        game = snake.Snake(width=width, height=height, boundaries=True)
+    pilot = Autopilot(game, budget=TerminalController.DEFAULT_TIMEOUT) if args.autopilot else None
+    publisher = None
+    if args.publish:
+        publisher = stream.Publisher(game)
+        publisher.listen(args.publish)
+    controller = TerminalController(terminal=term, game=game, publisher=publisher, pilot=pilot, recorder=recorder,
+                                    player=player)
+    controller.timeout = TerminalController.DEFAULT_TIMEOUT / args.speed
+    try:
+        controller.run()
+    finally:
+        if publisher is not None:
+            publisher.close()
+        if recorder is not None:
+            replay.save(recorder.recording(), args.record)
 
 
 if __name__ == '__main__':  # pragma: nocover
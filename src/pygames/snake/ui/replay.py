@@ -0,0 +1,32 @@
+import argparse
+import typing as t
+
+from pygames.snake import replay
+
+
+def parse_args(argv: t.Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog='snake-replay', description='Replay Snake recordings without a terminal and check their scores.'
+    )
+    parser.add_argument('paths', nargs='+', metavar='PATH', help='recordings saved with `snake --record`')
+    return parser.parse_args(argv)
+
+
+def main(argv: t.Sequence[str] | None = None) -> int:
+    args = parse_args(argv)
+    failed = 0
+    for path in args.paths:
+        try:
+            recording = replay.load(path)
+        except (OSError, ValueError) as error:
+            print(f'{path}: {error}')
+            failed += 1
+            continue
+        ok = replay.verify(recording)
+        failed += not ok
+        print(f'{path}: {recording.ticks} ticks, score {recording.score}, {"ok" if ok else "MISMATCH"}')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':  # pragma: nocover
+    raise SystemExit(main())
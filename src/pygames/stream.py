@@ -0,0 +1,404 @@
+import collections
+import os
+import socket
+import struct
+import typing as t
+
+from pygames import animation, snake
+from pygames.game_of_life import game_of_life as gof
+
+# every message is its kind, the tick it shows and the length of the payload that follows
+HEADER = struct.Struct('<BQI')
+LIFE_KEYFRAME, LIFE_DELTA, SNAKE_KEYFRAME, SNAKE_DELTA = 1, 2, 3, 4
+LIFE_SIZE = struct.Struct('<II')
+SNAKE_STATE = struct.Struct('<HHIhh')  # height, width, score, fruit column and row
+SNAKE_CELL = struct.Struct('<HH')
+SNAKE_STEP = struct.Struct('<HHBhhI')  # head column and row, whether the snake grew, fruit, score
+DEFAULT_BACKLOG = 1 << 20  # bytes
+
+Message = tuple[int, bytes]
+
+
+def pack_row(row: bytes) -> bytes:
+    """Cells of 0 and 1 as bits, cell ``8 * i + k`` being bit ``k`` of byte ``i``."""
+    length = -(-len(row) // 8)
+    bits = 0
+    for bit in range(8):
+        # every cell is 0 or 1, so shifting each one into its bit never carries into the next byte
+        bits |= int.from_bytes(row[bit::8].ljust(length, b'\0'), 'little') << bit
+    return bits.to_bytes(length, 'little')
+
+
+def unpack_row(data: bytes, width: int) -> bytearray:
+    row = bytearray(len(data) * 8)
+    for bit in range(8):
+        row[bit::8] = data.translate(BIT_TABLES[bit])
+    del row[width:]
+    return row
+
+
+BIT_TABLES = tuple(bytes(value >> bit & 1 for value in range(256)) for bit in range(8))
+
+
+def write_varint(output: bytearray, value: int):
+    while value > 0x7F:
+        output.append(value & 0x7F | 0x80)
+        value >>= 7
+    output.append(value)
+
+
+def read_varints(data: bytes) -> t.Iterator[int]:
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            yield value
+            value = shift = 0
+
+
+class LifeTick(t.NamedTuple):
+    # cells flipped since the previous tick, sorted, or None when the engine could not tell them
+    flipped: list[int] | None
+    # the published board, only read when the flipped cells are not known
+    frame: animation.Frame | None
+
+
+class LifeSource:
+    """Game of Life ticks as whole boards or the cells that flipped, whichever is shorter.
+
+    The flipped cells are the ones the engine reports to `GameOfLife.flips_sink`, so a tick costs as much
+    as the cells it changes and the board is only read for keyframes. Engines that do not report them,
+    such as the unbounded ones publishing the board-sized window at their origin, are diffed frame by frame.
+    """
+
+    def __init__(self, game: gof.GameOfLife):
+        self.game = game
+        self._flips: set[int] | None = None
+        game.flips_sink = self._collect
+
+    def _collect(self, flipped: t.Iterable[int] | None):
+        # a cell flipped twice between two ticks is back as it was
+        if flipped is None:
+            self._flips = None
+        elif self._flips is not None:
+            self._flips.symmetric_difference_update(flipped)
+
+    def capture(self) -> LifeTick:
+        flips, self._flips = self._flips, set()
+        if flips is not None:
+            return LifeTick(sorted(flips), None)
+        return LifeTick(None, animation.life_frame(self.game))
+
+    def skip(self):
+        """Nobody watches this tick: stop gathering flips until the next capture."""
+        self._flips = None
+
+    def keyframe(self, tick: LifeTick) -> Message:
+        frame = tick.frame if tick.frame is not None else animation.life_frame(self.game)
+        return LIFE_KEYFRAME, LIFE_SIZE.pack(len(frame), len(frame[0])) + b''.join(map(pack_row, frame))
+
+    def delta(self, previous: LifeTick, tick: LifeTick) -> Message | None:
+        if tick.flipped is not None:
+            flipped: t.Iterable[int] = tick.flipped
+        elif previous.frame is not None and tick.frame is not None:
+            flipped = _flipped(previous.frame, tick.frame)
+        else:
+            return None
+        limit = LIFE_SIZE.size + self.game.height * -(-self.game.width // 8)
+        payload = bytearray()
+        last = 0
+        for index in flipped:
+            # the gaps between the flipped cells, numbered row by row, are mostly small
+            write_varint(payload, index - last)
+            last = index
+            if len(payload) >= limit:
+                return None
+        return LIFE_DELTA, bytes(payload)
+
+
+def _flipped(previous: animation.Frame, frame: animation.Frame) -> t.Iterator[int]:
+    width = len(frame[0])
+    for row, (old, new) in enumerate(zip(previous, frame)):
+        if old == new:
+            continue
+        # cells are bytes of 0 or 1, so cell ``i`` of the row is bit ``8 * i`` of the difference
+        changes = int.from_bytes(old, 'little') ^ int.from_bytes(new, 'little')
+        while changes:
+            lowest = changes & -changes
+            yield row * width + (lowest.bit_length() - 1) // 8
+            changes ^= lowest
+
+
+class SnakeState(t.NamedTuple):
+    head: tuple[int, int]
+    neck: tuple[int, int] | None
+    length: int
+    fruit: tuple[int, int]
+    score: int
+
+
+class SnakeSource:
+    """Snake ticks as the whole game or as the new head, whether the tail moved, the fruit and the score."""
+
+    def __init__(self, game: snake.Snake):
+        self.game = game
+
+    def capture(self) -> SnakeState:
+        body = self.game.body
+        fruit_col, fruit_row = self.game.fruit
+        return SnakeState(body[0], body[1] if len(body) > 1 else None, len(body), (fruit_col, fruit_row),
+                          self.game.score)
+
+    def skip(self):
+        """Nothing is gathered between ticks, the next capture is whole anyway."""
+
+    def keyframe(self, state: SnakeState) -> Message:
+        game = self.game
+        header = SNAKE_STATE.pack(game.height, game.width, state.score, *state.fruit)
+        return SNAKE_KEYFRAME, header + b''.join(SNAKE_CELL.pack(col, row) for col, row in game.body)
+
+    def delta(self, previous: SnakeState, state: SnakeState) -> Message | None:
+        grew = state.length - previous.length
+        # anything but one step of the snake, e.g. a restart, is sent as a keyframe
+        if grew not in (0, 1) or (state.neck is not None and state.neck != previous.head):
+            return None
+        return SNAKE_DELTA, SNAKE_STEP.pack(*state.head, grew, *state.fruit, state.score)
+
+
+Source = LifeSource | SnakeSource
+
+
+class _Consumer:  # pylint: disable = too-many-instance-attributes
+    def __init__(self, send: t.Callable[[memoryview], int], close: t.Callable[[], None]):
+        self._send = send
+        self._close = close
+        self._queue: collections.deque[bytes] = collections.deque()
+        # bytes of the first message sent already
+        self._offset = 0
+        self.backlog = 0
+        self.needs_keyframe = True
+        self.dropped = 0
+        self.closed = False
+
+    def push(self, message: bytes):
+        self._queue.append(message)
+        self.backlog += len(message)
+
+    def drop(self):
+        """Forget the messages not started yet; the consumer catches up with the next keyframe."""
+        in_flight = self._queue.popleft() if self._offset else None
+        self.dropped += len(self._queue)
+        self._queue.clear()
+        self.backlog = 0
+        if in_flight is not None:
+            self._queue.append(in_flight)
+            self.backlog = len(in_flight) - self._offset
+        self.needs_keyframe = True
+
+    def flush(self):
+        while self._queue:
+            message = self._queue[0]
+            try:
+                sent = self._send(memoryview(message)[self._offset:])
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                self.close()
+                return
+            self.backlog -= sent
+            self._offset += sent
+            if self._offset < len(message):
+                return
+            self._queue.popleft()
+            self._offset = 0
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self._queue.clear()
+            self._close()
+
+
+class Publisher:
+    """Publishes every tick of a game as a compact binary delta to any number of viewers.
+
+    Viewers connect to the Unix socket opened by `listen`, or are attached as a pipe or socket, and get a keyframe
+    first. Nothing ever waits for a viewer: a viewer with more than `max_backlog` bytes not read yet loses them
+    and is sent a keyframe instead.
+    """
+
+    def __init__(self, game: gof.GameOfLife | snake.Snake, max_backlog: int = DEFAULT_BACKLOG):
+        self.source: Source = SnakeSource(game) if isinstance(game, snake.Snake) else LifeSource(game)
+        self.max_backlog = max_backlog
+        self.tick = 0
+        self._consumers: list[_Consumer] = []
+        self._server: socket.socket | None = None
+        self._path: str | None = None
+        self._previous: t.Any = None
+
+    @property
+    def consumers(self) -> int:
+        return len(self._consumers)
+
+    @property
+    def dropped(self) -> int:
+        return sum(consumer.dropped for consumer in self._consumers)
+
+    def listen(self, path: str | os.PathLike):
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(os.fspath(path))
+        self._server.listen()
+        self._server.setblocking(False)
+        self._path = os.fspath(path)
+
+    def attach(self, file: int | socket.socket | t.IO):
+        """Publish to a connected socket, or to a pipe given as a file or descriptor."""
+        if isinstance(file, socket.socket):
+            file.setblocking(False)
+            self._consumers.append(_Consumer(file.send, file.close))
+            return
+        fd = file if isinstance(file, int) else file.fileno()
+        os.set_blocking(fd, False)
+        self._consumers.append(_Consumer(lambda data: os.write(fd, data), lambda: None))
+
+    def publish(self):
+        """Send the current tick to every viewer, as a keyframe to the ones that need it."""
+        self._accept()
+        self.tick += 1
+        source: t.Any = self.source
+        if not self._consumers:
+            # without viewers there is nothing to diff against
+            self._previous = None
+            source.skip()
+            return
+        state = source.capture()
+        delta = source.delta(self._previous, state) if self._previous is not None else None
+        self._previous = state
+        # every message is encoded once, whatever the number of viewers
+        delta_message = self._encode(delta) if delta is not None else None
+        keyframe = None
+        for consumer in self._consumers:
+            if consumer.backlog > self.max_backlog:
+                consumer.drop()
+            if consumer.needs_keyframe or delta_message is None:
+                if keyframe is None:
+                    keyframe = self._encode(source.keyframe(state))
+                consumer.push(keyframe)
+                consumer.needs_keyframe = False
+            else:
+                consumer.push(delta_message)
+        self.flush()
+
+    def flush(self):
+        """Send what the viewers have room for."""
+        for consumer in self._consumers:
+            consumer.flush()
+        self._consumers = [consumer for consumer in self._consumers if not consumer.closed]
+
+    def close(self):
+        for consumer in self._consumers:
+            consumer.close()
+        self._consumers = []
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        if self._path is not None:
+            os.unlink(self._path)
+            self._path = None
+
+    def _accept(self):
+        while self._server is not None:
+            try:
+                connection, _ = self._server.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            self.attach(connection)
+
+    def _encode(self, message: Message) -> bytes:
+        kind, payload = message
+        return HEADER.pack(kind, self.tick, len(payload)) + payload
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+class Viewer:  # pylint: disable = too-few-public-methods, too-many-instance-attributes
+    """The game as rebuilt from a stream of messages fed to it in chunks of any size."""
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self.kind: int | None = None
+        self.tick = 0
+        self.messages = 0
+        self.keyframes = 0
+        self.height = self.width = 0
+        self.cells: list[bytearray] = []
+        self.snake: collections.deque[tuple[int, int]] = collections.deque()
+        self.fruit = (-1, -1)
+        self.score = 0
+
+    def feed(self, data: bytes) -> int:
+        """Apply every message completed by `data`, returning how many there were."""
+        self._buffer += data
+        applied = 0
+        start = 0
+        while len(self._buffer) - start >= HEADER.size:
+            kind, tick, length = HEADER.unpack_from(self._buffer, start)
+            end = start + HEADER.size + length
+            if end > len(self._buffer):
+                break
+            self._apply(kind, bytes(self._buffer[start + HEADER.size:end]))
+            self.tick = tick
+            start = end
+            applied += 1
+        del self._buffer[:start]
+        self.messages += applied
+        return applied
+
+    def _apply(self, kind: int, payload: bytes):
+        if kind in (LIFE_DELTA, SNAKE_DELTA) and self.kind != kind - 1:
+            raise ValueError(f'Delta of kind {kind} before its keyframe')
+        handlers = {
+            LIFE_KEYFRAME: self._life_keyframe, LIFE_DELTA: self._life_delta,
+            SNAKE_KEYFRAME: self._snake_keyframe, SNAKE_DELTA: self._snake_delta,
+        }
+        if kind not in handlers:
+            raise ValueError(f'Unknown message kind {kind}')
+        handlers[kind](payload)
+
+    def _life_keyframe(self, payload: bytes):
+        self.kind = LIFE_KEYFRAME
+        self.keyframes += 1
+        self.height, self.width = LIFE_SIZE.unpack_from(payload)
+        row_bytes = -(-self.width // 8)
+        offset = LIFE_SIZE.size
+        self.cells = [
+            unpack_row(payload[offset + row * row_bytes:offset + (row + 1) * row_bytes], self.width)
+            for row in range(self.height)
+        ]
+
+    def _life_delta(self, payload: bytes):
+        index = 0
+        for gap in read_varints(payload):
+            index += gap
+            row, col = divmod(index, self.width)
+            self.cells[row][col] ^= 1
+
+    def _snake_keyframe(self, payload: bytes):
+        self.kind = SNAKE_KEYFRAME
+        self.keyframes += 1
+        self.height, self.width, self.score, *fruit = SNAKE_STATE.unpack_from(payload)
+        self.fruit = (fruit[0], fruit[1])
+        self.snake = collections.deque(cell for cell in SNAKE_CELL.iter_unpack(payload[SNAKE_STATE.size:]))
+
+    def _snake_delta(self, payload: bytes):
+        head_col, head_row, grew, fruit_col, fruit_row, self.score = SNAKE_STEP.unpack(payload)
+        self.snake.appendleft((head_col, head_row))
+        if not grew:
+            self.snake.pop()
+        self.fruit = (fruit_col, fruit_row)
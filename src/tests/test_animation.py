@@ -0,0 +1,205 @@
+import io
+import random
+import struct
+
+import pytest
+
+from pygames import animation, snake
+from pygames.game_of_life import engines
+from pygames.game_of_life.stats import BoundingBox
+from pygames.game_of_life.ui import batch
+
+GLIDER = [[0, 1, 0, 0, 0, 0], [0, 0, 1, 0, 0, 0], [1, 1, 1, 0, 0, 0], [0] * 6, [0] * 6, [0] * 6]
+
+
+def lzw_decode(data: bytes, min_code_size: int) -> bytes:
+    clear, end = 1 << min_code_size, (1 << min_code_size) + 1
+    stream, position = int.from_bytes(data, 'little'), 0
+    output = bytearray()
+    entries: list[bytes] = []
+    size, previous = 0, None
+    while True:
+        if previous is None and not entries:
+            entries, size = [bytes([value]) for value in range(clear)] + [b'', b''], min_code_size + 1
+        code = stream >> position & ((1 << size) - 1)
+        position += size
+        if code == clear:
+            entries, previous = [], None
+            continue
+        if code == end:
+            return bytes(output)
+        if previous is None:
+            output += entries[code]
+        else:
+            entry = entries[code] if code < len(entries) else entries[previous] + entries[previous][:1]
+            output += entry
+            if len(entries) < animation.MAX_CODES:
+                entries.append(entries[previous] + entry[:1])
+            if len(entries) == 1 << size and size < 12:
+                size += 1
+        previous = code
+
+
+def read_gif(data: bytes) -> tuple[list[tuple[int, list[bytes]]], list[tuple[int, int, int, int]]]:
+    """Frames as (delay, pixel rows) after drawing each image over the last one, and the image rectangles."""
+    # pylint: disable = too-many-locals
+    assert data[:6] == b'GIF89a' and data[-1:] == b';'
+    width, height, flags = struct.unpack_from('<HHB', data, 6)
+    position = 13 + (3 << ((flags & 7) + 1))
+    canvas = [bytearray(width) for _ in range(height)]
+    frames, rectangles, delay = [], [], 0
+    while data[position] != 0x3B:
+        if data[position] == 0x21:
+            if data[position + 1] == 0xF9:
+                delay = struct.unpack_from('<H', data, position + 4)[0]
+            position += 2
+            while data[position]:
+                position += data[position] + 1
+            position += 1
+            continue
+        left, top, image_width, image_height = struct.unpack_from('<HHHH', data, position + 1)
+        min_code_size = data[position + 10]
+        position += 11
+        blocks = bytearray()
+        while data[position]:
+            blocks += data[position + 1:position + 1 + data[position]]
+            position += data[position] + 1
+        position += 1
+        pixels = lzw_decode(bytes(blocks), min_code_size)
+        assert len(pixels) == image_width * image_height
+        for row in range(image_height):
+            canvas[top + row][left:left + image_width] = pixels[row * image_width:(row + 1) * image_width]
+        frames.append((delay, [bytes(row) for row in canvas]))
+        rectangles.append((left, top, image_width, image_height))
+    return frames, rectangles
+
+
+@pytest.mark.parametrize('min_code_size,colors,length', [
+    (2, 2, 10), (2, 2, 50000), (2, 4, 50000), (8, 256, 20000), (2, 1, 20000), (3, 8, 1),
+])
+def test_lzw_round_trip(min_code_size: int, colors: int, length: int):
+    pixels = bytes(random.Random(length).randrange(colors) for _ in range(length))
+    assert lzw_decode(animation.lzw_encode(pixels, min_code_size), min_code_size) == pixels
+
+
+@pytest.mark.parametrize('previous,current,area', [
+    ([b'abc', b'def'], [b'abc', b'def'], None),
+    ([b'abc', b'def'], [b'abc', b'dxf'], BoundingBox(1, 1, 1, 1)),
+    ([b'abc', b'def', b'ghi'], [b'xbc', b'def', b'ghx'], BoundingBox(0, 0, 2, 2)),
+    ([b'abcd', b'efgh'], [b'axcd', b'efxh'], BoundingBox(0, 1, 1, 2)),
+])
+def test_changed_area(previous: list[bytes], current: list[bytes], area: BoundingBox | None):
+    assert animation.changed_area(previous, current) == area
+
+
+def test_scaled():
+    assert list(animation.scaled([b'\x00\x01'], 2)) == [b'\x00\x00\x01\x01'] * 2
+
+
+@pytest.mark.parametrize('engine', sorted(engines.ENGINES))
+def test_life_frame(engine: str):
+    game = engines.create_game(engine, height=6, width=6)
+    game.state = GLIDER
+    assert animation.life_frame(game) == [bytes(row) for row in GLIDER]
+    assert animation.life_frame(game, BoundingBox(0, 0, 1, 2)) == [b'\x00\x01\x00', b'\x00\x00\x01']
+
+
+def test_snake_frame():
+    game = snake.Snake(height=3, width=4)
+    game.snake = [[1, 1], [0, 1]]
+    game.fruit = [3, 2]
+    assert animation.snake_frame(game) == [b'\0\0\0\0', b'\1\2\0\0', b'\0\0\0\3']
+
+
+@pytest.mark.parametrize('scale', [1, 3])
+def test_gif_replays_the_game(scale: int):
+    game = engines.create_game('python', height=6, width=6)
+    game.state = GLIDER
+    frames = list(animation.life_frames(game, 8))
+    file = io.BytesIO()
+    with animation.GifWriter(file, 6, 6, scale=scale, delay=5) as writer:
+        for frame in frames:
+            writer.add(frame)
+    decoded, rectangles = read_gif(file.getvalue())
+    assert [delay for delay, _ in decoded] == [5] * 9
+    assert [rows for _, rows in decoded] == [list(animation.scaled(frame, scale)) for frame in frames]
+    # only the first image covers the whole board
+    assert rectangles[0] == (0, 0, 6 * scale, 6 * scale)
+    assert all(width * height < 36 * scale * scale for _, _, width, height in rectangles[1:])
+
+
+def test_unchanged_frames_extend_the_delay():
+    block = [b'\0\0\0\0', b'\0\1\1\0', b'\0\1\1\0', b'\0\0\0\0']
+    empty = [b'\0' * 4] * 4
+    file = io.BytesIO()
+    with animation.GifWriter(file, 4, 4, delay=10) as writer:
+        for frame in [block] * 50 + [empty] + [block]:
+            writer.add(frame)
+    assert writer.frames == 52
+    decoded, _ = read_gif(file.getvalue())
+    assert decoded == [(500, block), (10, empty), (10, block)]
+
+
+def test_long_still_runs_split_the_delay():
+    file = io.BytesIO()
+    with animation.GifWriter(file, 2, 2, delay=animation.MAX_DELAY // 2) as writer:
+        for _ in range(5):
+            writer.add([b'\0\1', b'\1\0'])
+    decoded, _ = read_gif(file.getvalue())
+    assert sum(delay for delay, _ in decoded) == 5 * (animation.MAX_DELAY // 2)
+    assert all(delay <= animation.MAX_DELAY for delay, _ in decoded)
+
+
+def test_snake_gif():
+    game = snake.Snake(height=5, width=5, rng=random.Random(3))
+    file = io.BytesIO()
+    with animation.GifWriter(file, 5, 5, palette=animation.SNAKE_PALETTE) as writer:
+        for frame in animation.snake_frames(game, 20):
+            writer.add(frame)
+    decoded, _ = read_gif(file.getvalue())
+    assert decoded[-1][1] == animation.snake_frame(game)
+    assert all(len(rows) == 5 for _, rows in decoded)
+
+
+def test_snake_frames_stop_at_game_over():
+    game = snake.Snake(height=5, width=5, boundaries=True)
+    game.snake = [[2, 2]]
+    game.fruit = [0, 0]
+    frames = list(animation.snake_frames(game, 10, steer=lambda _: snake.Direction.UP))
+    assert len(frames) == 3
+
+
+def test_raw_writer():
+    file = io.BytesIO()
+    with animation.RawWriter(file, 2, 1, scale=2) as writer:
+        writer.add([b'\0\1'])
+        writer.add([b'\1\1'])
+    black, white = b'\0\0\0', b'\xff\xff\xff'
+    assert file.getvalue() == (black * 2 + white * 2) * 2 + white * 8
+    assert writer.frames == 2
+
+
+@pytest.mark.parametrize('name,writer_type', [
+    ('run.gif', animation.GifWriter), ('run.raw', animation.RawWriter), ('RUN.RGB', animation.RawWriter),
+])
+def test_writer_for(tmp_path, name: str, writer_type: type):
+    writer = animation.writer_for(tmp_path / name, 4, 4)
+    with writer:
+        assert isinstance(writer, writer_type)
+        writer.add([b'\0' * 4] * 4)
+    assert (tmp_path / name).stat().st_size
+
+
+def test_writer_for_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        animation.writer_for(tmp_path / 'run.mp4', 4, 4)
+
+
+def test_batch_animation(tmp_path, capsys):
+    path = tmp_path / 'run.gif'
+    batch.main(['--height', '8', '--width', '8', '-n', '5', '--seed', '1', '--engine', 'python',
+                '--animation', str(path), '--scale', '2'])
+    capsys.readouterr()
+    decoded, _ = read_gif(path.read_bytes())
+    assert sum(delay for delay, _ in decoded) == 6 * animation.DEFAULT_DELAY
+    assert len(decoded[0][1]) == 16
@@ -0,0 +1,11 @@
+import random
+
+from pygames.game_of_life import engines
+
+BOUNDED_ENGINES = sorted(name for name, engine in engines.ENGINES.items() if not engine.UNBOUNDED)
+UNBOUNDED_ENGINES = sorted(name for name, engine in engines.ENGINES.items() if engine.UNBOUNDED)
+
+
+def random_state(height: int, width: int, seed: int | str = 0, density: float = 0.3) -> list[list[int]]:
+    rng = random.Random(seed)
+    return [[int(rng.random() < density) for _ in range(width)] for _ in range(height)]
@@ -0,0 +1,71 @@
+import copy
+import random
+
+import pytest
+
+from pygames.game_of_life.engines import active
+from pygames.game_of_life.game_of_life import GameOfLife
+
+# a block in the top right corner and a vertical blinker on the left
+BLOCK_AND_BLINKER = [
+    [0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 1, 1],
+    [0, 1, 0, 0, 0, 0, 1, 1],
+    [0, 1, 0, 0, 0, 0, 0, 0],
+    [0, 1, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 0],
+]
+BLINKER_FLIPS = {(2, 1), (4, 1), (3, 0), (3, 2)}
+
+
+def test_changed_tracks_activity():
+    game = active.ActiveGameOfLife(height=6, width=8, boundaries=True)
+    game.state = BLOCK_AND_BLINKER
+    assert game.changed == set()
+    for _ in range(4):
+        game.update()
+        assert game.changed == BLINKER_FLIPS
+    assert game.state == BLOCK_AND_BLINKER
+
+
+def test_only_changes_are_evaluated():
+    game = active.ActiveGameOfLife(height=6, width=8, boundaries=True)
+    game.state = BLOCK_AND_BLINKER
+    assert len(game._candidates()) == 48  # pylint: disable = protected-access
+    game.update()
+    # blinker cells and their neighbours, the block is never looked at again
+    candidates = {divmod(index, 8) for index in game._candidates()}  # pylint: disable = protected-access
+    assert max(col for _, col in candidates) == 3
+
+
+def test_boundaries_toggle_reevaluates_border():
+    rng = random.Random(3)
+    state = [[rng.randint(0, 1) for _ in range(9)] for _ in range(7)]
+    game = active.ActiveGameOfLife(height=7, width=9, boundaries=True)
+    reference = GameOfLife(height=7, width=9, boundaries=True)
+    game.state, reference.state = state, copy.deepcopy(state)
+    for generation in range(12):
+        if generation % 3 == 0:
+            game.boundaries = reference.boundaries = not reference.boundaries
+        game.update()
+        reference.update()
+        assert game.state == reference.state
+
+
+def test_rule_change_reevaluates_settled_cells():
+    game = active.ActiveGameOfLife(height=6, width=8, boundaries=True)
+    reference = GameOfLife(height=6, width=8, boundaries=True)
+    game.state, reference.state = BLOCK_AND_BLINKER, copy.deepcopy(BLOCK_AND_BLINKER)
+    game.update()
+    reference.update()
+    game.rule = reference.rule = 'B2/S'
+    for _ in range(3):
+        game.update()
+        reference.update()
+        assert game.state == reference.state
+
+
+def test_state_wrong_shape():
+    game = active.ActiveGameOfLife(height=3, width=4)
+    with pytest.raises(ValueError):
+        game.state = [[1, 0], [0, 1]]
@@ -0,0 +1,39 @@
+import itertools
+
+import pytest
+
+from pygames.game_of_life.engines import bitset
+
+
+@pytest.mark.parametrize('cells', list(itertools.product((0, 1), repeat=8)))
+def test_count_bits(cells: tuple[int, ...]):
+    bit0, bit1, bit2, bit3 = bitset.count_bits(cells)
+    assert bit0 + bit1 * 2 + bit2 * 4 + bit3 * 8 == sum(cells)
+
+
+def test_cell_layout():
+    game = bitset.BitsetGameOfLife(height=3, width=4)
+    game.state = [
+        [1, 0, 0, 0],
+        [0, 0, 0, 0],
+        [0, 0, 0, 1],
+    ]
+    assert game.bits == 1 | 1 << 11
+    assert game.population == 2
+
+
+def test_state_round_trip():
+    state = [
+        [0, 1, 0, 0, 1],
+        [1, 1, 0, 1, 0],
+        [0, 0, 0, 1, 1],
+    ]
+    game = bitset.BitsetGameOfLife(height=3, width=5)
+    game.state = state
+    assert game.state == state
+
+
+def test_state_wrong_shape():
+    game = bitset.BitsetGameOfLife(height=3, width=4)
+    with pytest.raises(ValueError):
+        game.state = [[1, 0], [0, 1]]
@@ -0,0 +1,102 @@
+import random
+
+import pytest
+
+from pygames.game_of_life import census
+from pygames.game_of_life.rules import Rule
+
+
+def cells_of(*picture: str, top: int = 0, left: int = 0) -> frozenset[tuple[int, int]]:
+    return frozenset(
+        (row + top, col + left) for row, line in enumerate(picture) for col, cell in enumerate(line) if cell == 'O'
+    )
+
+
+@pytest.mark.parametrize('density', [0.0, 0.2, 0.5, 0.9, 1.0])
+def test_soup_density(density: float):
+    runs = list(census.soup(100, 300, density, random.Random(1)))
+    live = sum(length for _, _, length in runs)
+    assert live == pytest.approx(density * 100 * 300, abs=500)
+    assert all(0 <= row < 100 and 0 <= col and col + length <= 300 for row, col, length in runs)
+
+
+def test_soup_seeded():
+    assert list(census.soup(20, 20, 0.3, random.Random(7))) == list(census.soup(20, 20, 0.3, random.Random(7)))
+    assert list(census.soup(20, 20, 0.3, random.Random(7))) != list(census.soup(20, 20, 0.3, random.Random(8)))
+
+
+def test_canonical_ignores_position_and_orientation():
+    glider = cells_of('.O', '..O', 'OOO')
+    turned = cells_of('O..', 'O.O', 'OO.', top=-5, left=9)
+    mirrored = cells_of('.O', 'O', 'OOO', top=3, left=3)
+    assert census.canonical(glider) == census.canonical(turned) == census.canonical(mirrored)
+    assert census.canonical(glider) != census.canonical(cells_of('OO', 'OO'))
+
+
+@pytest.mark.parametrize('picture,code', [
+    (['OO', 'OO'], 'xs4_2o$2o'),
+    (['OOO'], 'xp2_3o'),
+    (['O', 'O', 'O'], 'xp2_3o'),
+    (['.O', '..O', 'OOO'], 'xq4_3o$o$bo'),
+    # the R-pentomino takes over a thousand generations to settle
+    (['.OO', 'OO', '.O'], 'zz_'),
+])
+def test_classify(picture: list[str], code: str):
+    assert census.classify(cells_of(*picture, top=7, left=-2), max_period=20).startswith(code)
+
+
+def test_classify_other_rule():
+    # the replicator rule copies a single cell outwards, so it never repeats
+    assert census.classify(cells_of('O'), Rule.parse('replicator'), max_period=10).startswith('zz_')
+    assert census.classify(cells_of('OO', 'OO'), Rule.parse('B36/S23')) == 'xs4_2o$2o'
+
+
+def test_objects():
+    far = cells_of('OO', 'OO') | cells_of('OOO', top=10, left=10)
+    assert sorted(map(len, census.objects(far))) == [3, 4]
+    # blocks one cell apart do not change each other
+    assert len(census.objects(cells_of('OO.OO', 'OO.OO'))) == 2
+    # a blinker one cell away from a block turns it into something else
+    close = cells_of('OO..', 'OO.O', '...O', '...O')
+    assert census.objects(close, period=2) == [close]
+
+
+def test_census_soup_reproducible():
+    first = census.census_soup(3)
+    assert first == census.census_soup(3)
+    assert first.period is not None and first.lifespan is not None
+    assert sum(count for _, count in first.objects) >= 1 or first.population == 0
+
+
+def test_census_soup_unsettled():
+    result = census.census_soup(3, max_generations=1)
+    assert (result.lifespan, result.period, result.objects) == (None, None, ())
+
+
+def test_census_order_does_not_matter():
+    results = [census.census_soup(seed) for seed in range(10)]
+    forward, backward = census.Census(), census.Census()
+    for result in results:
+        forward.add(result)
+    for result in reversed(results):
+        backward.add(result)
+    assert forward.report() == backward.report()
+    assert forward.soups == 10
+    assert forward.objects.total() == sum(count for result in results for _, count in result.objects)
+
+
+def test_run_census_with_pool():
+    seeds = range(12)
+    alone = census.run_census(seeds, workers=1)
+    pooled = census.run_census(seeds, workers=2)
+    assert pooled.report() == alone.report()
+    assert 'block' in alone.report()
+
+
+def test_report_names_only_conway():
+    result = census.SoupResult(1, 5, 1, 4, (('xs4_2o$2o', 1),))
+    conway, highlife = census.Census(), census.Census('highlife')
+    conway.add(result)
+    highlife.add(result)
+    assert 'block' in conway.report()
+    assert 'xs4_2o$2o' in highlife.report()
@@ -0,0 +1,142 @@
+import typing as t
+
+import pytest
+
+from pygames.game_of_life import checkpoint, engines
+from pygames.game_of_life.engines import HashlifeGameOfLife, SparseGameOfLife
+from pygames.game_of_life.history import History
+from tests.test_game_of_life.helpers import BOUNDED_ENGINES, UNBOUNDED_ENGINES, random_state
+
+
+@pytest.mark.parametrize('engine', BOUNDED_ENGINES)
+@pytest.mark.parametrize('height,width', [(3, 3), (20, 17), (9, 64)])
+def test_round_trip(tmp_path, engine: str, height: int, width: int):
+    game = engines.create_game(engine, height=height, width=width, boundaries=True, rule='B36/S23')
+    game.state = random_state(height, width)
+    for _ in range(5):
+        game.update()
+    path = tmp_path / 'board.pglc'
+    checkpoint.save(game, path, band_height=4)
+    header = checkpoint.read_header(path)
+    assert (header.height, header.width, header.generation, header.band_height) == (height, width, 5, 4)
+    assert path.stat().st_size == header.size == header.payload_offset + height * ((width + 7) // 8) + \
+        -(-height // 4) * 4
+
+    resumed = engines.create_game(engine, height=height, width=width)
+    assert checkpoint.load(resumed, path) == header
+    assert resumed.state == game.state
+    assert (resumed.generation, resumed.rule, resumed.boundaries) == (5, game.rule, True)
+    assert (resumed.population, resumed.board_hash) == (game.population, game.board_hash)
+    game.update()
+    resumed.update()
+    assert resumed.state == game.state
+    assert resumed.generation == 6
+
+
+@pytest.mark.parametrize('engine', UNBOUNDED_ENGINES)
+def test_unbounded_round_trip(tmp_path, engine: str):
+    game = t.cast(HashlifeGameOfLife | SparseGameOfLife, engines.create_game(engine, height=10, width=10))
+    game.state = [[int(row == 4 and col in (3, 4, 5)) for col in range(10)] for row in range(10)]
+    game.origin = (-30, 50)
+    game.update()
+    path = tmp_path / 'plane.pglc'
+    checkpoint.save(game, path)
+    header = checkpoint.read_header(path)
+    assert header.unbounded
+    assert (header.top, header.left, header.height, header.width) == (3, 4, 3, 1)
+
+    resumed = t.cast(HashlifeGameOfLife | SparseGameOfLife, engines.create_game(engine, height=10, width=10))
+    resumed.origin = (-5, -5)
+    checkpoint.load(resumed, path)
+    assert resumed.region(0, 0, 10, 10) == game.region(0, 0, 10, 10)
+    assert resumed.stats.bounding_box == game.stats.bounding_box
+
+
+def test_empty_unbounded_board(tmp_path):
+    game = engines.create_game('sparse', height=10, width=10)
+    game.state = [[]]
+    path = tmp_path / 'empty.pglc'
+    checkpoint.save(game, path)
+    resumed = engines.create_game('sparse', height=10, width=10)
+    checkpoint.load(resumed, path)
+    assert resumed.population == 0
+
+
+def test_load_restarts_history(tmp_path):
+    game = engines.create_game('flat', height=8, width=8)
+    game.update()
+    path = tmp_path / 'board.pglc'
+    checkpoint.save(game, path)
+    resumed = engines.create_game('flat', height=8, width=8)
+    resumed.history = History()
+    checkpoint.load(resumed, path)
+    resumed.update()
+    resumed.step_back()
+    assert resumed.generation == 1
+    assert resumed.state == game.state
+
+
+def test_load_other_size(tmp_path):
+    path = tmp_path / 'board.pglc'
+    checkpoint.save(engines.create_game('flat', height=8, width=8), path)
+    with pytest.raises(ValueError, match='does not fit'):
+        checkpoint.load(engines.create_game('flat', height=8, width=9), path)
+
+
+def test_truncated(tmp_path):
+    path = tmp_path / 'board.pglc'
+    checkpoint.save(engines.create_game('flat', height=30, width=30), path)
+    data = path.read_bytes()
+    for size in (len(data) - 1, 10, 40):
+        path.write_bytes(data[:size])
+        with pytest.raises(ValueError, match='truncated|Not a'):
+            checkpoint.load(engines.create_game('flat', height=30, width=30), path)
+
+
+@pytest.mark.parametrize('engine', sorted(engines.ENGINES))
+def test_corrupted_payload(tmp_path, engine: str):
+    game = engines.create_game('flat', height=30, width=30)
+    path = tmp_path / 'board.pglc'
+    checkpoint.save(game, path)
+    data = bytearray(path.read_bytes())
+    data[-10] ^= 0xFF
+    path.write_bytes(data)
+    resumed = engines.create_game(engine, height=30, width=30)
+    with pytest.raises(ValueError, match='corrupted'):
+        checkpoint.load(resumed, path)
+
+
+@pytest.mark.parametrize('engine', BOUNDED_ENGINES)
+def test_corrupted_band_leaves_an_empty_board(tmp_path, engine: str):
+    path = tmp_path / 'board.pglc'
+    game = engines.create_game(engine, height=30, width=30, boundaries=True, rule='B36/S23')
+    game.state = random_state(30, 30, seed=1)
+    checkpoint.save(game, path, band_height=4)
+    data = bytearray(path.read_bytes())
+    # a byte of the third band, after the first two are already loaded; a band is four rows of four bytes and a CRC
+    data[checkpoint.read_header(path).payload_offset + 2 * (4 * 4 + 4) + 1] ^= 0xFF
+    path.write_bytes(data)
+    resumed = engines.create_game(engine, height=30, width=30)
+    resumed.state = random_state(30, 30, seed=2)
+    with pytest.raises(ValueError, match=r'corrupted in rows 8\.\.11'):
+        checkpoint.load(resumed, path)
+    assert (str(resumed.rule), resumed.boundaries) == ('B3/S23', False)
+    assert resumed.state == [[0] * 30 for _ in range(30)]
+    assert (resumed.population, resumed.board_hash, resumed.stats.bounding_box) == (0, 0, None)
+
+
+def test_corrupted_header(tmp_path):
+    path = tmp_path / 'board.pglc'
+    checkpoint.save(engines.create_game('flat', height=8, width=8), path)
+    data = bytearray(path.read_bytes())
+    data[20] ^= 0xFF
+    path.write_bytes(data)
+    with pytest.raises(ValueError, match='header is corrupted'):
+        checkpoint.read_header(path)
+
+
+def test_not_a_checkpoint(tmp_path):
+    path = tmp_path / 'board.pglc'
+    path.write_bytes(b'x = 3, y = 3\nbo$2bo$3o!\n')
+    with pytest.raises(ValueError, match='Not a'):
+        checkpoint.read_header(path)
@@ -0,0 +1,67 @@
+import pytest
+
+from pygames.game_of_life import cycles
+from pygames.game_of_life.cycles import CycleDetector, bit_positions, byte_positions, cell_key
+
+
+def test_cell_key_is_stable_and_distinct():
+    keys = {cell_key(row, col) for row in range(-20, 20) for col in range(-20, 20)}
+    assert len(keys) == 40 * 40
+    assert cell_key(3, 4) == cell_key(3, 4)
+    assert all(0 <= key < 1 << 64 for key in keys)
+
+
+@pytest.mark.parametrize('cells', [b'', b'\x00\x00', b'\x01', b'\x00\x01\x00\x01\x01', bytes(300) + b'\x01'])
+def test_byte_positions(cells: bytes):
+    expected = {index for index, cell in enumerate(cells) if cell}
+    assert set(byte_positions(int.from_bytes(cells), len(cells))) == expected
+
+
+@pytest.mark.parametrize('bits', [0, 1, 0b1011, 1 << 200 | 1 << 7])
+def test_bit_positions(bits: int):
+    assert sum(1 << position for position in bit_positions(bits)) == bits
+
+
+def test_shifted_keys_are_products():
+    # moving cells multiplies their hash by the key of the shift, whatever the sign of the coordinates
+    cells = [(0, 0), (2, -3), (-5, 7)]
+    board_hash = 0
+    for row, col in cells:
+        board_hash ^= cell_key(row, col)
+    shifted = 0
+    for row, col in cells:
+        shifted ^= cell_key(row - 11, col + 13)
+    assert cycles.multiply(board_hash, cell_key(-11, 13)) == shifted
+    assert cycles.multiply(cell_key(4, -9), cell_key(-4, 9)) == cell_key(0, 0) == 1
+
+
+def test_axis_keys_match_cell_key():
+    assert cycles.row_keys(5, first=-2) == [cell_key(row, 0) for row in range(-2, 3)]
+    assert cycles.col_keys(5, first=-2) == [cell_key(0, col) for col in range(-2, 3)]
+    assert cycles.multiply(cycles.row_keys(3)[2], cycles.col_keys(4)[3]) == cell_key(2, 3)
+
+
+def test_detector_finds_period():
+    detector = CycleDetector()
+    assert detector.push(0, 10) is None
+    assert detector.push(1, 20) is None
+    assert detector.push(2, 30) is None
+    assert detector.push(3, 20) == 2
+    assert detector.push(4, 30) == 2
+    assert detector.push(5, 40) is None
+    assert detector.period is None
+
+
+def test_detector_forgets_outside_window():
+    detector = CycleDetector(window=3)
+    for generation, board_hash in enumerate((1, 2, 3, 4)):
+        detector.push(generation, board_hash)
+    assert detector.push(4, 1) is None
+    assert detector.push(5, 3) == 3
+
+
+def test_detector_context_change_resets():
+    detector = CycleDetector()
+    detector.push(0, 1, context='B3/S23')
+    assert detector.push(1, 1, context='B36/S23') is None
+    assert detector.push(2, 1, context='B36/S23') == 1
@@ -0,0 +1,218 @@
+import copy
+import random
+
+import pytest
+
+from pygames.game_of_life import engines
+from pygames.game_of_life.game_of_life import GameOfLife
+from pygames.game_of_life.history import History
+from pygames.game_of_life.stats import BoundingBox, GenerationStats
+from tests.test_game_of_life.helpers import BOUNDED_ENGINES, UNBOUNDED_ENGINES, random_state
+
+
+def reference_generations(
+        state: list[list[int]], boundaries: bool, generations: int, rule: str = 'B3/S23'
+) -> list[list[list[int]]]:
+    game = GameOfLife(height=len(state), width=len(state[0]), boundaries=boundaries, rule=rule)
+    game.state = copy.deepcopy(state)
+    result = []
+    for _ in range(generations):
+        game.update()
+        result.append(copy.deepcopy(game.state))
+    return result
+
+
+@pytest.mark.parametrize('engine', BOUNDED_ENGINES)
+@pytest.mark.parametrize('boundaries', [False, True])
+@pytest.mark.parametrize('height,width', [(3, 3), (7, 11), (16, 5)])
+def test_engine_matches_reference(engine: str, boundaries: bool, height: int, width: int):
+    rng = random.Random(height * width)
+    state = [[rng.randint(0, 1) for _ in range(width)] for _ in range(height)]
+    expected = reference_generations(state, boundaries, generations=10)
+
+    game = engines.create_game(engine, height=height, width=width, boundaries=boundaries)
+    game.state = copy.deepcopy(state)
+    for generation, expected_state in enumerate(expected):
+        game.update()
+        assert game.state == expected_state, f'{engine} diverged at generation {generation}'
+        assert game.population == sum(map(sum, expected_state))
+
+
+def expected_stats(previous: list[list[int]], current: list[list[int]]) -> tuple[int, int, BoundingBox | None]:
+    cells = [(row, col, old, new) for row, (olds, news) in enumerate(zip(previous, current))
+             for col, (old, new) in enumerate(zip(olds, news))]
+    rows = [row for row, _, _, new in cells if new]
+    cols = [col for _, col, _, new in cells if new]
+    box = BoundingBox(min(rows), min(cols), max(rows), max(cols)) if rows else None
+    return sum(new > old for *_, old, new in cells), sum(new < old for *_, old, new in cells), box
+
+
+@pytest.mark.parametrize('engine', BOUNDED_ENGINES)
+@pytest.mark.parametrize('boundaries', [False, True])
+def test_engine_stats_match_reference(engine: str, boundaries: bool):
+    state = random_state(9, 12, seed=engine)
+    expected = reference_generations(state, boundaries, generations=12)
+    game = engines.create_game(engine, height=9, width=12, boundaries=boundaries)
+    collected: list[GenerationStats] = []
+    game.stats_sink = collected.append
+    game.state = copy.deepcopy(state)
+    assert game.stats.generation == 0
+    assert game.stats.population == sum(map(sum, state))
+    assert game.stats.bounding_box == expected_stats(state, state)[2]
+    for generation, (previous, current) in enumerate(zip([state] + expected, expected), start=1):
+        game.update()
+        births, deaths, box = expected_stats(previous, current)
+        population = sum(map(sum, current))
+        assert game.stats == (generation, population, births, deaths, box, population / 108)
+    assert collected[-1] == game.stats
+    assert [stats.generation for stats in collected] == list(range(1, 13))
+
+
+@pytest.mark.parametrize('engine', BOUNDED_ENGINES)
+@pytest.mark.parametrize('rule', ['highlife', 'seeds', 'day-and-night', 'B01/S3', 'B/S012345678'])
+def test_engine_rule_matches_reference(engine: str, rule: str):
+    rng = random.Random(rule)
+    state = [[rng.randint(0, 1) for _ in range(9)] for _ in range(8)]
+    for boundaries in (False, True):
+        expected = reference_generations(state, boundaries, generations=6, rule=rule)
+        game = engines.create_game(engine, height=8, width=9, boundaries=boundaries, rule=rule)
+        game.state = copy.deepcopy(state)
+        for generation, expected_state in enumerate(expected):
+            game.update()
+            assert game.state == expected_state, f'{engine} diverged at generation {generation} under {rule}'
+
+
+@pytest.mark.parametrize('engine', sorted(engines.ENGINES))
+def test_engine_populated_on_start(engine: str):
+    game = engines.create_game(engine, height=8, width=8)
+    assert isinstance(game, GameOfLife)
+    assert game.population > 0
+
+
+@pytest.mark.parametrize('engine', sorted(engines.ENGINES))
+def test_engine_reset_state(engine: str):
+    game = engines.create_game(engine, height=20, width=20)
+    game.state = [[0] * 20 for _ in range(20)]
+    assert game.population == 0
+    game.reset_state()
+    assert game.population > 0
+
+
+def test_get_engine_unknown():
+    with pytest.raises(ValueError):
+        engines.get_engine('unknown')
+
+
+def test_get_engine_fallback(monkeypatch):
+    monkeypatch.delitem(engines.ENGINES, 'numpy', raising=False)
+    assert engines.get_engine('numpy') is engines.BitsetGameOfLife
+
+
+@pytest.mark.parametrize('engine', BOUNDED_ENGINES)
+@pytest.mark.parametrize('boundaries', [False, True])
+def test_engine_hash_matches_reference(engine: str, boundaries: bool):
+    state = random_state(8, 10, seed=engine, density=0.4)
+    reference = GameOfLife(height=8, width=10, boundaries=boundaries)
+    game = engines.create_game(engine, height=8, width=10, boundaries=boundaries)
+    reference.state, game.state = copy.deepcopy(state), copy.deepcopy(state)
+    assert game.board_hash == reference.board_hash
+    for _ in range(8):
+        reference.update()
+        game.update()
+        assert game.board_hash == reference.board_hash
+        assert game.period == reference.period
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_engines_agree_on_hash(seed: int):
+    state = random_state(8, 10, seed=seed, density=0.4)
+    hashes = set()
+    for engine in engines.ENGINES:
+        game = engines.create_game(engine, height=8, width=10)
+        game.state = copy.deepcopy(state)
+        hashes.add(game.board_hash)
+    assert len(hashes) == 1
+
+
+@pytest.mark.parametrize('engine', sorted(engines.ENGINES))
+@pytest.mark.parametrize('pattern,period', [
+    ([(3, 3), (3, 4), (4, 3), (4, 4)], 1),
+    ([(4, 3), (4, 4), (4, 5)], 2),
+])
+def test_engine_detects_cycles(engine: str, pattern: list[tuple[int, int]], period: int):
+    game = engines.create_game(engine, height=9, width=9, boundaries=True)
+    game.state = [[int((row, col) in pattern) for col in range(9)] for row in range(9)]
+    assert game.period is None
+    assert game.run_until_stable(max_generations=10) == period
+    assert game.generation == period
+    game.update()
+    assert game.period == period
+
+
+def test_engine_cycle_forgotten_on_rule_change():
+    game = engines.create_game('bitset', height=9, width=9, boundaries=True)
+    game.state = [[int(row == 4 and 3 <= col <= 5) for col in range(9)] for row in range(9)]
+    game.run_until_stable(max_generations=10)
+    game.rule = 'B36/S23'
+    game.update()
+    assert game.period is None
+
+
+@pytest.mark.parametrize('engine', BOUNDED_ENGINES)
+def test_engine_history_rewinds_to_reference(engine: str):
+    state = random_state(8, 10, seed=engine, density=0.4)
+    expected = [state] + reference_generations(state, boundaries=False, generations=12)
+    game = engines.create_game(engine, height=8, width=10, boundaries=False)
+    game.state = copy.deepcopy(state)
+    game.history = History(keyframe_interval=5)
+    for _ in range(12):
+        game.update()
+    for generation in (11, 10, 9):
+        game.step_back()
+        assert game.generation == generation
+        assert game.state == expected[generation]
+    for generation in (2, 12, 0, 7):
+        game.seek(generation)
+        assert game.state == expected[generation]
+        assert game.population == sum(map(sum, expected[generation]))
+    game.update()
+    assert game.generation == 8
+    assert game.state == expected[8]
+    assert game.history.last == 8
+
+
+@pytest.mark.parametrize('engine', BOUNDED_ENGINES)
+def test_engine_history_restores_only_flipped_cells(engine: str, monkeypatch):
+    state = random_state(8, 10, seed=engine, density=0.4)
+    game = engines.create_game(engine, height=8, width=10, boundaries=False)
+    game.state = copy.deepcopy(state)
+    game.history = History(keyframe_interval=4)
+    generations = []
+    for _ in range(10):
+        generations.append((game.state, game.stats, game.board_hash))
+        game.update()
+    generations.append((game.state, game.stats, game.board_hash))
+
+    def reload(*_):
+        raise AssertionError('the whole board was loaded again')
+
+    # every engine reports a newly loaded board through `_loaded`
+    monkeypatch.setattr(game, '_loaded', reload)
+    for generation, seek in ((9, False), (8, False), (1, True), (10, True), (5, True)):
+        if seek:
+            game.seek(generation)
+        else:
+            game.step_back()
+        board, stats, board_hash = generations[generation]
+        assert game.state == board
+        assert game.board_hash == board_hash
+        assert game.stats == stats._replace(births=None, deaths=None)
+    game.update()
+    assert (game.state, game.board_hash) == generations[6][::2]
+
+
+@pytest.mark.parametrize('engine', UNBOUNDED_ENGINES)
+def test_unbounded_engine_refuses_history(engine: str):
+    game = engines.create_game(engine, height=8, width=8)
+    with pytest.raises(ValueError):
+        game.history = History()
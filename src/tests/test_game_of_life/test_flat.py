@@ -0,0 +1,105 @@
+import random
+import tracemalloc
+
+import pytest
+
+from pygames.game_of_life.engines import flat
+
+# pylint: disable = protected-access
+
+STATE = [
+    [1, 0, 2],
+    [0, 0, 0],
+    [3, 0, 4],
+]
+
+
+def make_game(boundaries: bool) -> flat.FlatGameOfLife:
+    game = flat.FlatGameOfLife(height=3, width=3, boundaries=boundaries)
+    for cells, row in zip(game._rows, STATE):
+        game._cells[cells.start:cells.stop] = bytes(row)
+    return game
+
+
+def as_rows(game: flat.FlatGameOfLife) -> list[list[int]]:
+    cells = list(game._cells)
+    return [cells[start:start + game._stride] for start in range(0, len(cells), game._stride)]
+
+
+def test_ghost_border_wraps():
+    game = make_game(boundaries=False)
+    game._refresh_ghost_border(game._cells)
+    assert as_rows(game) == [
+        [4, 3, 0, 4, 3],
+        [2, 1, 0, 2, 1],
+        [0, 0, 0, 0, 0],
+        [4, 3, 0, 4, 3],
+        [2, 1, 0, 2, 1],
+    ]
+
+
+def test_ghost_border_dead():
+    game = make_game(boundaries=False)
+    game._refresh_ghost_border(game._cells)
+    game.boundaries = True
+    game._refresh_ghost_border(game._cells)
+    assert as_rows(game) == [
+        [0, 0, 0, 0, 0],
+        [0, 1, 0, 2, 0],
+        [0, 0, 0, 0, 0],
+        [0, 3, 0, 4, 0],
+        [0, 0, 0, 0, 0],
+    ]
+
+
+def test_buffers_are_swapped():
+    game = flat.FlatGameOfLife(height=5, width=5)
+    first, second = game._cells, game._spare
+    game.update()
+    assert game._cells is second and game._spare is first
+    game.update()
+    assert game._cells is first and game._spare is second
+
+
+def test_update_does_not_allocate_per_cell():
+    rng = random.Random(0)
+    game = flat.FlatGameOfLife(height=200, width=200)
+    game.state = [[int(rng.random() < 0.3) for _ in range(200)] for _ in range(200)]
+    game.update()
+    tracemalloc.start()
+    try:
+        game.update()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    # a copy of either buffer would take 40 KB
+    assert peak < 16 * 1024
+    assert game.stats.births + game.stats.deaths > 0
+
+
+def test_population_ignores_ghost_border():
+    game = flat.FlatGameOfLife(height=3, width=3)
+    game.state = [
+        [1, 1, 1],
+        [0, 0, 0],
+        [0, 0, 0],
+    ]
+    game._refresh_ghost_border(game._cells)
+    assert game.population == 3
+
+
+def test_state_round_trip():
+    state = [
+        [0, 1, 0, 0, 1],
+        [1, 1, 0, 1, 0],
+        [0, 0, 0, 1, 1],
+    ]
+    game = flat.FlatGameOfLife(height=3, width=5)
+    game.state = state
+    assert game.state == state
+
+
+def test_state_wrong_shape():
+    game = flat.FlatGameOfLife(height=3, width=4)
+    with pytest.raises(ValueError):
+        game.state = [[1, 0], [0, 1]]
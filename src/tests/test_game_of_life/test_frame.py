@@ -0,0 +1,49 @@
+import blessed
+import pytest
+
+from pygames.game_of_life.ui.frame import FrameBuffer, changed_spans
+
+
+@pytest.fixture(name='term')
+def term_fixture():
+    yield blessed.Terminal(kind='xterm-256color', force_styling=True)
+
+
+@pytest.mark.parametrize('old,new,merge_gap,spans', [
+    ('abcdef', 'abcdef', 0, []),
+    ('abcdef', 'xbcdey', 0, [(0, 1), (5, 6)]),
+    ('abcdef', 'axxdxf', 0, [(1, 3), (4, 5)]),
+    ('abcdef', 'axxdxf', 1, [(1, 5)]),
+    ('abcdef', 'xbcdey', 3, [(0, 1), (5, 6)]),
+    ('abcdef', 'xbcdey', 4, [(0, 6)]),
+])
+def test_changed_spans(old: str, new: str, merge_gap: int, spans: list[tuple[int, int]]):
+    assert changed_spans(old, new, merge_gap) == spans
+
+
+def test_first_frame_is_drawn_in_full(term):
+    frame = FrameBuffer(term, top=1, left=2)
+    assert frame.render(['ab', 'cd']) == term.move_xy(2, 1) + 'ab' + term.move_xy(2, 2) + 'cd'
+
+
+def test_only_changes_are_drawn(term):
+    frame = FrameBuffer(term, top=1)
+    frame.merge_gap = 0
+    frame.render(['*  * ', '    '])
+    assert frame.render(['*  * ', '    ']) == ''
+    assert frame.render([' *  *', '    ']) == term.move_xy(0, 1) + ' *' + term.move_xy(3, 1) + ' *'
+    assert frame.render([' *  *', '   *']) == term.move_xy(3, 2) + '*'
+
+
+def test_close_changes_are_merged(term):
+    frame = FrameBuffer(term)
+    assert frame.merge_gap == len(term.move_xy(term.width - 1, term.height - 1))
+    frame.render([' ' * 20])
+    assert frame.render(['*  *' + ' ' * 16]) == term.move_xy(0, 0) + '*  *'
+
+
+def test_invalidate(term):
+    frame = FrameBuffer(term)
+    frame.render(['ab'])
+    frame.invalidate()
+    assert frame.render(['ab']) == term.move_xy(0, 0) + 'ab'
@@ -218,3 +218,35 @@ def test_boundaries_set(initial_state: list[list[int]], expected: int, boundarie
     game.state = initial_state
     game.update()
     assert game.state[1][0] == expected, f'Central cell not alive after state {initial_state} {game.state}'
+
+
+def test_rule_parsed():
+    game = gof.GameOfLife(height=3, width=3, rule='highlife')
+    assert str(game.rule) == 'B36/S23'
+    game.rule = 'B2/S'
+    assert str(game.rule) == 'B2/S'
+    with pytest.raises(ValueError):
+        game.rule = 'B3/S2/X'
+
+
+def test_highlife_birth_on_six():
+    game = gof.GameOfLife(height=3, width=3, boundaries=True, rule='B36/S23')
+    game.state = [
+        [1, 1, 1],
+        [0, 0, 0],
+        [1, 1, 1],
+    ]
+    game.update()
+    assert game.state[1][1] == gof.LIVE
+
+
+def test_region_pads_with_dead_cells():
+    game = gof.GameOfLife(height=3, width=3)
+    game.state = [
+        [1, 0, 0],
+        [0, 1, 0],
+        [0, 0, 1],
+    ]
+    assert game.region(1, 1, 2, 2) == [[1, 0], [0, 1]]
+    assert game.region(-1, 2, 3, 3) == [[0, 0, 0], [0, 0, 0], [0, 0, 0]]
+    assert game.region(-1, -1, 3, 3) == [[0, 0, 0], [0, 1, 0], [0, 0, 1]]
@@ -0,0 +1,96 @@
+import json
+
+import pytest
+
+from pygames.game_of_life import checkpoint, engines
+from pygames.game_of_life.ui import batch
+
+
+def report_of(output: str) -> dict[str, str]:
+    return dict(line.split(': ', 1) for line in output.splitlines())
+
+
+def test_run_until_stable():
+    game = engines.create_game('flat', height=9, width=9, boundaries=True)
+    game.state = [[int(row == 4 and 3 <= col <= 5) for col in range(9)] for row in range(9)]
+    report = batch.run(game, 100, until_stable=True)
+    assert (report.generations, report.period, report.population) == (2, 2, 3)
+    assert report.cells == 2 * 81
+
+
+def test_main(capsys):
+    batch.main(['--height', '20', '--width', '30', '-n', '15', '--seed', '3', '--engine', 'bitset'])
+    report = report_of(capsys.readouterr().out)
+    assert report['engine'] == 'BitsetGameOfLife'
+    assert report['generations'] == '15'
+    assert float(report['generations/sec']) > 0
+    assert float(report['cells/sec']) > 0
+
+
+def test_main_seeded(capsys):
+    arguments = ['--height', '16', '--width', '16', '-n', '10', '--seed', '5', '--engine', 'active']
+    batch.main(arguments)
+    first = report_of(capsys.readouterr().out)
+    batch.main(arguments)
+    second = report_of(capsys.readouterr().out)
+    assert (first['population'], first['period']) == (second['population'], second['period'])
+
+
+def test_main_pattern_until_stable(tmp_path, capsys):
+    pattern = tmp_path / 'blinker.rle'
+    pattern.write_text('x = 3, y = 1\n3o!\n', encoding='utf-8')
+    batch.main(['--height', '9', '--width', '9', '--pattern', str(pattern), '--until-stable', '--engine', 'flat'])
+    report = report_of(capsys.readouterr().out)
+    assert (report['generations'], report['period'], report['population']) == ('2', '2', '3')
+
+
+@pytest.mark.parametrize('suffix', ['.csv', '.jsonl'])
+def test_main_stats(tmp_path, capsys, suffix: str):
+    path = tmp_path / f'stats{suffix}'
+    batch.main(['--height', '10', '--width', '10', '-n', '5', '--engine', 'flat', '--stats', str(path)])
+    capsys.readouterr()
+    lines = path.read_text(encoding='utf-8').splitlines()
+    if suffix == '.csv':
+        assert lines[0].startswith('generation,population')
+        assert len(lines) == 6
+    else:
+        assert [json.loads(line)['generation'] for line in lines] == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.parametrize('snapshot_format', ['rle', 'checkpoint'])
+def test_main_snapshots(tmp_path, capsys, snapshot_format: str):
+    arguments = ['--height', '10', '--width', '12', '-n', '5', '--engine', 'flat', '--snapshots', str(tmp_path),
+                 '--snapshot-every', '2', '--snapshot-format', snapshot_format]
+    batch.main(arguments)
+    capsys.readouterr()
+    suffix = batch.SNAPSHOT_FORMATS[snapshot_format]
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        f'generation-{generation:08d}{suffix}' for generation in (0, 2, 4)
+    ]
+    if snapshot_format == 'checkpoint':
+        assert checkpoint.read_header(tmp_path / f'generation-00000004{suffix}').generation == 4
+
+
+def test_main_workers(capsys):
+    pytest.importorskip('numpy')
+    batch.main(['--height', '20', '--width', '20', '-n', '3', '--seed', '1', '--engine', 'tiled', '--workers', '2'])
+    assert report_of(capsys.readouterr().out)['engine'] == 'TiledGameOfLife'
+
+
+def test_main_scaling(capsys):
+    pytest.importorskip('numpy')
+    batch.main(['--height', '40', '--width', '40', '-n', '3', '--seed', '1', '--scaling', '1,2'])
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith('cpus: ')
+    assert lines[1].startswith('workers: 1,') and lines[1].endswith('speed-up: 1.00')
+    assert lines[2].startswith('workers: 2,')
+
+
+@pytest.mark.parametrize('arguments', [
+    ['--density', '1.5'], ['--height', '2'], ['-n', '0'], ['--engine', 'gpu'], ['--workers', '2'],
+    ['--scaling', '1,x'], ['--scaling', '0'],
+])
+def test_main_invalid_arguments(capsys, arguments: list[str]):
+    with pytest.raises(SystemExit):
+        batch.main(arguments)
+    assert 'error' in capsys.readouterr().err
@@ -4,6 +4,7 @@ import blessed
 import pytest
 
 from pygames.game_of_life.game_of_life import GameOfLife
+from pygames.game_of_life.history import History
 from pygames.game_of_life.ui import console
 
 
@@ -34,7 +35,7 @@ def test_rendered(controller: console.TerminalController, capsys):
     assert output.startswith(population_string), repr(output)
     output = output.replace(population_string, '')
 
-    instructions_string = 'Exit: "Q", Restart: "R", Toggle boundaries: "B" (off)'
+    instructions_string = 'Exit: "Q", Restart: "R", Toggle boundaries: "B" (off), Pause: "P"'
     assert output.endswith(instructions_string), repr(output)
     output = output.replace(instructions_string, '')
 
@@ -60,7 +61,7 @@ def test_show_population_shortens(controller: console.TerminalController, capsys
 def test_show_menu(controller: console.TerminalController, capsys):
     controller._show_instructions()
     captured = capsys.readouterr()
-    assert captured.out == 'Exit: "Q", Restart: "R", Toggle boundaries: "B" (off)', repr(captured.out)
+    assert captured.out == 'Exit: "Q", Restart: "R", Toggle boundaries: "B" (off), Pause: "P"', repr(captured.out)
 
 
 def test_process_reset_key(controller: console.TerminalController):
@@ -81,10 +82,122 @@ def test_menu_changes_boundaries(controller: console.TerminalController, capsys)
     controller._show_instructions()
     captured = capsys.readouterr()
     boundaries_state = 'on' if controller.game.boundaries else 'off'
-    assert captured.out == f'Exit: "Q", Restart: "R", Toggle boundaries: "B" ({boundaries_state})', repr(captured.out)
+    expected = f'Exit: "Q", Restart: "R", Toggle boundaries: "B" ({boundaries_state}), Pause: "P"'
+    assert captured.out == expected, repr(captured.out)
 
     controller.game.boundaries = not controller.game.boundaries
     controller._show_instructions()
     captured = capsys.readouterr()
     boundaries_state = 'on' if controller.game.boundaries else 'off'
-    assert captured.out == f'Exit: "Q", Restart: "R", Toggle boundaries: "B" ({boundaries_state})', repr(captured.out)
+    expected = f'Exit: "Q", Restart: "R", Toggle boundaries: "B" ({boundaries_state}), Pause: "P"'
+    assert captured.out == expected, repr(captured.out)
+
+
+def test_show_stability(controller: console.TerminalController, capsys):
+    controller._show_stability(None)
+    assert capsys.readouterr().out == ''
+    controller._show_stability(2)
+    assert capsys.readouterr().out == 'stable (period 2)'.rjust(console.STABILITY_WIDTH)
+    controller._show_stability(2)
+    assert capsys.readouterr().out == ''
+    controller._show_stability(None)
+    assert capsys.readouterr().out == ' ' * console.STABILITY_WIDTH
+
+
+@pytest.fixture(name='history_controller')
+def history_controller_fixture():
+    term = blessed.Terminal()
+    game = GameOfLife(width=10, height=8, boundaries=True)
+    game.state = [[int(row == 3 and 1 <= col <= 3) for col in range(10)] for row in range(8)]
+    game.history = History(keyframe_interval=4)
+    yield console.TerminalController(terminal=term, game=game)
+
+
+def test_process_pause_key(history_controller: console.TerminalController, capsys):
+    history_controller._process_key('p')
+    assert history_controller.paused
+    history_controller._show_instructions()
+    expected = 'Exit: "Q", Generation 0, Resume: "P", Back: "<", Forward: ">", Seek: N "G"'
+    assert capsys.readouterr().out == expected
+    history_controller._process_key('P')
+    assert not history_controller.paused
+
+
+def test_process_back_and_forward_keys(history_controller: console.TerminalController):
+    game = history_controller.game
+    states = [copy.deepcopy(game.state)]
+    for _ in range(3):
+        history_controller._process_key('.')
+        states.append(copy.deepcopy(game.state))
+    assert history_controller.paused
+    assert game.generation == 3
+    for generation in (2, 1, 0):
+        history_controller._process_key(',')
+        assert game.generation == generation
+        assert game.state == states[generation]
+    history_controller._process_key('<')
+    assert game.generation == 0
+
+
+def test_process_seek_keys(history_controller: console.TerminalController):
+    game = history_controller.game
+    for key in '12g':
+        history_controller._process_key(key)
+    assert game.generation == 12
+    for key in '5G':
+        history_controller._process_key(key)
+    assert game.generation == 5
+    assert game.state == [[int(col == 2 and 2 <= row <= 4) for col in range(10)] for row in range(8)]
+
+
+def test_render_draws_only_changes(capsys):
+    term = blessed.Terminal()
+    game = GameOfLife(width=10, height=8, boundaries=True)
+    game.state = [[int(row == 3 and 1 <= col <= 3) for col in range(10)] for row in range(8)]
+    controller = console.TerminalController(terminal=term, game=game)
+    controller._render_screen()
+    first = capsys.readouterr().out
+    assert controller.frame_bytes == len(first.encode())
+    game.update()
+    controller._render_screen()
+    second = capsys.readouterr().out
+    assert controller.frame_bytes == len(second.encode()) < len(first.encode())
+    # the blinker turns, only the two cells it gains and the two it loses are drawn
+    assert second == 'Population: 3*  *Exit: "Q", Restart: "R", Toggle boundaries: "B" (on), Pause: "P"'
+
+
+def test_braille_mode(capsys):
+    term = blessed.Terminal()
+    game = GameOfLife(width=8, height=8, boundaries=True)
+    game.state = [[int(row == 1 and 1 <= col <= 3) for col in range(8)] for row in range(8)]
+    controller = console.TerminalController(terminal=term, game=game, mode='braille')
+    controller._show_cells()
+    # two rows of four characters, the blinker covers the second dot row from the right half of the first one
+    assert capsys.readouterr().out == '⠐⠒      '
+
+
+class WindowOnlyGame(GameOfLife):
+    @property
+    def state(self) -> list[list[int]]:
+        raise AssertionError('the whole board is read')
+
+    @state.setter
+    def state(self, value: list[list[int]]):
+        GameOfLife.state.fset(self, value)  # type: ignore[attr-defined]
+
+
+def test_pan_keys(capsys):
+    term = blessed.Terminal()
+    game = WindowOnlyGame(width=200, height=100, boundaries=True)
+    controller = console.TerminalController(terminal=term, game=game)
+    viewport = controller.viewport
+    assert (viewport.height, viewport.width) == (controller.height, controller.width)
+    controller._process_key(blessed.keyboard.Keystroke(code=term.KEY_DOWN, name='KEY_DOWN'))
+    controller._process_key(blessed.keyboard.Keystroke(code=term.KEY_RIGHT, name='KEY_RIGHT'))
+    controller._process_key(blessed.keyboard.Keystroke(code=term.KEY_RIGHT, name='KEY_RIGHT'))
+    assert (viewport.top, viewport.left) == (controller.height // 4, controller.width // 4 * 2)
+    controller._process_key(blessed.keyboard.Keystroke(code=term.KEY_UP, name='KEY_UP'))
+    controller._process_key(blessed.keyboard.Keystroke(code=term.KEY_UP, name='KEY_UP'))
+    assert viewport.top == 0
+    controller._render_screen()
+    assert capsys.readouterr().out.endswith(f', Pan: arrows (0, {controller.width // 4 * 2})')
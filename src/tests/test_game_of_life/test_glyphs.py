@@ -0,0 +1,42 @@
+import pytest
+
+from pygames.game_of_life.ui import glyphs
+
+ROWS = [
+    [1, 0, 1, 1, 0],
+    [0, 1, 1, 0, 0],
+    [1, 1, 1, 1, 1],
+    [0, 0, 0, 0, 1],
+    [1, 1, 0, 0, 0],
+]
+
+
+@pytest.mark.parametrize('mode,lines', [
+    ('text', ['* ** ', ' **  ', '*****', '    *', '**   ']),
+    ('half', ['▀▄█▀ ', '▀▀▀▀█', '▀▀   ']),
+    ('braille', ['⠵⠯⡄', '⠉  ']),
+])
+def test_render(mode: str, lines: list[str]):
+    assert glyphs.MODES[mode].render(ROWS) == lines
+
+
+@pytest.mark.parametrize('mode', sorted(glyphs.MODES))
+def test_render_every_mask(mode: str):
+    render_mode = glyphs.MODES[mode]
+    height, width = render_mode.cell_height, render_mode.cell_width
+    for mask in range(1 << (height * width)):
+        rows = [[mask >> (row * width + col) & 1 for col in range(width)] for row in range(height)]
+        assert render_mode.render(rows) == [render_mode.glyphs[mask]]
+
+
+def test_braille_dots():
+    braille = glyphs.MODES['braille']
+    assert braille.glyphs[0] == ' '
+    # all eight dots
+    assert braille.glyphs[0xFF] == '⣿'
+    # left column, top to bottom: dots 1, 2, 3 and 7
+    assert [braille.glyphs[1 << (row * 2)] for row in range(4)] == ['⠁', '⠂', '⠄', '⡀']
+
+
+def test_render_empty():
+    assert not glyphs.MODES['braille'].render([])
@@ -0,0 +1,186 @@
+import copy
+import random
+
+import pytest
+
+from pygames.game_of_life.engines import hashlife, sparse
+from pygames.game_of_life.game_of_life import GameOfLife
+from pygames.game_of_life.stats import GenerationStats
+from tests.test_game_of_life.helpers import random_state
+
+GLIDER = [
+    [0, 1, 0],
+    [0, 0, 1],
+    [1, 1, 1],
+]
+
+
+def place(pattern: list[list[int]], height: int, width: int, top: int, left: int) -> list[list[int]]:
+    # pylint: disable = too-many-arguments, too-many-positional-arguments
+    state = [[0] * width for _ in range(height)]
+    for row, cells in enumerate(pattern):
+        state[top + row][left:left + len(cells)] = cells
+    return state
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_matches_reference_away_from_edges(seed: int):
+    rng = random.Random(seed)
+    soup = [[rng.randint(0, 1) for _ in range(8)] for _ in range(8)]
+    state = place(soup, 40, 40, 16, 16)
+    game = hashlife.HashlifeGameOfLife(height=40, width=40)
+    reference = GameOfLife(height=40, width=40, boundaries=True)
+    game.state, reference.state = state, copy.deepcopy(state)
+    for _ in range(10):
+        game.update()
+        reference.update()
+        assert game.state == reference.state
+        assert game.population == reference.population
+    assert game.generation == 10
+
+
+@pytest.mark.parametrize('generations', [0, 1, 2, 5, 16, 37])
+def test_advance_equals_single_steps(generations: int):
+    rng = random.Random(generations)
+    state = [[rng.randint(0, 1) for _ in range(12)] for _ in range(10)]
+    jumping = hashlife.HashlifeGameOfLife(height=10, width=12)
+    stepping = hashlife.HashlifeGameOfLife(height=10, width=12)
+    jumping.state, stepping.state = state, state
+    jumping.advance(generations)
+    for _ in range(generations):
+        stepping.update()
+    assert jumping.state == stepping.state
+    assert jumping.population == stepping.population
+    assert jumping.generation == stepping.generation == generations
+
+
+def test_glider_travels_far():
+    game = hashlife.HashlifeGameOfLife(height=10, width=10)
+    game.state = place(GLIDER, 10, 10, 0, 0)
+    game.advance(4 * 10 ** 6)
+    assert game.population == 5
+    # the glider moved a million cells down and right, far out of the window
+    assert game.state == place([], 10, 10, 0, 0)
+    game.advance(0)
+    assert game.generation == 4 * 10 ** 6
+
+
+def test_glider_in_window():
+    game = hashlife.HashlifeGameOfLife(height=10, width=10)
+    game.state = place(GLIDER, 10, 10, 0, 0)
+    game.advance(8)
+    assert game.state == place(GLIDER, 10, 10, 2, 2)
+
+
+def test_region_follows_glider():
+    game = hashlife.HashlifeGameOfLife(height=10, width=10)
+    game.state = place(GLIDER, 10, 10, 0, 0)
+    game.advance(4 * 1000)
+    assert game.region(1000, 1000, 3, 3) == GLIDER
+    game.origin = (995, 995)
+    assert game.state == place(GLIDER, 10, 10, 5, 5)
+
+
+def test_cache_info():
+    game = hashlife.HashlifeGameOfLife(height=10, width=10)
+    game.state = place(GLIDER, 10, 10, 0, 0)
+    for _ in range(64):
+        game.update()
+    info = game.cache_info()
+    assert info.nodes > 0
+    assert info.results > 0
+    assert info.hits > 0 and info.misses > 0
+    assert 0 < info.hit_rate < 1
+    assert hashlife.CacheInfo(0, 0, 0, 0, 0).hit_rate == 0
+
+
+def test_garbage_collection_keeps_results_correct():
+    rng = random.Random(7)
+    state = [[rng.randint(0, 1) for _ in range(16)] for _ in range(16)]
+    capped = hashlife.HashlifeGameOfLife(height=16, width=16, max_nodes=200)
+    uncapped = hashlife.HashlifeGameOfLife(height=16, width=16)
+    capped.state, uncapped.state = state, state
+    for _ in range(5):
+        capped.advance(23)
+        uncapped.advance(23)
+        assert capped.state == uncapped.state
+    assert capped.cache_info().collections > 0
+    assert uncapped.cache_info().collections == 0
+
+
+@pytest.mark.parametrize('pattern', [
+    [[1, 1, 1]],
+    [[0, 1, 1, 1], [1, 1, 1, 0]],
+    [[1, 1, 0, 0], [1, 1, 0, 0], [0, 0, 1, 1], [0, 0, 1, 1]],
+])
+def test_cycles_found_across_garbage_collections(pattern: list[list[int]]):
+    # the hash of a board does not depend on which nodes happen to be alive in the cache
+    game = hashlife.HashlifeGameOfLife(height=10, width=10, max_nodes=50)
+    game.state = place(pattern, 10, 10, 3, 3)
+    assert game.run_until_stable(max_generations=10) == 2
+    assert game.cache_info().collections > 0
+
+
+def test_hash_matches_sparse_engine():
+    state = random_state(12, 16, seed=11, density=0.4)
+    game = hashlife.HashlifeGameOfLife(height=12, width=16, max_nodes=100)
+    reference = sparse.SparseGameOfLife(height=12, width=16)
+    game.state, reference.state = copy.deepcopy(state), copy.deepcopy(state)
+    for _ in range(20):
+        assert game.board_hash == reference.board_hash
+        game.update()
+        reference.update()
+    game.advance(7)
+    for _ in range(7):
+        reference.update()
+    assert game.board_hash == reference.board_hash
+
+
+def test_rule_change_matches_reference():
+    rng = random.Random(11)
+    soup = [[rng.randint(0, 1) for _ in range(8)] for _ in range(8)]
+    state = place(soup, 40, 40, 16, 16)
+    game = hashlife.HashlifeGameOfLife(height=40, width=40)
+    reference = GameOfLife(height=40, width=40, boundaries=True)
+    game.state, reference.state = state, copy.deepcopy(state)
+    game.advance(4)
+    for _ in range(4):
+        reference.update()
+    game.rule = reference.rule = 'highlife'
+    game.advance(6)
+    for _ in range(6):
+        reference.update()
+    assert game.state == reference.state
+
+
+def test_rule_with_birth_on_zero_refused():
+    with pytest.raises(ValueError):
+        hashlife.HashlifeGameOfLife(rule='B0/S8')
+
+
+def test_no_time_travel():
+    game = hashlife.HashlifeGameOfLife()
+    with pytest.raises(ValueError):
+        game.advance(-1)
+
+
+def test_state_wrong_shape():
+    game = hashlife.HashlifeGameOfLife(height=3, width=4)
+    with pytest.raises(ValueError):
+        game.state = [[1, 0], [0, 1]]
+
+
+def test_stats_follow_glider_across_jumps():
+    game = hashlife.HashlifeGameOfLife(height=10, width=10)
+    collected: list[GenerationStats] = []
+    game.stats_sink = collected.append
+    game.state = place(GLIDER, 10, 10, 0, 0)
+    assert game.stats.bounding_box == (0, 0, 2, 2)
+    game.advance(4 * 1000)
+    game.advance(0)
+    assert collected == [game.stats]
+    assert game.stats.generation == 4000
+    assert game.stats.population == 5
+    assert game.stats.births is game.stats.deaths is None
+    assert game.stats.bounding_box == (1000, 1000, 1002, 1002)
+    assert game.stats.density == 5 / 9
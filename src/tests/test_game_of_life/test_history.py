@@ -0,0 +1,83 @@
+import functools
+import random
+
+import pytest
+
+from pygames.game_of_life.history import History
+
+
+def random_boards(count: int, size: int, seed: int = 0) -> list[bytes]:
+    rng = random.Random(seed)
+    return [bytes(rng.randint(0, 1) for _ in range(size)) for _ in range(count)]
+
+
+def flips(previous: bytes, current: bytes) -> list[int]:
+    return [index for index, (old, new) in enumerate(zip(previous, current)) if old != new]
+
+
+def recorded(boards: list[bytes], **kwargs) -> History:
+    history = History(**kwargs)
+    history.start(0, boards[0])
+    for generation, (previous, current) in enumerate(zip(boards, boards[1:]), start=1):
+        history.record(generation, flips(previous, current), functools.partial(bytes, current))
+    return history
+
+
+def test_step_back_restores_every_generation():
+    boards = random_boards(20, 30)
+    history = recorded(boards, keyframe_interval=5)
+    for generation in reversed(range(19)):
+        assert history.step_back() == boards[generation]
+        assert history.generation == generation
+        assert list(history.flipped) == flips(boards[generation], boards[generation + 1])
+    with pytest.raises(ValueError):
+        history.step_back()
+
+
+@pytest.mark.parametrize('targets', [[7, 3, 19, 0, 12, 13, 11], [19, 18, 1, 2]])
+def test_seek(targets: list[int]):
+    boards = random_boards(20, 30)
+    history = recorded(boards, keyframe_interval=4)
+    for target in targets:
+        previous = history.generation
+        assert history.seek(target) == boards[target]
+        assert history.generation == target
+        assert sorted(history.flipped) == flips(boards[previous], boards[target])
+    with pytest.raises(ValueError):
+        history.seek(20)
+
+
+def test_record_after_seek_drops_the_future():
+    boards = random_boards(10, 16)
+    history = recorded(boards, keyframe_interval=3)
+    history.seek(4)
+    other = random_boards(1, 16, seed=1)[0]
+    history.record(5, flips(boards[4], other), lambda: other)
+    assert history.last == 5
+    assert history.seek(5) == other
+    assert history.seek(2) == boards[2]
+
+
+def test_record_without_flips_makes_keyframe():
+    boards = random_boards(6, 16)
+    history = History(keyframe_interval=100)
+    history.start(0, boards[0])
+    history.record(1, flips(boards[0], boards[1]), lambda: boards[1])
+    # a jump over generations 2..4 leaves a gap in the history
+    history.record(5, None, lambda: boards[5])
+    assert history.seek(5) == boards[5]
+    assert history.seek(1) == boards[1]
+    with pytest.raises(ValueError):
+        history.seek(3)
+
+
+def test_eviction_keeps_budget_and_recent_history():
+    boards = random_boards(200, 400)
+    unbounded = recorded(boards, keyframe_interval=10)
+    history = recorded(boards, keyframe_interval=10, max_bytes=unbounded.size // 4)
+    assert history.size <= unbounded.size // 4
+    assert history.first > 0
+    assert history.seek(history.first) == boards[history.first]
+    assert history.seek(199) == boards[199]
+    with pytest.raises(ValueError):
+        history.seek(history.first - 1)
@@ -0,0 +1,170 @@
+import io
+
+import pytest
+
+from pygames.game_of_life import engines, patterns
+from pygames.game_of_life.rules import Rule
+from pygames.game_of_life.stats import BoundingBox
+from tests.test_game_of_life.helpers import BOUNDED_ENGINES, UNBOUNDED_ENGINES, random_state
+
+GLIDER_RLE = """#N Glider
+#C The smallest spaceship.
+x = 3, y = 3, rule = B3/S23
+bob$2bo$3o!
+"""
+GLIDER = [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
+
+
+def live_cells(state: list[list[int]]) -> set[tuple[int, int]]:
+    return {(row, col) for row, cells in enumerate(state) for col, cell in enumerate(cells) if cell}
+
+
+def test_read_rle():
+    info, runs = patterns.read_rle(io.StringIO(GLIDER_RLE))
+    assert info.name == 'Glider'
+    assert info.comments == ('The smallest spaceship.',)
+    assert (info.width, info.height, info.rule) == (3, 3, Rule.parse('B3/S23'))
+    assert list(runs) == [(0, 1, 1), (1, 2, 1), (2, 0, 3)]
+
+
+def test_read_rle_across_chunks(monkeypatch):
+    monkeypatch.setattr(patterns, 'READ_SIZE', 3)
+    _, runs = patterns.read_rle(io.StringIO('x = 30, y = 3\n12b18o$\n$\n30o!'))
+    assert list(runs) == [(0, 12, 18), (2, 0, 30)]
+
+
+def test_read_rle_invalid():
+    _, runs = patterns.read_rle(io.StringIO('x = 3, y = 1\n2b?!'))
+    with pytest.raises(ValueError):
+        list(runs)
+
+
+def test_read_plaintext():
+    info, runs = patterns.read_plaintext(io.StringIO('!Name: Glider\n!A comment\n.O\n..O\nOOO\n'))
+    assert info.name == 'Glider'
+    assert info.comments == ('A comment',)
+    assert list(runs) == [(0, 1, 1), (1, 2, 1), (2, 0, 3)]
+
+
+@pytest.mark.parametrize('engine', sorted(engines.ENGINES))
+def test_load_places_pattern(engine: str):
+    game = engines.create_game(engine, height=10, width=10)
+    info = patterns.load(game, io.StringIO(GLIDER_RLE), top=4, left=5)
+    assert info.name == 'Glider'
+    assert live_cells(game.region(0, 0, 10, 10)) == {(row + 4, col + 5) for row, col in GLIDER}
+    assert game.population == len(GLIDER)
+
+
+@pytest.mark.parametrize('engine', sorted(engines.ENGINES))
+def test_load_applies_rule(engine: str):
+    game = engines.create_game(engine, height=10, width=10)
+    patterns.load(game, io.StringIO('x = 1, y = 1, rule = B36/S23\no!'), pattern_format='rle')
+    assert game.rule == Rule.parse('B36/S23')
+
+
+@pytest.mark.parametrize('engine', BOUNDED_ENGINES)
+@pytest.mark.parametrize('top,left', [(8, 0), (0, 8), (-1, 0)])
+def test_load_outside_the_board(engine: str, top: int, left: int):
+    game = engines.create_game(engine, height=10, width=10)
+    with pytest.raises(ValueError):
+        patterns.load(game, io.StringIO(GLIDER_RLE), top=top, left=left)
+
+
+@pytest.mark.parametrize('engine', BOUNDED_ENGINES)
+def test_load_undeclared_size_outside_the_board(engine: str):
+    game = engines.create_game(engine, height=10, width=10)
+    with pytest.raises(ValueError):
+        patterns.load(game, io.StringIO('.O\n' * 11), pattern_format='plaintext')
+    assert game.population == 0
+
+
+@pytest.mark.parametrize('engine', BOUNDED_ENGINES)
+def test_failed_load_leaves_a_playable_empty_board(engine: str):
+    game = engines.create_game(engine, height=10, width=10)
+    game.state = random_state(10, 10)
+    with pytest.raises(ValueError):
+        patterns.load(game, io.StringIO('x = 0, y = 0, rule = B36/S23\n2o$13o!'), pattern_format='rle')
+    assert game.rule == Rule.parse('B3/S23')
+    assert game.population == 0
+    assert game.state == [[0] * 10 for _ in range(10)]
+    game.update()
+    assert game.population == 0
+
+
+@pytest.mark.parametrize('engine', UNBOUNDED_ENGINES)
+def test_load_at_negative_origin(engine: str):
+    game = engines.create_game(engine, height=10, width=10)
+    patterns.load(game, io.StringIO(GLIDER_RLE), top=-40, left=-70)
+    assert live_cells(game.region(-40, -70, 3, 3)) == set(GLIDER)
+    assert game.stats.bounding_box == BoundingBox(-40, -70, -38, -68)
+
+
+@pytest.mark.parametrize('engine', sorted(engines.ENGINES))
+def test_load_runs_matches_state(engine: str):
+    state = random_state(12, 17, seed=len(engine))
+    runs = [(row, col, 1) for row, col in live_cells(state)]
+    expected = engines.create_game(engine, height=12, width=17)
+    expected.state = state
+    game = engines.create_game(engine, height=12, width=17)
+    game.load_runs(runs)
+    assert game.region(0, 0, 12, 17) == expected.region(0, 0, 12, 17)
+    assert game.population == expected.population
+    if engine != 'hashlife':
+        # hashlife hashes its canonical nodes, which depend on how the pattern is aligned within them
+        assert game.board_hash == expected.board_hash
+    assert game.stats.bounding_box == expected.stats.bounding_box
+    game.update()
+    expected.update()
+    assert game.region(-1, -1, 14, 19) == expected.region(-1, -1, 14, 19)
+
+
+@pytest.mark.parametrize('engine', sorted(engines.ENGINES))
+@pytest.mark.parametrize('pattern_format', ['rle', 'plaintext'])
+def test_round_trip(engine: str, pattern_format: str):
+    state = random_state(20, 90, seed=3)
+    game = engines.create_game(engine, height=20, width=90)
+    game.state = state
+    file = io.StringIO()
+    patterns.save(game, file, name='Soup', pattern_format=pattern_format)
+    if pattern_format == 'rle':
+        assert all(len(line) <= patterns.RLE_LINE_LENGTH for line in file.getvalue().splitlines()[2:])
+    loaded = engines.create_game(engine, height=20, width=90)
+    box = game.stats.bounding_box
+    assert box is not None
+    file.seek(0)
+    info = patterns.load(loaded, file, top=box.top, left=box.left, pattern_format=pattern_format)
+    assert info.name == 'Soup'
+    assert live_cells(loaded.region(0, 0, 20, 90)) == live_cells(state)
+
+
+def test_save_area(monkeypatch):
+    monkeypatch.setattr(patterns, 'BAND_HEIGHT', 2)
+    game = engines.create_game('flat', height=10, width=10)
+    patterns.load(game, io.StringIO(GLIDER_RLE), top=4, left=5)
+    file = io.StringIO()
+    patterns.save(game, file, area=BoundingBox(3, 4, 8, 8), pattern_format='rle')
+    assert file.getvalue() == 'x = 5, y = 6, rule = B3/S23\n$2bo$3bo$b3o!\n'
+
+
+def test_save_empty_board():
+    game = engines.create_game('flat', height=10, width=10)
+    game.state = [[]]
+    file = io.StringIO()
+    patterns.save(game, file, pattern_format='rle')
+    assert file.getvalue() == 'x = 0, y = 0, rule = B3/S23\n!\n'
+
+
+def test_format_from_file_name(tmp_path):
+    game = engines.create_game('flat', height=10, width=10)
+    patterns.load(game, io.StringIO(GLIDER_RLE))
+    path = tmp_path / 'glider.cells'
+    patterns.save(game, path)
+    assert path.read_text(encoding='utf-8') == '.O\n..O\nOOO\n'
+    patterns.load(game, path, top=1, left=1)
+    assert live_cells(game.state) == {(row + 1, col + 1) for row, col in GLIDER}
+
+
+def test_unknown_format():
+    game = engines.create_game('flat', height=10, width=10)
+    with pytest.raises(ValueError):
+        patterns.load(game, io.StringIO(GLIDER_RLE), pattern_format='mcell')
@@ -0,0 +1,72 @@
+import pytest
+
+from pygames.game_of_life import rules
+
+
+@pytest.mark.parametrize(
+    'notation',
+    ['B36/S23', 'b36/s23', 'S23/B36', '23/36', ' B63/S32 ', 'HighLife', 'highlife'],
+)
+def test_parse_highlife(notation: str):
+    rule = rules.Rule.parse(notation)
+    assert rule.birth == {3, 6}
+    assert rule.survival == {2, 3}
+    assert str(rule) == 'B36/S23'
+
+
+@pytest.mark.parametrize(
+    'notation,birth,survival',
+    [
+        ('B2/S', {2}, set()),
+        ('B/S012345678', set(), set(range(9))),
+        ('day-and-night', {3, 6, 7, 8}, {3, 4, 6, 7, 8}),
+    ]
+)
+def test_parse(notation: str, birth: set[int], survival: set[int]):
+    rule = rules.Rule.parse(notation)
+    assert rule.birth == birth
+    assert rule.survival == survival
+
+
+@pytest.mark.parametrize('notation', ['', 'B3', 'B3/S23/X', 'B9/S23', 'life', 'B3/Sx'])
+def test_parse_invalid(notation: str):
+    with pytest.raises(ValueError):
+        rules.Rule.parse(notation)
+
+
+def test_parse_rule_instance():
+    assert rules.Rule.parse(rules.CONWAY) is rules.CONWAY
+
+
+def test_named_rules_parse():
+    for name, notation in rules.NAMED_RULES.items():
+        assert str(rules.Rule.parse(name)) == notation
+
+
+def test_rules_compare_by_counts():
+    assert rules.Rule.parse('B3/S23') == rules.CONWAY
+    assert rules.Rule.parse('S32/B3') == rules.CONWAY
+    assert rules.Rule.parse('B36/S23') != rules.CONWAY
+    assert len({rules.CONWAY, rules.Rule.parse('23/3')}) == 1
+
+
+def test_conway_table():
+    table = rules.CONWAY.table
+    assert len(table) == 2 * rules.COUNTS
+    assert [count for count in range(rules.COUNTS) if table[count]] == [3]
+    assert [count for count in range(rules.COUNTS) if table[rules.COUNTS + count]] == [2, 3]
+
+
+@pytest.mark.parametrize(
+    'neighbourhood,expected',
+    [
+        ([[0, 0, 0], [0, 1, 0], [0, 0, 0]], 0),
+        ([[1, 1, 0], [0, 0, 0], [0, 0, 1]], 1),
+        ([[1, 1, 0], [0, 1, 0], [0, 0, 0]], 1),
+        ([[1, 1, 1], [1, 0, 0], [0, 0, 0]], 0),
+        ([[1, 1, 1], [1, 1, 1], [1, 1, 1]], 0),
+    ]
+)
+def test_conway_mask_table(neighbourhood: list[list[int]], expected: int):
+    mask = sum(cell << position for position, cell in enumerate(sum(neighbourhood, [])))
+    assert rules.CONWAY.mask_table[mask] == expected
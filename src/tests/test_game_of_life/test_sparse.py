@@ -0,0 +1,121 @@
+import copy
+import random
+
+import pytest
+
+from pygames.game_of_life.engines import sparse
+from pygames.game_of_life.game_of_life import GameOfLife
+
+GLIDER = [
+    [0, 1, 0],
+    [0, 0, 1],
+    [1, 1, 1],
+]
+
+
+def empty(height: int, width: int) -> list[list[int]]:
+    return [[0] * width for _ in range(height)]
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_matches_reference_away_from_edges(seed: int):
+    rng = random.Random(seed)
+    state = empty(60, 60)
+    for row in range(22, 38):
+        state[row][22:38] = [rng.randint(0, 1) for _ in range(16)]
+    game = sparse.SparseGameOfLife(height=60, width=60)
+    reference = GameOfLife(height=60, width=60, boundaries=True)
+    game.state, reference.state = state, copy.deepcopy(state)
+    for _ in range(15):
+        game.update()
+        reference.update()
+        assert game.state == reference.state
+        assert game.population == reference.population
+        assert game.board_hash == reference.board_hash
+
+
+def test_glider_leaves_window_and_memory_follows():
+    game = sparse.SparseGameOfLife(height=5, width=5)
+    state = empty(5, 5)
+    state[:3] = [row + [0, 0] for row in GLIDER]
+    game.state = state
+    for _ in range(4 * 100):
+        game.update()
+    assert game.population == 5
+    assert game.state == empty(5, 5)
+    assert game.region(100, 100, 3, 3) == GLIDER
+    # the glider never touches more than four chunks at a time
+    assert 1 <= len(game.chunks) <= 4
+
+
+def test_glider_crosses_negative_coordinates():
+    game = sparse.SparseGameOfLife(height=5, width=5)
+    game.origin = (-40, -40)
+    state = empty(5, 5)
+    state[:3] = [list(reversed(row)) + [0, 0] for row in reversed(GLIDER)]
+    game.state = state
+    for _ in range(4 * 20):
+        game.update()
+    assert game.region(-60, -60, 3, 3) == [list(reversed(row)) for row in reversed(GLIDER)]
+
+
+def test_dead_chunks_are_freed():
+    game = sparse.SparseGameOfLife(height=5, width=5)
+    game.state = empty(5, 5)
+    game.set_cell(1000, -1000, 1)
+    assert list(game.chunks) == [(1000 // sparse.CHUNK_SIZE, -1000 // sparse.CHUNK_SIZE)]
+    game.update()
+    assert not game.chunks
+    game.set_cell(5, 5, 1)
+    game.set_cell(5, 5, 0)
+    assert not game.chunks
+
+
+def test_region_spans_chunks():
+    game = sparse.SparseGameOfLife(height=5, width=5)
+    game.state = empty(5, 5)
+    cells = {(-1, -1), (0, 0), (15, 16), (16, 15), (31, 31)}
+    for row, col in cells:
+        game.set_cell(row, col, 1)
+    region = game.region(-2, -2, 36, 36)
+    assert {(row - 2, col - 2) for row, cells_row in enumerate(region) for col, cell in enumerate(cells_row) if cell} \
+        == cells
+    assert game.population == len(cells)
+
+
+def test_state_is_window_at_origin():
+    game = sparse.SparseGameOfLife(height=3, width=3)
+    game.state = GLIDER
+    game.origin = (1, 1)
+    assert game.state == [
+        [0, 1, 0],
+        [1, 1, 0],
+        [0, 0, 0],
+    ]
+
+
+def test_rule_with_birth_on_zero_refused():
+    with pytest.raises(ValueError):
+        sparse.SparseGameOfLife(rule='B0/S8')
+
+
+def test_state_wrong_shape():
+    game = sparse.SparseGameOfLife(height=3, width=4)
+    with pytest.raises(ValueError):
+        game.state = [[1, 0], [0, 1]]
+
+
+def test_stats_follow_glider_across_chunks():
+    game = sparse.SparseGameOfLife(height=5, width=5)
+    game.origin = (-20, -20)
+    state = empty(5, 5)
+    state[:3] = [row + [0, 0] for row in GLIDER]
+    game.state = state
+    assert game.stats.bounding_box == (-20, -20, -18, -18)
+    for _ in range(4 * 10):
+        game.update()
+        assert game.stats.births == game.stats.deaths
+    assert game.stats.population == game.population == 5
+    assert game.stats.bounding_box == (-10, -10, -8, -8)
+    game.set_cell(30, -50, 1)
+    assert game.population == 6
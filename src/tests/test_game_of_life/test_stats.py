@@ -0,0 +1,79 @@
+import csv
+import io
+import json
+
+from pygames.game_of_life.game_of_life import GameOfLife
+from pygames.game_of_life.stats import BoundingBox, CsvSink, GenerationStats, JsonLinesSink
+
+BLINKER = [
+    [0, 0, 0, 0, 0],
+    [0, 0, 1, 0, 0],
+    [0, 0, 1, 0, 0],
+    [0, 0, 1, 0, 0],
+    [0, 0, 0, 0, 0],
+]
+
+
+def blinker_game() -> GameOfLife:
+    game = GameOfLife(height=5, width=5, boundaries=True)
+    game.state = [list(row) for row in BLINKER]
+    return game
+
+
+def test_loaded_state_stats():
+    game = blinker_game()
+    assert game.generation == 0
+    assert game.stats == GenerationStats(0, 3, None, None, BoundingBox(1, 2, 3, 2), 3 / 25)
+    assert game.stats.bounding_box.area == 3
+
+
+def test_update_stats():
+    game = blinker_game()
+    game.update()
+    assert game.stats == GenerationStats(1, 3, 2, 2, BoundingBox(2, 1, 2, 3), 3 / 25)
+    assert game.population == 3
+
+
+def test_empty_board_stats():
+    game = blinker_game()
+    game.state = [[0] * 5 for _ in range(5)]
+    game.update()
+    assert game.stats == GenerationStats(1, 0, 0, 0, None, 0.0)
+
+
+def test_callback_sink():
+    game = blinker_game()
+    collected: list[GenerationStats] = []
+    game.stats_sink = collected.append
+    for _ in range(3):
+        game.update()
+    assert [stats.generation for stats in collected] == [1, 2, 3]
+
+
+def test_csv_sink():
+    buffer = io.StringIO()
+    game = blinker_game()
+    with CsvSink(buffer) as sink:
+        game.stats_sink = sink
+        game.update()
+        game.update()
+    rows = list(csv.DictReader(io.StringIO(buffer.getvalue())))
+    assert [row['generation'] for row in rows] == ['1', '2']
+    assert rows[0] == {
+        'generation': '1', 'population': '3', 'births': '2', 'deaths': '2',
+        'top': '2', 'left': '1', 'bottom': '2', 'right': '3', 'density': str(3 / 25),
+    }
+
+
+def test_json_lines_sink_to_path(tmp_path):
+    path = tmp_path / 'stats.jsonl'
+    game = blinker_game()
+    game.state = [[0] * 5 for _ in range(5)]
+    with JsonLinesSink(path) as sink:
+        game.stats_sink = sink
+        game.update()
+    records = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+    assert records == [{
+        'generation': 1, 'population': 0, 'births': 0, 'deaths': 0,
+        'top': None, 'left': None, 'bottom': None, 'right': None, 'density': 0.0,
+    }]
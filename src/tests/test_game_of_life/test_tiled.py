@@ -0,0 +1,67 @@
+import copy
+import random
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+# pylint: disable = wrong-import-position
+from pygames.game_of_life.engines import tiled  # noqa: E402
+from pygames.game_of_life.game_of_life import GameOfLife  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    'height,tiles,expected',
+    [
+        (10, 1, [(0, 10)]),
+        (10, 3, [(0, 4), (4, 7), (7, 10)]),
+        (3, 3, [(0, 1), (1, 2), (2, 3)]),
+    ]
+)
+def test_tile_bounds(height: int, tiles: int, expected: list[tuple[int, int]]):
+    assert tiled.tile_bounds(height, tiles) == expected
+
+
+@pytest.mark.parametrize('workers', [1, 2, 3])
+@pytest.mark.parametrize('boundaries', [False, True])
+def test_matches_reference(workers: int, boundaries: bool):
+    rng = random.Random(workers)
+    state = [[rng.randint(0, 1) for _ in range(13)] for _ in range(9)]
+    reference = GameOfLife(height=9, width=13, boundaries=boundaries)
+    reference.state = copy.deepcopy(state)
+    with tiled.TiledGameOfLife(height=9, width=13, boundaries=boundaries, workers=workers) as game:
+        assert game.workers == workers
+        game.state = state
+        for _ in range(6):
+            game.update()
+            reference.update()
+            assert game.state == reference.state
+            assert game.population == reference.population
+
+
+def test_advance_many_generations_and_toggle_boundaries():
+    rng = random.Random(1)
+    state = [[rng.randint(0, 1) for _ in range(10)] for _ in range(12)]
+    reference = GameOfLife(height=12, width=10, boundaries=True)
+    reference.state = copy.deepcopy(state)
+    with tiled.TiledGameOfLife(height=12, width=10, boundaries=True, workers=3) as game:
+        game.state = state
+        for boundaries in (True, False, True, False):
+            game.boundaries = reference.boundaries = boundaries
+            game.advance(7)
+            for _ in range(7):
+                reference.update()
+            assert game.state == reference.state
+
+
+def test_workers_limited_by_height():
+    with tiled.TiledGameOfLife(height=3, width=5, workers=8) as game:
+        assert game.workers == 3
+
+
+def test_closed_game():
+    game = tiled.TiledGameOfLife(height=4, width=4, workers=2)
+    game.close()
+    with pytest.raises(RuntimeError):
+        game.update()
+    game.advance(0)
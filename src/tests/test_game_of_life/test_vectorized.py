@@ -0,0 +1,60 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+# pylint: disable = wrong-import-position
+from pygames.game_of_life.engines import vectorized  # noqa: E402
+
+
+def test_board_is_uint8():
+    game = vectorized.VectorizedGameOfLife(height=4, width=6)
+    assert game.board.dtype == np.uint8
+    assert game.board.shape == (4, 6)
+
+
+def test_state_round_trip():
+    state = [
+        [0, 1, 0, 0],
+        [1, 1, 0, 1],
+        [0, 0, 0, 1],
+    ]
+    game = vectorized.VectorizedGameOfLife(height=3, width=4)
+    game.state = state
+    assert game.state == state
+    assert game.population == 5
+
+
+def test_state_wrong_shape():
+    game = vectorized.VectorizedGameOfLife(height=3, width=4)
+    with pytest.raises(ValueError):
+        game.state = [[1, 0], [0, 1]]
+
+
+def make_padded():
+    padded = np.zeros((5, 5), dtype=np.uint8)
+    padded[1:-1, 1:-1] = [
+        [1, 0, 2],
+        [0, 0, 0],
+        [3, 0, 4],
+    ]
+    return padded
+
+
+def test_ghost_border_wraps():
+    padded = make_padded()
+    vectorized.fill_ghost_border(padded, boundaries=False)
+    assert padded.tolist() == [
+        [4, 3, 0, 4, 3],
+        [2, 1, 0, 2, 1],
+        [0, 0, 0, 0, 0],
+        [4, 3, 0, 4, 3],
+        [2, 1, 0, 2, 1],
+    ]
+
+
+def test_ghost_border_dead():
+    padded = make_padded()
+    padded[0, :] = padded[:, 0] = 7
+    vectorized.fill_ghost_border(padded, boundaries=True)
+    assert padded[0, :].sum() == padded[-1, :].sum() == padded[:, 0].sum() == padded[:, -1].sum() == 0
+    assert padded[1:-1, 1:-1].sum() == 10
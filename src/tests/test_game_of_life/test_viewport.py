@@ -0,0 +1,37 @@
+import pytest
+
+from pygames.game_of_life import engines
+from pygames.game_of_life.ui.viewport import Viewport
+
+
+@pytest.mark.parametrize('rows,cols,top,left', [
+    (3, 4, 3, 4),
+    (-3, -4, 0, 0),
+    (100, 100, 20, 10),
+])
+def test_pan_within_bounded_board(rows: int, cols: int, top: int, left: int):
+    game = engines.create_game('flat', height=30, width=40)
+    viewport = Viewport(10, 30)
+    viewport.pan(game, rows, cols)
+    assert (viewport.top, viewport.left) == (top, left)
+    assert viewport.larger(game)
+
+
+def test_pan_over_unbounded_plane():
+    game = engines.create_game('sparse', height=10, width=10)
+    viewport = Viewport(10, 10)
+    viewport.pan(game, -50, 70)
+    assert (viewport.top, viewport.left) == (-50, 70)
+    assert viewport.larger(game)
+
+
+@pytest.mark.parametrize('engine', sorted(engines.ENGINES))
+def test_cells_reads_the_window(engine: str):
+    game = engines.create_game(engine, height=30, width=40)
+    game.state = [[int((row + col) % 7 == 0) for col in range(40)] for row in range(30)]
+    viewport = Viewport(6, 9, top=12, left=20)
+    assert viewport.cells(game) == [row[20:29] for row in game.state[12:18]]
+
+
+def test_not_larger():
+    assert not Viewport(10, 12).larger(engines.create_game('flat', height=10, width=12))
@@ -0,0 +1,91 @@
+import random
+
+import pytest
+
+from pygames import snake
+
+np = pytest.importorskip('numpy')
+batched = pytest.importorskip('pygames.snake.batched')
+
+
+def test_starts_like_snake():
+    batch = batched.SnakeBatch(4, height=5, width=6, seed=1)
+    game = snake.Snake(height=5, width=6)
+    for index in range(4):
+        assert batch.cells(index) == list(game.body)
+        assert not batch.occupied[index, batch.fruit[index]]
+    observations = batch.observe()
+    assert observations.shape == (4, 3, 5, 6)
+    assert (observations[:, batched.HEAD, 2, 3] == 1).all()
+    assert (observations[:, batched.FRUIT].sum(axis=(1, 2)) == 1).all()
+
+
+@pytest.mark.parametrize('boundaries', [False, True])
+@pytest.mark.parametrize('seed', range(4))
+def test_steps_like_snake(boundaries: bool, seed: int):
+    """A single game of the batch plays out as `Snake` given the same fruit."""
+    batch = batched.SnakeBatch(1, height=5, width=5, boundaries=boundaries, seed=seed)
+    game = snake.Snake(height=5, width=5, boundaries=boundaries)
+    actions = random.Random(seed)
+    for _ in range(300):
+        score = game.score
+        game.fruit = [int(batch.fruit[0] % 5), int(batch.fruit[0] // 5)]
+        action = actions.randrange(4)
+        game.direction = batched.ACTIONS[action]
+        _, reward, done = batch.step([action])
+        try:
+            game.update()
+        except snake.GameOverException:
+            assert done[0] and reward[0] == batched.DEATH_REWARD
+            assert batch.final_score[0] == game.score
+            game.reset_state()
+            assert batch.cells(0) == list(game.body)
+            continue
+        assert not done[0]
+        assert batch.cells(0) == list(game.body)
+        assert batch.score[0] == game.score
+        assert reward[0] == (batched.FRUIT_REWARD if game.score > score else 0)
+
+
+def test_occupancy_matches_the_body():
+    batch = batched.SnakeBatch(64, height=6, width=6, seed=3)
+    rng = np.random.default_rng(3)
+    for _ in range(500):
+        batch.step(rng.integers(4, size=64))
+        for index in range(0, 64, 7):
+            cells = batch.cells(index)
+            assert len(set(cells)) == len(cells) == batch.occupied[index].sum()
+            assert not batch.occupied[index, batch.fruit[index]]
+    assert batch.final_score.max() > 0
+
+
+def test_reversing_is_ignored():
+    batch = batched.SnakeBatch(1, height=5, width=5, seed=0)
+    batch.step([batched.LEFT])
+    assert batch.cells(0) == [(3, 2)]
+
+
+def test_wall_ends_the_game():
+    batch = batched.SnakeBatch(2, height=3, width=3, boundaries=True, seed=0)
+    batch.fruit[:] = 0
+    _, _, done = batch.step([batched.UP, batched.DOWN])
+    assert not done.any()
+    observations, rewards, done = batch.step([batched.UP, batched.DOWN])
+    assert done.all()
+    assert (rewards == batched.DEATH_REWARD).all()
+    assert (observations[:, batched.HEAD, 1, 1] == 1).all()
+
+
+def test_full_board_ends_the_game():
+    batch = batched.SnakeBatch(1, height=1, width=2, seed=0)
+    assert batch.fruit[0] == 0
+    _, rewards, done = batch.step([batched.RIGHT])
+    assert done[0] and rewards[0] == batched.DEATH_REWARD
+    assert batch.final_score[0] == 1
+
+
+def test_fruit_is_placed_on_free_cells():
+    batch = batched.SnakeBatch(100, height=2, width=2, seed=5)
+    batch.occupied[:] = [True, True, False, True]
+    batch._place_fruit(np.arange(100))  # pylint: disable = protected-access
+    assert (batch.fruit == 2).all()
@@ -0,0 +1,173 @@
+import random
+import time
+
+import pytest
+
+from pygames.snake import replay
+from pygames.snake.snake import Direction, GameOverException
+from pygames.snake.ui import autopilot
+from pygames.snake.ui import replay as replay_cli
+
+
+# pylint: disable = no-member  # pylint does not see `_replace` of typing.NamedTuple
+
+
+def record(seed: int, ticks: int, height: int = 8, width: int = 8, boundaries: bool = False) -> replay.Recorder:
+    """A game steered by random turns, restarted whenever it ends."""
+    recorder = replay.Recorder.new_game(height, width, boundaries, seed)
+    turns = random.Random(seed)
+    for _ in range(ticks):
+        if turns.random() < 0.3:
+            recorder.game.direction = turns.choice(replay.DIRECTIONS)
+        recorder.tick()
+        try:
+            recorder.game.update()
+        except GameOverException:
+            recorder.game.reset_state()
+            recorder.restart()
+    return recorder
+
+
+def test_injected_random_replays_the_game():
+    first, second = record(3, 500), record(3, 500)
+    assert first.game.snake == second.game.snake
+    assert first.game.fruit == second.game.fruit
+
+
+@pytest.mark.parametrize('boundaries', [False, True])
+@pytest.mark.parametrize('seed', range(3))
+def test_replay_matches_the_game(boundaries: bool, seed: int):
+    recorder = record(seed, 1000, boundaries=boundaries)
+    game = replay.replay(recorder.recording())
+    assert game.snake == recorder.game.snake
+    assert game.fruit == recorder.game.fruit
+    assert game.score == recorder.game.score
+
+
+def test_runs_are_encoded_by_length():
+    recorder = replay.Recorder.new_game(10, 10, seed=0)
+    for direction in (Direction.RIGHT,) * 3 + (Direction.DOWN,) * 2:
+        recorder.game.direction = direction
+        recorder.tick()
+        recorder.game.update()
+    recorder.toggle_boundaries()
+    recorder.toggle_boundaries()
+    recording = recorder.recording()
+    right, down = replay.DIRECTIONS.index(Direction.RIGHT), replay.DIRECTIONS.index(Direction.DOWN)
+    assert recording.runs == [(right, 3), (down, 2), (replay.TOGGLE_BOUNDARIES, 2)]
+    assert recording.ticks == 5
+
+
+def test_save_and_load(tmp_path):
+    path = tmp_path / 'game.pgsr'
+    recording = record(1, 2000, boundaries=True).recording()
+    replay.save(recording, path)
+    assert replay.load(path) == recording
+    assert path.stat().st_size < 2000
+
+
+def test_verify():
+    recording = record(2, 2000).recording()
+    assert replay.verify(recording)
+    assert not replay.verify(recording._replace(score=recording.score + 1))
+    assert not replay.verify(recording._replace(seed=recording.seed + 1))
+
+
+@pytest.mark.parametrize('change', [1, -1])
+def test_verify_checks_the_ticks(change: int):
+    recording = record(2, 200).recording()
+    assert not replay.verify(recording._replace(ticks=recording.ticks + change))
+
+
+def test_game_over_before_the_end_of_the_recording():
+    # the wall is hit on the third tick
+    recording = replay.Recording(5, 5, True, 0, [(replay.DIRECTIONS.index(Direction.RIGHT), 4)], 4, 0)
+    with pytest.raises(ValueError):
+        replay.replay(recording)
+    assert not replay.verify(recording)
+
+
+def test_boundaries_are_replayed():
+    recorder = replay.Recorder.new_game(5, 5, boundaries=False, seed=0)
+    for _ in range(2):
+        recorder.tick()
+        recorder.game.update()
+    recorder.game.boundaries = True
+    recorder.toggle_boundaries()
+    recorder.tick()
+    with pytest.raises(GameOverException):
+        recorder.game.update()
+    recorder.game.reset_state()
+    recorder.restart()
+    recorder.tick()
+    recorder.game.update()
+    recording = recorder.recording()
+    game = replay.replay(recording)
+    assert game.boundaries
+    assert game.snake == recorder.game.snake
+    # without the toggle the snake wraps around the edge instead
+    runs = [run for run in recording.runs if run[0] != replay.TOGGLE_BOUNDARIES]
+    assert not replay.replay(recording._replace(runs=runs)).boundaries
+
+
+@pytest.mark.parametrize('change', [
+    lambda data: b'XXXX' + data[4:],
+    lambda data: data[:-1],
+    lambda data: data[:10],
+    lambda data: data[:-5] + bytes([data[-5] ^ 1]) + data[-4:],
+    lambda data: data[:4] + b'\x09\x00' + data[6:],
+])
+def test_load_rejects_broken_files(tmp_path, change):
+    path = tmp_path / 'game.pgsr'
+    replay.save(record(0, 300).recording(), path)
+    path.write_bytes(change(path.read_bytes()))
+    with pytest.raises(ValueError):
+        replay.load(path)
+
+
+def test_player_steers_tick_by_tick():
+    recorder = record(4, 500)
+    recording = recorder.recording()
+    game = replay.new_game(recording)
+    player = replay.Player(recording, game)
+    while (direction := player.steer()) is not None:
+        game.direction = direction
+        try:
+            game.update()
+        except GameOverException:
+            assert player.events()
+    assert game.snake == recorder.game.snake
+    assert game.score == recorder.game.score
+
+
+def test_autopilot_game_is_replayed():
+    recorder = replay.Recorder.new_game(6, 6, boundaries=True, seed=5)
+    pilot = autopilot.Autopilot(recorder.game)
+    for _ in range(300):
+        recorder.game.direction = pilot.steer()
+        recorder.tick()
+        try:
+            recorder.game.update()
+        except GameOverException:
+            break
+    assert recorder.game.score > 0
+    assert replay.verify(recorder.recording())
+
+
+def test_long_replay_is_fast():
+    recording = record(0, 100_000).recording()
+    start = time.perf_counter()
+    assert replay.verify(recording)
+    assert time.perf_counter() - start < 2
+
+
+def test_main(tmp_path, capsys):
+    good, bad = tmp_path / 'good.pgsr', tmp_path / 'bad.pgsr'
+    recording = record(0, 500).recording()
+    replay.save(recording, good)
+    replay.save(recording._replace(score=recording.score + 1), bad)
+    assert replay_cli.main([str(good)]) == 0
+    assert replay_cli.main([str(good), str(bad), str(tmp_path / 'missing.pgsr')]) == 1
+    output = capsys.readouterr().out
+    assert f'500 ticks, score {recording.score}, ok' in output
+    assert 'MISMATCH' in output
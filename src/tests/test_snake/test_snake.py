@@ -1,3 +1,5 @@
+import random
+
 import pytest
 
 from pygames import snake
@@ -225,3 +227,70 @@ def test_game_reset():
     game.reset_state()
     assert game.snake == [[width // 2, height // 2]]
     assert game.score == 0
+
+
+def test_body_and_occupancy_follow_the_snake():
+    game = snake.Snake(width=5, height=5)
+    game.fruit = [-1, -1]
+    game.snake = [[1, 1], [0, 1], [0, 0]]
+    assert list(game.body) == [(1, 1), (0, 1), (0, 0)]
+    game.update()
+    assert list(game.body) == [(2, 1), (1, 1), (0, 1)]
+    assert game.occupied(2, 1) and game.occupied(0, 1)
+    assert not game.occupied(0, 0)
+    assert not game.occupied(-1, 0) and not game.occupied(5, 0)
+
+
+def test_snake_is_a_copy():
+    game = snake.Snake(width=5, height=5)
+    game.snake[0][0] = 4
+    assert game.snake == [[2, 2]]
+
+
+def test_long_snake_moves():
+    game = snake.Snake(width=10_000, height=1)
+    game.fruit = [-1, -1]
+    game.snake = [[x, 0] for x in range(9998, -1, -1)]
+    game.update()
+    game.update()
+    assert list(game.body)[:2] == [(0, 0), (9999, 0)]
+    assert not game.occupied(1, 0)
+    assert len(game.body) == 9999
+
+
+def test_free_cells_follow_the_snake():
+    game = snake.Snake(width=3, height=3)
+    game.fruit = [-1, -1]
+    game.snake = [[1, 1], [0, 1]]
+    assert game.free_cells == 7
+    game._direction = snake.Direction.UP
+    game.update()
+    assert game.free_cells == 7
+    assert sorted(game._free) == [cell for cell in range(9) if cell not in (1, 4)]
+    assert all(game._free[game._free_position[cell]] == cell for cell in game._free)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_fruit_on_nearly_full_board(seed: int):
+    game = snake.Snake(width=10, height=10, rng=random.Random(seed))
+    game.snake = [[x, y] for y in range(10) for x in range(10) if (x, y) != (7, 3)]
+    game.fruit = [-1, -1]
+    game._set_fruit()
+    assert game.fruit == [7, 3]
+
+
+def test_no_place_for_fruit():
+    game = snake.Snake(width=2, height=1)
+    game.snake = [[0, 0], [1, 0]]
+    game.fruit = [-1, -1]
+    with pytest.raises(snake.GameOverException):
+        game._set_fruit()
+
+
+def test_injected_random_replays_the_fruit():
+    games = [snake.Snake(width=8, height=8, rng=random.Random(7)) for _ in range(2)]
+    for _ in range(20):
+        assert games[0].fruit == games[1].fruit
+        for game in games:
+            game.fruit = [-1, -1]
+            game._set_fruit()
@@ -0,0 +1,132 @@
+import random
+
+import pytest
+
+from pygames import animation
+from pygames.snake.snake import Snake, Direction
+from pygames.snake.ui import autopilot
+
+
+@pytest.mark.parametrize('height,width', [(2, 2), (4, 5), (5, 4), (6, 6), (3, 8)])
+def test_hamiltonian_cycle(height: int, width: int):
+    following = autopilot.hamiltonian_cycle(height, width)
+    assert following is not None
+    cell, seen = 0, set()
+    for _ in range(height * width):
+        seen.add(cell)
+        y, x = divmod(cell, width)
+        after_y, after_x = divmod(following[cell], width)
+        assert abs(x - after_x) + abs(y - after_y) == 1
+        cell = following[cell]
+    assert cell == 0
+    assert len(seen) == height * width
+
+
+@pytest.mark.parametrize('height,width', [(3, 3), (5, 7), (1, 4)])
+def test_no_hamiltonian_cycle(height: int, width: int):
+    assert autopilot.hamiltonian_cycle(height, width) is None
+
+
+def test_path_is_followed_without_planning_again():
+    game = Snake(height=10, width=10)
+    game.snake = [[1, 1]]
+    game.fruit = [6, 1]
+    pilot = autopilot.Autopilot(game)
+    for _ in range(5):
+        assert pilot.steer() == Direction.RIGHT
+        game.update()
+    assert game.score == 1
+    assert pilot.plans == 1
+
+
+def test_path_is_repaired_after_a_detour():
+    game = Snake(height=10, width=10)
+    game.snake = [[1, 1], [0, 1]]
+    game.fruit = [8, 1]
+    pilot = autopilot.Autopilot(game)
+    game.direction = pilot.steer()
+    game.update()
+    # the player takes over for a move
+    game.direction = Direction.DOWN
+    game.update()
+    game.direction = pilot.steer()
+    assert (pilot.plans, pilot.repairs) == (1, 1)
+    for _ in range(20):
+        game.update()
+        if game.score:
+            break
+        game.direction = pilot.steer()
+    assert game.score == 1
+    assert pilot.plans == 1
+
+
+def test_one_cell_snake_does_not_turn_back():
+    game = Snake(height=10, width=10, boundaries=True)
+    game.snake = [[5, 5]]
+    game.fruit = [2, 5]
+    pilot = autopilot.Autopilot(game)
+    assert pilot.steer() in (Direction.UP, Direction.DOWN)
+
+
+def test_tail_stays_reachable():
+    # the fruit is in a corner the snake could not leave again after eating
+    game = Snake(height=4, width=4, boundaries=True)
+    game.snake = [[1, 0], [1, 1], [0, 1], [0, 2]]
+    game.fruit = [0, 0]
+    pilot = autopilot.Autopilot(game)
+    assert pilot.steer() == Direction.RIGHT
+
+
+@pytest.mark.parametrize('boundaries', [False, True])
+@pytest.mark.parametrize('height,width', [(6, 6), (5, 5)])
+def test_plays_well(boundaries: bool, height: int, width: int):
+    report = autopilot.run(3, height, width, boundaries, seed=1)
+    assert report.average_score > height * width / 2
+    assert report.seconds_per_tick < autopilot.BUDGET
+
+
+def test_fills_a_small_board():
+    game = Snake(height=4, width=4, boundaries=True, rng=random.Random(0))
+    autopilot.play(game, autopilot.Autopilot(game))
+    assert game.score == 4 * 4 - 1
+
+
+def test_planning_on_a_terminal_board_searches_each_cell_once():
+    game = Snake(height=60, width=200)
+    game.snake = [[x, y] for y in range(30) for x in (range(200) if y % 2 else range(199, -1, -1))][::-1]
+    game.fruit = [150, 50]
+    pilot = autopilot.Autopilot(game, budget=float('inf'))
+    game.direction = pilot.steer()
+    assert pilot.plans == 1
+    # the path to the fruit and the check that the tail stays reachable after it
+    assert pilot.expansions <= 2 * 60 * 200
+    expansions = pilot.expansions
+    for _ in range(10):
+        game.update()
+        game.direction = pilot.steer()
+    # the kept path is followed without searching again
+    assert pilot.expansions == expansions
+
+
+def test_searches_stop_at_the_budget():
+    game = Snake(height=10, width=10)
+    game.snake = [[1, 1]]
+    game.fruit = [8, 8]
+    pilot = autopilot.Autopilot(game, budget=-1)
+    assert isinstance(pilot.steer(), Direction)
+    assert pilot.plans == 0
+
+
+def test_steers_animation_frames():
+    game = Snake(height=6, width=6, rng=random.Random(2))
+    frames = list(animation.snake_frames(game, 100, steer=autopilot.Autopilot(game)))
+    assert len(frames) == 101
+    assert game.score > 0
+
+
+def test_main(capsys):
+    autopilot.main(['-n', '2', '--height', '6', '--width', '6', '--max-ticks', '50'])
+    output = capsys.readouterr().out
+    assert 'games: 2' in output
+    assert 'ticks: 100' in output
+    assert 'planning ms/tick' in output
@@ -3,6 +3,7 @@ import copy
 import blessed
 import pytest
 
+from pygames.snake import replay
 from pygames.snake.snake import Snake, Direction
 from pygames.snake.ui import console
 
@@ -148,3 +149,36 @@ def test_process_direction_keys(
         controller.game._direction = initial_direction
         controller._process_key(key)
         assert controller.game.direction == expected_direction
+
+
+def test_keys_are_recorded(controller: console.TerminalController):
+    controller.recorder = replay.Recorder(controller.game, seed=0)
+    controller._process_key(console.BOUNDARIES_KEYS[0])
+    controller._process_key(console.RESTART_KEYS[0])
+    controller._process_key(console.DirectionKeys.DOWN[0])
+    assert controller.recorder.recording().runs == [(replay.TOGGLE_BOUNDARIES, 1), (replay.RESTART, 1)]
+
+
+def test_recording_steers(controller: console.TerminalController):
+    recording = replay.Recording(controller.game.height, controller.game.width, False, 0,
+                                 [(replay.DIRECTIONS.index(Direction.DOWN), 2)], 2, 0)
+    controller.player = replay.Player(recording, controller.game)
+    assert controller._steer()
+    assert controller.game.direction == Direction.DOWN
+    assert controller._steer()
+    assert not controller._steer()
+
+
+@pytest.mark.parametrize('argv', [
+    ['--record', 'a', '--replay', 'b'],
+    ['--speed', '0'],
+    ['--replay', 'a', '--autopilot'],
+])
+def test_conflicting_args(argv: list[str]):
+    with pytest.raises(SystemExit):
+        console.parse_args(argv)
+
+
+def test_publish_arg():
+    assert console.parse_args(['--publish', 'snake.sock']).publish == 'snake.sock'
+    assert console.parse_args([]).publish is None
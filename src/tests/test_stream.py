@@ -0,0 +1,288 @@
+import os
+import random
+import socket
+
+import pytest
+
+from pygames import animation, snake, stream
+from pygames.game_of_life import engines
+from pygames.game_of_life.history import History
+from pygames.game_of_life.ui import batch
+from tests.test_game_of_life.helpers import BOUNDED_ENGINES, random_state
+
+GLIDER = [[0, 1, 0, 0, 0, 0], [0, 0, 1, 0, 0, 0], [1, 1, 1, 0, 0, 0], [0] * 6, [0] * 6, [0] * 6]
+
+
+def receive(connection: socket.socket, viewer: stream.Viewer):
+    connection.setblocking(False)
+    while True:
+        try:
+            data = connection.recv(1 << 16)
+        except BlockingIOError:
+            return
+        if not data:
+            return
+        viewer.feed(data)
+
+
+@pytest.mark.parametrize('width', [1, 7, 8, 9, 30])
+def test_pack_row_round_trip(width: int):
+    row = bytes(random.Random(width).randrange(2) for _ in range(width))
+    packed = stream.pack_row(row)
+    assert len(packed) == -(-width // 8)
+    assert stream.unpack_row(packed, width) == row
+
+
+@pytest.mark.parametrize('values', [[0], [1, 127, 128, 300, 1 << 40]])
+def test_varints(values: list[int]):
+    output = bytearray()
+    for value in values:
+        stream.write_varint(output, value)
+    assert list(stream.read_varints(bytes(output))) == values
+
+
+@pytest.mark.parametrize('engine', sorted(engines.ENGINES))
+def test_life_viewer_follows_the_game(engine: str):
+    game = engines.create_game(engine, height=6, width=6)
+    game.state = GLIDER
+    viewer = stream.Viewer()
+    publisher_end, viewer_end = socket.socketpair()
+    with stream.Publisher(game) as publisher:
+        publisher.attach(publisher_end)
+        for _ in range(10):
+            publisher.publish()
+            receive(viewer_end, viewer)
+            assert [bytes(row) for row in viewer.cells] == [bytes(row) for row in game.region(0, 0, 6, 6)]
+            game.update()
+    assert viewer.tick == 10
+    assert viewer.keyframes == 1
+    viewer_end.close()
+
+
+def test_deltas_are_small():
+    game = engines.create_game('python', height=100, width=100)
+    game.state = [row[:3] + [0] * 97 for row in GLIDER[:3]] + [[0] * 100 for _ in range(97)]
+    viewer_end, publisher_end = socket.socketpair()
+    with stream.Publisher(game) as publisher:
+        publisher.attach(publisher_end)
+        publisher.publish()
+        keyframe = viewer_end.recv(1 << 16)
+        game.update()
+        publisher.publish()
+        delta = viewer_end.recv(1 << 16)
+    assert keyframe[0] == stream.LIFE_KEYFRAME and delta[0] == stream.LIFE_DELTA
+    # a glider flips 4 cells a generation
+    assert len(delta) == stream.HEADER.size + 4
+
+
+@pytest.mark.parametrize('engine', BOUNDED_ENGINES)
+def test_deltas_do_not_read_the_board(engine: str, monkeypatch):
+    game = engines.create_game(engine, height=20, width=20)
+    game.state = [row[:3] + [0] * 17 for row in GLIDER[:3]] + [[0] * 20 for _ in range(17)]
+    reads = []
+    life_frame = animation.life_frame
+
+    def read(*args):
+        reads.append(args)
+        return life_frame(*args)
+
+    monkeypatch.setattr(animation, 'life_frame', read)
+    viewer = stream.Viewer()
+    viewer_end, publisher_end = socket.socketpair()
+    with stream.Publisher(game) as publisher:
+        # nothing is read or gathered while nobody watches
+        for _ in range(3):
+            publisher.publish()
+            game.update()
+        publisher.attach(publisher_end)
+        for _ in range(10):
+            publisher.publish()
+            receive(viewer_end, viewer)
+            game.update()
+        publisher.publish()
+        receive(viewer_end, viewer)
+    assert len(reads) == viewer.keyframes == 1
+    assert [bytes(row) for row in viewer.cells] == [bytes(row) for row in game.region(0, 0, 20, 20)]
+    viewer_end.close()
+
+
+@pytest.mark.parametrize('engine', BOUNDED_ENGINES)
+def test_history_and_jumps_are_published(engine: str):
+    game = engines.create_game(engine, height=12, width=12)
+    game.state = [row[:3] + [0] * 9 for row in GLIDER[:3]] + [[0] * 12 for _ in range(9)]
+    game.history = History()
+    viewer = stream.Viewer()
+    viewer_end, publisher_end = socket.socketpair()
+    with stream.Publisher(game) as publisher:
+        publisher.attach(publisher_end)
+        publisher.publish()
+        # the history restores flipped cells too, only a new board cannot be told as flips
+        for move in (game.update, game.update, game.update, game.step_back, game.step_back, lambda: game.seek(0),
+                     lambda: setattr(game, 'state', random_state(12, 12))):
+            move()
+            publisher.publish()
+            receive(viewer_end, viewer)
+            assert [bytes(row) for row in viewer.cells] == [bytes(row) for row in game.region(0, 0, 12, 12)]
+    assert viewer.keyframes == 2
+    viewer_end.close()
+
+
+def test_busy_boards_are_sent_as_keyframes():
+    game = engines.create_game('python', height=8, width=8)
+    game.state = [[1] * 8 for _ in range(8)]
+    viewer = stream.Viewer()
+    viewer_end, publisher_end = socket.socketpair()
+    with stream.Publisher(game) as publisher:
+        publisher.attach(publisher_end)
+        publisher.publish()
+        game.update()
+        publisher.publish()
+        receive(viewer_end, viewer)
+    assert viewer.keyframes == 2
+    assert [bytes(row) for row in viewer.cells] == [bytes(8)] * 8
+
+
+def test_snake_viewer_follows_the_game():
+    game = snake.Snake(height=30, width=30, rng=random.Random(1))
+    viewer = stream.Viewer()
+    viewer_end, publisher_end = socket.socketpair()
+    with stream.Publisher(game) as publisher:
+        publisher.attach(publisher_end)
+        for step in range(30):
+            publisher.publish()
+            receive(viewer_end, viewer)
+            assert list(viewer.snake) == [tuple(cell) for cell in game.snake]
+            assert viewer.fruit == tuple(game.fruit) and viewer.score == game.score
+            game.fruit = [(game.snake[0][0] + 1) % 30, game.snake[0][1]] if step % 3 == 0 else game.fruit
+            game.update()
+        assert game.score > 0
+        game.reset_state()
+        publisher.publish()
+        receive(viewer_end, viewer)
+    assert list(viewer.snake) == [tuple(cell) for cell in game.snake]
+    assert viewer.keyframes == 2
+
+
+def test_snake_deltas_are_fixed_size():
+    game = snake.Snake(height=10, width=10)
+    game.fruit = [0, 0]
+    viewer_end, publisher_end = socket.socketpair()
+    with stream.Publisher(game) as publisher:
+        publisher.attach(publisher_end)
+        publisher.publish()
+        viewer_end.recv(1 << 16)
+        game.update()
+        publisher.publish()
+        assert len(viewer_end.recv(1 << 16)) == stream.HEADER.size + stream.SNAKE_STEP.size
+
+
+def test_unix_socket_viewers_get_a_keyframe_on_connect(tmp_path):
+    game = engines.create_game('python', height=6, width=6)
+    game.state = GLIDER
+    path = tmp_path / 'life.sock'
+    with stream.Publisher(game) as publisher:
+        publisher.listen(path)
+        publisher.publish()
+        assert publisher.consumers == 0
+        game.update()
+        viewers = []
+        for generation in range(3):
+            connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            connection.connect(str(path))
+            viewers.append((connection, stream.Viewer()))
+            publisher.publish()
+            for viewer_connection, viewer in viewers:
+                receive(viewer_connection, viewer)
+                assert [bytes(row) for row in viewer.cells] == [bytes(row) for row in game.region(0, 0, 6, 6)]
+                assert viewer.keyframes == 1
+            assert publisher.consumers == generation + 1
+            game.update()
+        viewers[0][0].close()
+        publisher.publish()
+        assert publisher.consumers == 2
+        for connection, _ in viewers:
+            connection.close()
+    assert not path.exists()
+
+
+def test_slow_viewers_never_block_the_game():
+    game = engines.create_game('python', height=64, width=64)
+    viewer_end, publisher_end = socket.socketpair()
+    publisher_end.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+    viewer = stream.Viewer()
+    with stream.Publisher(game, max_backlog=2048) as publisher:
+        publisher.attach(publisher_end)
+        for _ in range(200):
+            game.state = [[random.randrange(2) for _ in range(64)] for _ in range(64)]
+            publisher.publish()
+        assert publisher.dropped > 0
+        # once the viewer reads again it catches up with a keyframe
+        for _ in range(50):
+            receive(viewer_end, viewer)
+            publisher.flush()
+        publisher.publish()
+        for _ in range(50):
+            receive(viewer_end, viewer)
+            publisher.flush()
+    assert viewer.tick == publisher.tick
+    assert [bytes(row) for row in viewer.cells] == [bytes(row) for row in game.region(0, 0, 64, 64)]
+
+
+def test_pipe_viewer():
+    game = engines.create_game('python', height=6, width=6)
+    game.state = GLIDER
+    read_fd, write_fd = os.pipe()
+    viewer = stream.Viewer()
+    with stream.Publisher(game) as publisher:
+        publisher.attach(write_fd)
+        for _ in range(4):
+            game.update()
+            publisher.publish()
+    os.close(write_fd)
+    with os.fdopen(read_fd, 'rb') as pipe:
+        assert viewer.feed(pipe.read()) == 4
+    assert [bytes(row) for row in viewer.cells] == [bytes(row) for row in game.region(0, 0, 6, 6)]
+
+
+def test_closed_pipe_drops_the_viewer():
+    game = engines.create_game('python', height=6, width=6)
+    read_fd, write_fd = os.pipe()
+    os.close(read_fd)
+    with stream.Publisher(game) as publisher:
+        publisher.attach(write_fd)
+        publisher.publish()
+        assert publisher.consumers == 0
+    os.close(write_fd)
+
+
+def test_viewer_reads_split_messages():
+    game = engines.create_game('python', height=6, width=6)
+    game.state = GLIDER
+    viewer_end, publisher_end = socket.socketpair()
+    with stream.Publisher(game) as publisher:
+        publisher.attach(publisher_end)
+        publisher.publish()
+        game.update()
+        publisher.publish()
+        data = viewer_end.recv(1 << 16)
+    viewer = stream.Viewer()
+    assert sum(viewer.feed(data[index:index + 3]) for index in range(0, len(data), 3)) == 2
+    assert [bytes(row) for row in viewer.cells] == [bytes(row) for row in game.region(0, 0, 6, 6)]
+
+
+@pytest.mark.parametrize('message', [
+    stream.HEADER.pack(stream.LIFE_DELTA, 1, 0),
+    stream.HEADER.pack(stream.SNAKE_DELTA, 1, 0),
+    stream.HEADER.pack(99, 1, 0),
+])
+def test_viewer_rejects_bad_streams(message: bytes):
+    with pytest.raises(ValueError):
+        stream.Viewer().feed(message)
+
+
+def test_batch_publish(tmp_path, capsys):
+    path = tmp_path / 'life.sock'
+    batch.main(['--height', '8', '--width', '8', '-n', '5', '--seed', '1', '--engine', 'python',
+                '--publish', str(path)])
+    assert 'generations: 5' in capsys.readouterr().out
+    assert not path.exists()